@@ -4,9 +4,15 @@ Global exceptions for the PhantomBuster SDK.
 
 class PhantomBusterAPIError(Exception):
     """Base exception for all PhantomBuster API errors."""
-    def __init__(self, message: str, status_code: int | None = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ):
         super().__init__(message)
         self.status_code = status_code
+        self.retry_after = retry_after
 
 class AuthenticationError(PhantomBusterAPIError):
     """Raised for 401 authentication errors."""
@@ -23,3 +29,15 @@ class RateLimitError(PhantomBusterAPIError):
 class ServerError(PhantomBusterAPIError):
     """Raised for 5xx server errors."""
     pass
+
+class TransportError(PhantomBusterAPIError):
+    """Raised when a request fails before a response is received."""
+    pass
+
+class CircuitOpenError(PhantomBusterAPIError):
+    """Raised without sending a request when the endpoint's circuit breaker is open."""
+    pass
+
+class DeadlineExceededError(PhantomBusterAPIError):
+    """Raised when a call is still running at its deadline."""
+    pass
@@ -1,9 +1,13 @@
+import asyncio
+
 import pytest
 import respx
 from httpx import Response
 
 from ..client import PhantombusterClient
-from ..config import PhantombusterConfig
+from ..config import PhantombusterConfig, WatcherConfig
+from ..mock_server import MockPhantomBuster, MockServerConfig
+from ..__global_exceptions__ import DeadlineExceededError
 from ..__global_models__ import AgentListResponse, LaunchAgentRequest, SaveAgentRequest, Agent
 
 
@@ -70,3 +74,43 @@ async def test_save_agent(client):
     assert response.name == "Updated Agent"
 
     await client.close()
+
+
+@pytest.mark.asyncio
+async def test_launch_and_wait_shares_one_poller():
+    """Tests that concurrent launch-and-wait calls share the client's watcher."""
+    mock = MockPhantomBuster(MockServerConfig(slots=10, container_duration=0.05))
+    client = PhantombusterClient.create(
+        PhantombusterConfig(
+            api_key="test_api_key",
+            coalesce_gets=False,
+            watcher=WatcherConfig(min_interval=0.02, max_interval=0.04),
+        ),
+        transport=mock,
+    )
+
+    containers = await asyncio.gather(*(client.agents.launch_and_wait(i) for i in range(10)))
+
+    assert {c.status for c in containers} == {"finished"}
+    assert mock.requests["v2:/orgs/fetch-running-containers"] == client.watcher.ticks <= 6
+    result = await client.agents.launch_and_fetch_result(1, timeout=5)
+    records = [record async for record in client.agents.launch_and_stream_result(2)]
+    assert len(records) == len(result) == mock.config.result_size
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_launch_and_wait_deadline():
+    """Tests that launch-and-wait gives up at its deadline without stopping the poller."""
+    mock = MockPhantomBuster(MockServerConfig(container_duration=0.2))
+    client = PhantombusterClient.create(
+        PhantombusterConfig(
+            api_key="test_api_key", watcher=WatcherConfig(min_interval=0.02, max_interval=0.02)
+        ),
+        transport=mock,
+    )
+
+    with pytest.raises(DeadlineExceededError):
+        await client.agents.launch_and_wait(1, timeout=0.05)
+    assert (await client.agents.launch_and_wait(2, timeout=1)).status == "finished"
+    await client.close()
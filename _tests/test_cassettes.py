@@ -0,0 +1,162 @@
+import math
+
+import pytest
+
+from ..cassettes import (
+    CassetteRecorder,
+    Interaction,
+    ReplayTransport,
+    anonymize,
+    anonymize_path,
+    load,
+    replay,
+)
+from ..client import PhantombusterClient
+from ..config import CircuitBreakerConfig, PhantombusterConfig, RetryConfig
+from ..mock_server import MockPhantomBuster, MockServerConfig
+from ..__global_exceptions__ import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    NotFoundError,
+    TransportError,
+)
+
+
+@pytest.fixture
+def config():
+    """Provides a mock PhantombusterConfig without retries."""
+    return PhantombusterConfig(api_key="test_api_key", retry=RetryConfig(max_attempts=1))
+
+
+def test_anonymize_keeps_shape():
+    """Tests that anonymizing replaces strings but keeps keys, numbers and sizes."""
+    value = {"name": "Jane Doe", "id": 7, "tags": ["a", "bc"], "ok": True, "none": None}
+    assert anonymize(value) == {
+        "name": "xxxxxxxx", "id": 7, "tags": ["x", "xx"], "ok": True, "none": None
+    }
+
+
+def test_anonymize_path_keeps_the_route():
+    """Tests that IDs, names and query values are replaced in paths, but not routes."""
+    assert anonymize_path("/agent/4242") == "/agent/0000"
+    assert anonymize_path("/agents/by-name/Acme/scraper") == "/agents/by-name/xxxx/xxxxxxx"
+    assert anonymize_path("/containers/fetch?id=77&mode=full") == (
+        "/containers/fetch?id=00&mode=xxxx"
+    )
+    assert anonymize_path("/agents/fetch-all") == "/agents/fetch-all"
+
+
+@pytest.mark.asyncio
+async def test_recorded_paths_are_anonymized(config, tmp_path):
+    """Tests that IDs in recorded paths do not leak and the paths still replay."""
+    path = str(tmp_path / "traffic.jsonl")
+    client = PhantombusterClient.create(config, transport=MockPhantomBuster())
+    with CassetteRecorder(path) as recorder:
+        recorder.attach(client)
+        await client._request("GET", "/containers/fetch?id=31337")
+    await client.close()
+
+    interactions = load(path)
+    assert interactions[0].path == "/containers/fetch?id=00000"
+    client = PhantombusterClient.create(config, transport=ReplayTransport(interactions))
+    assert (await replay(client, interactions, speed=math.inf))["errors"] == 0
+    # Unrecorded anonymized requests fall through to the mock API, which answers them.
+    assert (await client._request("GET", anonymize_path("/containers/fetch?id=42"))).json()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_record_then_load(config, tmp_path):
+    """Tests that calls are recorded with sizes and anonymized bodies."""
+    path = str(tmp_path / "traffic.jsonl.gz")
+    client = PhantombusterClient.create(
+        config, transport=MockPhantomBuster(MockServerConfig(list_size=3))
+    )
+    with CassetteRecorder(path) as recorder:
+        recorder.attach(client)
+        await client.agents.fetch_all()
+        await client.org_storage.save_lead(1, {"firstName": "Jane"})
+        with pytest.raises(NotFoundError):
+            await client._request("GET", "/nowhere")
+        recorder.detach(client)
+        await client.agents.fetch_all()
+
+    interactions = load(path)
+    assert [(i.method, i.path, i.status) for i in interactions] == [
+        ("GET", "/agents/fetch-all", 200),
+        ("POST", "/org-storage/leads/save", 200),
+        ("GET", "/nowhere", 404),
+    ]
+    assert len(interactions[0].response["agents"]) == 3
+    assert interactions[0].response["agents"][0]["name"].strip("x") == ""
+    assert interactions[1].request_bytes > 0
+    assert interactions[2].error == "NotFoundError"
+    assert interactions[0].offset <= interactions[1].offset <= interactions[2].offset
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_replay_serves_recorded_responses(config):
+    """Tests that replayed requests get their recorded answers, in order."""
+    interactions = [
+        Interaction(0.0, "GET", "/containers/fetch?id=1", status=200, response={"id": 1}),
+        Interaction(0.0, "GET", "/containers/fetch?id=1", status=200, response={"id": 2}),
+        Interaction(0.0, "GET", "/location/ip", status=None, error="TransportError"),
+    ]
+    client = PhantombusterClient.create(
+        config.model_copy(update={"coalesce_gets": False}),
+        transport=ReplayTransport(interactions),
+    )
+    assert (await client.containers.fetch("1")).id == 1
+    assert (await client.containers.fetch("1")).id == 2
+    assert (await client.containers.fetch("1")).id == 2
+    with pytest.raises(TransportError):
+        await client.location.get_ip()
+    assert (await client.containers.fetch("5")).id == 5
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_replay_raises_recorded_client_errors():
+    """Tests that errors the client raised itself are replayed as themselves."""
+    interactions = [
+        Interaction(0.0, "GET", "/location/ip", status=None, error="CircuitOpenError"),
+        Interaction(0.0, "GET", "/agents/fetch-all", status=None, error="DeadlineExceededError"),
+    ]
+    transport = ReplayTransport(interactions)
+    client = PhantombusterClient.create(
+        PhantombusterConfig(
+            api_key="test_api_key",
+            retry=RetryConfig(max_attempts=3, base_delay=0, max_delay=0),
+            circuit_breaker=CircuitBreakerConfig(failure_threshold=1),
+        ),
+        transport=transport,
+    )
+
+    with pytest.raises(CircuitOpenError):
+        await client.location.get_ip()
+    with pytest.raises(DeadlineExceededError):
+        await client.agents.fetch_all()
+    assert set(client._breaker.states().values()) <= {"closed"}
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_replay_follows_the_schedule(config):
+    """Tests that replay starts calls at their offsets divided by the speed."""
+    interactions = [
+        Interaction(i * 0.1, "GET", f"/containers/fetch?id={i}", status=200, response={"id": i})
+        for i in range(4)
+    ] + [Interaction(0.3, "GET", "/nowhere", status=404, response={"error": "x"})]
+    client = PhantombusterClient.create(config, transport=ReplayTransport(interactions))
+
+    report = await replay(client, interactions, speed=2.0)
+    assert report["requests"] == 5
+    assert report["errors"] == 1
+    assert 0.15 <= report["seconds"] < 0.5
+
+    report = await replay(client, interactions, speed=math.inf)
+    assert report["seconds"] < 0.1
+    with pytest.raises(ValueError):
+        await replay(client, interactions, speed=0)
+    await client.close()
@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+import respx
+from httpx import Response
+
+from ..circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from ..client import PhantombusterClient
+from ..config import CircuitBreakerConfig, PhantombusterConfig, RetryConfig
+from ..response_cache import route_key
+from ..__global_exceptions__ import CircuitOpenError, NotFoundError, ServerError
+
+
+@pytest.fixture
+def config():
+    """Provides a mock PhantombusterConfig with a sensitive breaker and no retries."""
+    return PhantombusterConfig(
+        api_key="test_api_key",
+        retry=RetryConfig(max_attempts=1),
+        circuit_breaker=CircuitBreakerConfig(failure_threshold=2, reset_timeout=0.05),
+    )
+
+
+@pytest.fixture
+def client(config):
+    """Provides an independent PhantombusterClient instance."""
+    return PhantombusterClient.create(config)
+
+
+def test_circuit_opens_after_consecutive_failures():
+    """Tests that only consecutive failures open a circuit."""
+    breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=2))
+    breaker.failure("v2:/ai/completions", breaker.before("v2:/ai/completions"))
+    breaker.success("v2:/ai/completions", breaker.before("v2:/ai/completions"))
+    breaker.failure("v2:/ai/completions", breaker.before("v2:/ai/completions"))
+    assert breaker.state("v2:/ai/completions") == CLOSED
+
+    breaker.failure("v2:/ai/completions", breaker.before("v2:/ai/completions"))
+
+    assert breaker.state("v2:/ai/completions") == OPEN
+    with pytest.raises(CircuitOpenError) as info:
+        breaker.before("v2:/ai/completions")
+    assert 0 < info.value.retry_after <= 30
+    assert breaker.state("v2:/agents/fetch") == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_half_open_admits_one_probe():
+    """Tests that a half-open circuit lets one probe through and closes on success."""
+    breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=1, reset_timeout=0.01))
+    breaker.failure("key", breaker.before("key"))
+    await asyncio.sleep(0.02)
+    assert breaker.state("key") == HALF_OPEN
+
+    probe = breaker.before("key")
+    assert probe
+    with pytest.raises(CircuitOpenError):
+        breaker.before("key")
+    breaker.success("key", probe)
+
+    assert breaker.state("key") == CLOSED
+    assert breaker.before("key") is False
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_reopens_circuit():
+    """Tests that a failing probe opens the circuit again."""
+    breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=1, reset_timeout=0.01))
+    breaker.failure("key", breaker.before("key"))
+    await asyncio.sleep(0.02)
+
+    breaker.failure("key", breaker.before("key"))
+
+    assert breaker.state("key") == OPEN
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_failing_endpoint_fails_fast(client):
+    """Tests that an open endpoint fails without a request while others still work."""
+    failing = respx.post(f"{client._base_url_v2}/ai/completions").mock(
+        return_value=Response(503, text="down")
+    )
+    healthy = respx.get(f"{client._base_url_v2}/agents/fetch-all").mock(
+        return_value=Response(200, json={"agents": []})
+    )
+
+    for _ in range(2):
+        with pytest.raises(ServerError):
+            await client._request("POST", "/ai/completions", json={})
+    with pytest.raises(CircuitOpenError):
+        await client._request("POST", "/ai/completions", json={})
+
+    assert failing.call_count == 2
+    await client._request("GET", "/agents/fetch-all")
+    assert healthy.called
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_client_errors_do_not_open_circuit(client):
+    """Tests that 4xx responses count as a healthy endpoint."""
+    respx.get(f"{client._base_url_v2}/agents/fetch?id=1").mock(
+        return_value=Response(404, text="missing")
+    )
+
+    for _ in range(3):
+        with pytest.raises(NotFoundError):
+            await client._request("GET", "/agents/fetch", params={"id": "1"})
+
+    assert client._breaker.state("v2:/agents/fetch") == CLOSED
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_circuits_are_keyed_by_route(client):
+    """Tests that failures on different IDs of one route share a circuit."""
+    respx.get(url__regex=r".*/api/v1/agent/\d+").mock(return_value=Response(503, text="down"))
+
+    for agent_id in (1, 2):
+        with pytest.raises(ServerError):
+            await client._request("GET", f"/agent/{agent_id}", api_version="v1")
+    with pytest.raises(CircuitOpenError):
+        await client._request("GET", "/agent/3", api_version="v1")
+
+    assert client._breaker.states() == {"v1:/agent/{id}": OPEN}
+    assert route_key("/script/by-name/legacy/My Script", "v1") == "v1:/script/by-name/{name}/{name}"
+    assert route_key("/containers/fetch?id=5") == "v2:/containers/fetch"
+    await client.close()
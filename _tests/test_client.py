@@ -1,9 +1,14 @@
+import os
+import subprocess
+import sys
+
 import pytest
 import respx
 from httpx import Response
 
+from ..api.agents import AgentsAPI
 from ..client import PhantombusterClient
-from ..config import PhantombusterConfig
+from ..config import PhantombusterConfig, TransportConfig
 
 
 @pytest.fixture
@@ -48,3 +53,57 @@ async def test_request_v1_and_v2(config):
     assert v2_route.called
 
     await client.close()
+
+
+def test_transport_config_is_applied():
+    """Tests that pool limits and per-phase timeouts reach the httpx client."""
+    config = PhantombusterConfig(
+        api_key="test_api_key",
+        transport=TransportConfig(
+            max_connections=8,
+            max_keepalive_connections=4,
+            keepalive_expiry=60.0,
+            connect_timeout=1.0,
+            read_timeout=5.0,
+        ),
+    )
+    client = PhantombusterClient.create(config)
+
+    timeout = client._client.timeout
+    assert (timeout.connect, timeout.read, timeout.write) == (1.0, 5.0, 30.0)
+    pool = client._client._transport._pool
+    assert pool._max_connections == 8
+    assert pool._max_keepalive_connections == 4
+    assert pool._keepalive_expiry == 60.0
+
+
+def test_api_modules_are_not_imported_with_the_client():
+    """Tests that importing the client and building one loads no API module."""
+    package = PhantombusterClient.__module__.rpartition(".")[0]
+    script = (
+        f"import sys\n"
+        f"from {package}.client import PhantombusterClient\n"
+        f"from {package}.config import PhantombusterConfig\n"
+        f"PhantombusterClient.create(PhantombusterConfig(api_key='key'))\n"
+        f"print(sorted(name for name in sys.modules if name.startswith('{package}.api')))\n"
+        f"print('{package}.__global_models__' in sys.modules)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True,
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+    ).stdout.split("\n")
+    assert output[0] == "[]"
+    assert output[1] == "False"
+
+
+def test_api_namespace_is_built_once_on_first_access(config):
+    """Tests that an API namespace is built on first access and then reused."""
+    client = PhantombusterClient.create(config)
+    assert "agents" not in vars(client)
+
+    agents = client.agents
+
+    assert isinstance(agents, AgentsAPI)
+    assert agents._client is client
+    assert client.agents is agents
+    assert PhantombusterClient.create(config).agents is not agents
@@ -0,0 +1,67 @@
+import pytest
+import respx
+from httpx import Response
+
+from ..client import PhantombusterClient
+from ..client_pool import PhantombusterClientPool
+from ..config import PhantombusterConfig
+
+
+@pytest.fixture
+def configs():
+    """Provides one mock PhantombusterConfig per org."""
+    return {
+        "acme": PhantombusterConfig(api_key="acme_key"),
+        "globex": PhantombusterConfig(api_key="globex_key"),
+    }
+
+
+def test_create_is_independent(configs):
+    """Tests that create() builds clients outside the singleton."""
+    first = PhantombusterClient.create(configs["acme"])
+    second = PhantombusterClient.create(configs["globex"])
+    assert first is not second
+    assert first._limiter is not second._limiter
+    assert first is not PhantombusterClient._instance
+
+
+def test_pool_routes_by_org(configs):
+    """Tests that org-scoped work goes to the org's own key."""
+    pool = PhantombusterClientPool(configs)
+    assert pool.client("acme").config.api_key == "acme_key"
+    assert pool.client("globex").config.api_key == "globex_key"
+    with pytest.raises(KeyError):
+        pool.client("initech")
+
+
+def test_round_robin(configs):
+    """Tests that round-robin routing alternates between keys."""
+    pool = PhantombusterClientPool(configs, strategy="round_robin")
+    keys = [pool.pick().config.api_key for _ in range(4)]
+    assert keys == ["acme_key", "globex_key", "acme_key", "globex_key"]
+
+
+@pytest.mark.asyncio
+async def test_least_loaded_prefers_spare_capacity(configs):
+    """Tests that least-loaded routing avoids a key whose quota is used up."""
+    pool = PhantombusterClientPool(configs)
+    pool.client("acme")._limiter._bucket("v2:location").tokens = 0
+    for _ in range(3):
+        assert pool.pick("/location/ip").config.api_key == "globex_key"
+    await pool.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_pool_sends_each_key(configs):
+    """Tests that each pooled client authenticates with its own key."""
+    route = respx.get("https://api.phantombuster.com/api/v2/location/ip").mock(
+        return_value=Response(200, json={})
+    )
+
+    async with PhantombusterClientPool(configs) as pool:
+        for client in pool:
+            await client._request("GET", "/location/ip")
+
+    sent = {call.request.headers["X-Phantombuster-Key-1"] for call in route.calls}
+    assert sent == {"acme_key", "globex_key"}
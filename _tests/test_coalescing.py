@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+import respx
+from httpx import Response
+
+from ..client import PhantombusterClient
+from ..coalescing import SingleFlight, coalescing_key
+from ..config import PhantombusterConfig
+from ..deadlines import deadline
+from ..__global_exceptions__ import DeadlineExceededError, NotFoundError
+
+
+@pytest.fixture
+def config():
+    """Provides a mock PhantombusterConfig."""
+    return PhantombusterConfig(api_key="test_api_key")
+
+
+@pytest.fixture
+def client(config):
+    """Provides an independent PhantombusterClient instance."""
+    return PhantombusterClient.create(config)
+
+
+def test_coalescing_key():
+    """Tests that only body-less GET requests are coalesced."""
+    assert coalescing_key("get", "/agents/fetch-all", "v2", {}) is not None
+    assert coalescing_key("GET", "/brightdata/serp", "v2", {"params": {"q": "a"}}) != (
+        coalescing_key("GET", "/brightdata/serp", "v2", {"params": {"q": "b"}})
+    )
+    assert coalescing_key("POST", "/agents/launch", "v2", {"json": {"id": 1}}) is None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others():
+    """Tests that one waiter going away leaves the shared call running."""
+    flight = SingleFlight()
+
+    async def call():
+        await asyncio.sleep(0.01)
+        return "done"
+
+    first = asyncio.create_task(flight.do("key", call))
+    second = asyncio.create_task(flight.do("key", call))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "done"
+    assert flight.in_flight == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_concurrent_gets_share_one_call(client):
+    """Tests that concurrent identical GETs make a single upstream request."""
+    route = respx.get(f"{client._base_url_v2}/scripts/fetch?id=1").mock(
+        return_value=Response(200, json={"id": "1"})
+    )
+
+    responses = await asyncio.gather(
+        *(client._request("GET", "/scripts/fetch?id=1") for _ in range(5))
+    )
+
+    assert route.call_count == 1
+    assert all(response.json() == {"id": "1"} for response in responses)
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_errors_are_shared(client):
+    """Tests that every coalesced caller sees the upstream error."""
+    route = respx.get(f"{client._base_url_v2}/scripts/fetch?id=2").mock(
+        return_value=Response(404)
+    )
+
+    results = await asyncio.gather(
+        *(client._request("GET", "/scripts/fetch?id=2") for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert route.call_count == 1
+    assert all(isinstance(result, NotFoundError) for result in results)
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_first_caller_deadline_does_not_bound_the_call(client):
+    """Tests that a coalesced call outlives the deadline of the caller that started it."""
+    route = respx.get(f"{client._base_url_v2}/scripts/fetch?id=3").mock(
+        side_effect=[
+            Response(503, headers={"Retry-After": "1"}, text="busy"),
+            Response(200, json={"id": "3"}),
+        ]
+    )
+
+    async def hurried():
+        with deadline(0.5):
+            return await client._request("GET", "/scripts/fetch?id=3")
+
+    first = asyncio.ensure_future(hurried())
+    await asyncio.sleep(0)
+    patient = await client._request("GET", "/scripts/fetch?id=3")
+
+    with pytest.raises(DeadlineExceededError):
+        await first
+    assert patient.json() == {"id": "3"}
+    assert route.call_count == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_later_caller_extends_a_call_timeout_bounded_call():
+    """Tests that a caller joining later pushes back the deadline retries are checked
+    against, even when ``call_timeout`` bounds the coalesced call."""
+    client = PhantombusterClient.create(
+        PhantombusterConfig(api_key="test_api_key", call_timeout=10.0)
+    )
+    replies = [
+        Response(503, headers={"Retry-After": "0.5"}, text="busy"),
+        Response(200, json={"id": "4"}),
+    ]
+
+    async def slow(request):
+        await asyncio.sleep(0.1)
+        return replies.pop(0)
+
+    route = respx.get(f"{client._base_url_v2}/scripts/fetch?id=4").mock(side_effect=slow)
+
+    async def call(seconds):
+        with deadline(seconds):
+            return await client._request("GET", "/scripts/fetch?id=4")
+
+    hurried = asyncio.ensure_future(call(0.4))
+    await asyncio.sleep(0.05)
+    patient = await call(3.0)
+
+    with pytest.raises(DeadlineExceededError):
+        await hurried
+    assert patient.json() == {"id": "4"}
+    assert route.call_count == 2
+    await client.close()
@@ -0,0 +1,107 @@
+from array import array
+
+import pytest
+import respx
+from httpx import Response
+
+from ..client import PhantombusterClient
+from ..compact import ContainerTable, LeadTable
+from ..config import PhantombusterConfig
+from ..__global_models__ import Container, Lead
+
+
+@pytest.fixture
+def config():
+    """Provides a mock PhantombusterConfig."""
+    return PhantombusterConfig(api_key="test_api_key")
+
+
+@pytest.fixture
+def client(config):
+    """Provides an independent PhantombusterClient instance."""
+    return PhantombusterClient.create(config)
+
+
+def test_lead_table_round_trip():
+    """Tests that rows read back exactly what was stored, gaps included."""
+    items = [
+        {"id": 1, "data": {"name": "Ada", "score": 10}},
+        {"id": 2, "data": {"score": 12, "ratio": 0.5}},
+        {"id": 3, "data": {"name": "Grace", "flag": True}},
+    ]
+    table = LeadTable(items)
+
+    assert len(table) == 3
+    assert [row.to_model() for row in table] == [Lead.model_validate(item) for item in items]
+    assert table[1]["score"] == 12
+    assert table[1].get("name") is None
+    with pytest.raises(KeyError):
+        table[0]["ratio"]
+
+
+def test_lead_table_uses_typed_columns():
+    """Tests that numeric data keys are stored in typed arrays."""
+    table = LeadTable({"id": index, "data": {"score": index, "ratio": index / 2}} for index in range(4))
+
+    assert table.column("id") == array("q", [0, 1, 2, 3])
+    assert table.data_column("score").typecode == "q"
+    assert table.data_column("ratio").typecode == "d"
+
+
+def test_mixed_column_falls_back_to_list():
+    """Tests that a column with mixed types keeps every value."""
+    table = LeadTable([
+        {"id": 1, "data": {"value": 1}},
+        {"id": 2, "data": {}},
+        {"id": 3, "data": {"value": "one"}},
+    ])
+
+    assert table.data_column("value") == [1, None, "one"]
+    assert table[0]["value"] == 1
+    assert "value" not in table[1].data
+
+
+def test_container_table_rows():
+    """Tests attribute access on container rows."""
+    table = ContainerTable([{"id": 1, "agent_id": 4, "status": "running"}, {"id": 2}])
+
+    assert table[0].status == "running"
+    assert table[-1].agent_id is None
+    assert table[1].to_model() == Container(id=2)
+    with pytest.raises(AttributeError):
+        table[0].unknown
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fetch_leads_by_list_compact(client):
+    """Tests fetching leads as a compact table."""
+    respx.post(f"{client._base_url_v2}/org-storage/leads/by-list/5").mock(
+        return_value=Response(200, json={"leads": [{"id": 1, "data": {"a": 1}}]})
+    )
+
+    leads = await client.org_storage.fetch_leads_by_list(5, compact=True)
+
+    assert isinstance(leads, LeadTable)
+    assert leads[0].data == {"a": 1}
+    with pytest.raises(ValueError):
+        await client.org_storage.fetch_leads_by_list(5, lazy=True, compact=True)
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fetch_all_containers_compact_streams_the_body(client):
+    """Tests that a compact table is filled from the items of a streamed response."""
+    containers = [{"id": i, "status": "finished"} for i in range(3)]
+    body = {"total": 3, "containers": containers, "next": {"cursor": None}}
+    respx.get(f"{client._base_url_v2}/containers/fetch-all?agentId=7").mock(
+        return_value=Response(200, json=body)
+    )
+
+    table = await client.containers.fetch_all("7", compact=True)
+
+    assert isinstance(table, ContainerTable)
+    assert list(table.column("id")) == [0, 1, 2]
+    assert table[2].status == "finished"
+    await client.close()
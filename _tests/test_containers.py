@@ -1,9 +1,12 @@
+import asyncio
+
 import pytest
 import respx
 from httpx import Response
 
 from ..client import PhantombusterClient
 from ..config import PhantombusterConfig
+from ..mock_server import MockPhantomBuster, MockServerConfig
 from ..__global_models__ import ContainerListResponse, Container
 
 
@@ -61,3 +64,80 @@ async def test_fetch_result_object(client):
     assert response["result"] == "some data"
 
     await client.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_all_pages_with_prefetch():
+    """Tests that iter_all pages through the history and prefetches the next page."""
+    mock = MockPhantomBuster(MockServerConfig(list_size=250))
+    client = PhantombusterClient.create(PhantombusterConfig(api_key="test_api_key"), transport=mock)
+
+    ids = [container.id async for container in client.containers.iter_all("7", page_size=100)]
+
+    assert ids == sorted(ids, reverse=True)
+    assert len(set(ids)) == 250
+    assert mock.requests["v2:/containers/fetch-all"] == 3
+
+    iterator = client.containers.iter_all("7", page_size=100)
+    first = await anext(iterator)
+    await asyncio.sleep(0.05)
+    assert mock.requests["v2:/containers/fetch-all"] == 5
+    await iterator.aclose()
+    assert first.id == ids[0]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_all_stops_early_without_prefetch():
+    """Tests that stopping early without prefetch skips the remaining pages."""
+    mock = MockPhantomBuster(MockServerConfig(list_size=1000))
+    client = PhantombusterClient.create(PhantombusterConfig(api_key="test_api_key"), transport=mock)
+
+    seen = []
+    async for container in client.containers.iter_all("7", page_size=10, prefetch=False):
+        seen.append(container)
+        if len(seen) == 15:
+            break
+
+    assert mock.requests["v2:/containers/fetch-all"] == 2
+    with pytest.raises(ValueError):
+        await anext(client.containers.iter_all("7", page_size=0))
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_iter_all_without_server_paging():
+    """Tests that a response with the whole history is iterated once."""
+    client = PhantombusterClient.create(PhantombusterConfig(api_key="test_api_key"))
+    containers = [{"id": i, "agent_id": 7, "status": "finished"} for i in range(5)]
+    route = respx.get(url__startswith=f"{client._base_url_v2}/containers/fetch-all").mock(
+        return_value=Response(200, json={"containers": containers})
+    )
+
+    assert [c.id async for c in client.containers.iter_all("7", page_size=2)] == list(range(5))
+    assert route.call_count == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+@pytest.mark.parametrize("prefetch", [True, False])
+async def test_iter_all_when_the_cursor_is_ignored(prefetch):
+    """Tests that a server honoring limit but not beforeId does not truncate the history."""
+    client = PhantombusterClient.create(PhantombusterConfig(api_key="test_api_key"))
+    containers = [{"id": i, "agent_id": 7, "status": "finished"} for i in range(9, -1, -1)]
+
+    def newest(request):
+        limit = int(request.url.params.get("limit", len(containers)))
+        return Response(200, json={"containers": containers[:limit]})
+
+    route = respx.get(url__startswith=f"{client._base_url_v2}/containers/fetch-all").mock(
+        side_effect=newest
+    )
+
+    ids = [c.id async for c in client.containers.iter_all("7", page_size=3, prefetch=prefetch)]
+
+    assert ids == list(range(9, -1, -1))
+    assert route.call_count == 3
+    await client.close()
@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+import pytest
+import respx
+from httpx import Response
+
+from ..client import PhantombusterClient
+from ..config import PhantombusterConfig, RateLimitConfig, RetryConfig
+from ..deadlines import SharedDeadline, current_deadline, deadline, remaining
+from ..__global_exceptions__ import DeadlineExceededError, ServerError
+
+
+@pytest.fixture
+def config():
+    """Provides a mock PhantombusterConfig."""
+    return PhantombusterConfig(api_key="test_api_key")
+
+
+@pytest.fixture
+def client(config):
+    """Provides an independent PhantombusterClient instance."""
+    return PhantombusterClient.create(config)
+
+
+def test_nested_deadlines_only_shorten():
+    """Tests that an inner deadline cannot extend the outer one."""
+    assert remaining() is None
+    with deadline(1.0) as outer:
+        with deadline(10.0) as inner:
+            assert inner == outer
+        with deadline(0.5) as inner:
+            assert inner < outer
+            assert current_deadline(5.0) == inner
+        assert 0 < remaining() <= 1.0
+    assert current_deadline() is None
+
+
+def test_nested_deadline_follows_a_shared_one():
+    """Tests that a deadline inside a shared one still moves when the shared one does."""
+    shared = SharedDeadline(time.monotonic() + 0.5)
+    with shared.applied():
+        with deadline(10.0):
+            assert remaining() <= 0.5
+            shared.extend(time.monotonic() + 5.0)
+            assert 4.0 < remaining() <= 5.0
+            with deadline(1.0):
+                assert remaining() <= 1.0
+            shared.extend(None)
+            assert 9.0 < remaining() <= 10.0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_slow_response_is_cancelled(client):
+    """Tests that a call still waiting on the network is cancelled at its deadline."""
+
+    async def slow(request):
+        await asyncio.sleep(5)
+        return Response(200, json={})
+
+    respx.get(f"{client._base_url_v2}/containers/fetch").mock(side_effect=slow)
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        with deadline(0.1):
+            await client._request("GET", "/containers/fetch", params={"id": "1"})
+
+    assert time.monotonic() - started < 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_limiter_wait_counts_against_call_timeout():
+    """Tests that config.call_timeout covers time queued in the rate limiter."""
+    client = PhantombusterClient.create(
+        PhantombusterConfig(
+            api_key="test_api_key",
+            call_timeout=0.1,
+            rate_limit=RateLimitConfig(requests_per_second=1, burst=1, adaptive=False),
+        )
+    )
+    respx.get(f"{client._base_url_v2}/agents/fetch-all").mock(return_value=Response(200, json={}))
+
+    await client._request("GET", "/agents/fetch-all")
+    with pytest.raises(DeadlineExceededError):
+        await client._request("GET", "/agents/fetch-all")
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_retry_past_deadline_raises_last_error():
+    """Tests that a retry which cannot start before the deadline is not attempted."""
+    client = PhantombusterClient.create(
+        PhantombusterConfig(
+            api_key="test_api_key",
+            retry=RetryConfig(base_delay=0, max_delay=0, max_attempts=5),
+        )
+    )
+    route = respx.get(f"{client._base_url_v2}/ai/status").mock(
+        return_value=Response(503, headers={"Retry-After": "3"}, text="busy")
+    )
+
+    started = time.monotonic()
+    with pytest.raises(ServerError):
+        with deadline(1.0):
+            await client._request("GET", "/ai/status")
+
+    assert route.call_count == 1
+    assert time.monotonic() - started < 0.5
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_deadline_sends_nothing(client):
+    """Tests that a call made after its deadline fails without a request."""
+    with deadline(0):
+        with pytest.raises(DeadlineExceededError):
+            await client._request("GET", "/agents/fetch-all")
+    await client.close()
@@ -0,0 +1,81 @@
+import pytest
+import respx
+from httpx import Response
+from pydantic import ValidationError
+
+from ..client import PhantombusterClient
+from ..config import DecodeConfig, PhantombusterConfig
+from ..decoding import ResponseDecoder, construct_trusted, json_loader
+from ..__global_models__ import AgentListResponse, Agent, Container, Lead, SuccessResponse
+
+
+@pytest.fixture
+def config():
+    """Provides a mock PhantombusterConfig with trusted decoding through orjson."""
+    pytest.importorskip("orjson")
+    return PhantombusterConfig(
+        api_key="test_api_key", decode=DecodeConfig(trusted=True, json_backend="orjson")
+    )
+
+
+@pytest.fixture
+def client(config):
+    """Provides an independent PhantombusterClient instance."""
+    return PhantombusterClient.create(config)
+
+
+def test_construct_trusted_builds_nested_models():
+    """Tests that nested model lists are constructed too."""
+    response = construct_trusted(
+        AgentListResponse, {"agents": [{"id": 1, "name": "a"}, {"id": 2, "extra": True}]}
+    )
+
+    assert isinstance(response.agents[0], Agent)
+    assert response.agents[1].id == 2
+    assert response.agents[1].name is None
+    assert "extra" not in response.agents[1].__dict__
+    assert response == AgentListResponse.model_validate(
+        {"agents": [{"id": 1, "name": "a"}, {"id": 2}]}
+    )
+
+
+def test_construct_trusted_tracks_fields_set():
+    """Tests that defaults are filled without being marked as set."""
+    result = construct_trusted(SuccessResponse, {"success": True})
+
+    assert result.message is None
+    assert result.model_dump(exclude_unset=True) == {"success": True}
+
+
+def test_json_loader_rejects_unknown_backend():
+    """Tests that an unknown JSON backend is reported."""
+    assert json_loader("json")(b'{"a": 1}') == {"a": 1}
+    with pytest.raises(ValueError):
+        json_loader("simdjson")
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_trusted_client_builds_leads_without_validation(client):
+    """Tests that a trusted client builds leads from the raw payload and validates the rest."""
+    respx.post(f"{client._base_url_v2}/org-storage/leads/by-list/3").mock(
+        return_value=Response(200, json={"leads": [{"id": "not-an-int", "data": {"a": 1}}]})
+    )
+    respx.get(f"{client._base_url_v2}/containers/fetch?id=9").mock(
+        return_value=Response(200, json={"id": "not-an-int"})
+    )
+
+    leads = await client.org_storage.fetch_leads_by_list(3)
+    assert isinstance(leads[0], Lead)
+    assert leads[0].id == "not-an-int"
+    with pytest.raises(ValidationError):
+        await client.containers.fetch("9")
+    await client.close()
+
+
+def test_trusted_needs_orjson():
+    """Tests that trusted decoding validates everything with the json backend."""
+    decoder = ResponseDecoder(DecodeConfig(trusted=True, json_backend="json"))
+    assert not decoder.trusts(Lead)
+    with pytest.raises(ValidationError):
+        decoder.build(Lead, {"id": "not-an-int", "data": {}})
@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+import respx
+from httpx import Response
+
+from ..client import PhantombusterClient
+from ..config import PhantombusterConfig
+from ..history_sync import HistorySync, WatermarkStore
+from ..mock_server import MockPhantomBuster, MockServerConfig
+
+
+@pytest.fixture
+def config():
+    """Provides a mock PhantombusterConfig."""
+    return PhantombusterConfig(api_key="test_api_key")
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Provides a WatermarkStore in a temporary directory."""
+    store = WatermarkStore(tmp_path / "history.db")
+    yield store
+    store.close()
+
+
+def test_watermarks_only_move_forward(store, tmp_path):
+    """Tests that watermarks persist, never move back and can be reset."""
+    store.set("1", 10)
+    store.set("1", 5)
+    store.set("2", 7)
+    assert store.all() == {"1": 10, "2": 7}
+
+    reopened = WatermarkStore(tmp_path / "history.db")
+    assert reopened.get("1") == 10
+    reopened.reset("1")
+    assert reopened.get("1") is None
+    assert len(reopened) == 1
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_sync_fetches_only_new_pages(config, store):
+    """Tests that a second sync only pages through containers newer than the watermark."""
+    mock = MockPhantomBuster(MockServerConfig(list_size=1000))
+    client = PhantombusterClient.create(config, transport=mock)
+    sync = HistorySync(client, store, page_size=100)
+
+    first = [container.id async for _, container in sync.sync(["7"])]
+    assert len(first) == 1000 and first == sorted(first)
+    assert store.get("7") == first[-1]
+
+    mock.config.list_size = 1030
+    requests = mock.requests["v2:/containers/fetch-all"]
+    second = [container.id async for container in sync.new_containers("7")]
+    assert second == [700_000 + index for index in range(1000, 1030)]
+    assert mock.requests["v2:/containers/fetch-all"] - requests == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_interrupted_sync_resumes(config, store):
+    """Tests that a sync stopped midway resumes from the unprocessed container."""
+    client = PhantombusterClient.create(
+        config, transport=MockPhantomBuster(MockServerConfig(list_size=10))
+    )
+    sync = HistorySync(client, store, page_size=4)
+
+    processed = []
+    async for container in sync.new_containers("3"):
+        if len(processed) == 4:
+            break
+        processed.append(container.id)
+
+    resumed = [container.id async for container in sync.new_containers("3")]
+    assert resumed[0] == 300_004
+    assert processed + resumed == [300_000 + index for index in range(10)]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_stops_at_running_containers_and_skips_backfill(config, store):
+    """Tests that running containers are left for later and backfill can be skipped."""
+    mock = MockPhantomBuster(MockServerConfig(container_duration=10))
+    client = PhantombusterClient.create(config, transport=mock)
+    await client.agents.launch(5)
+
+    assert [c async for c in HistorySync(client, store).new_containers("5")] == []
+    assert store.get("5") is None
+
+    sync = HistorySync(client, store, backfill=False)
+    assert [c async for c in sync.new_containers("8")] == []
+    assert store.get("8") == 800_000 + mock.config.list_size - 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_skipped_backfill_leaves_running_containers_for_later(config, store):
+    """Tests that skipping backfill does not move the watermark past a running container."""
+    mock = MockPhantomBuster(MockServerConfig(container_duration=0.05))
+    client = PhantombusterClient.create(config, transport=mock)
+    container = await client.agents.launch(6)
+    sync = HistorySync(client, store, backfill=False)
+
+    assert [c async for c in sync.new_containers("6")] == []
+    assert store.get("6") is None
+
+    await asyncio.sleep(0.1)
+    sync.backfill = True
+    assert [c.id async for c in sync.new_containers("6")] == [container.id]
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_sync_when_the_cursor_is_ignored(config, store):
+    """Tests that a server ignoring beforeId still has its whole history synced."""
+    client = PhantombusterClient.create(config)
+    history = [{"id": i, "agent_id": 4, "status": "finished"} for i in range(10)]
+
+    def newest(request):
+        containers = history[::-1]
+        limit = int(request.url.params.get("limit", len(containers)))
+        return Response(200, json={"containers": containers[:limit]})
+
+    respx.get(url__startswith=f"{client._base_url_v2}/containers/fetch-all").mock(
+        side_effect=newest
+    )
+    sync = HistorySync(client, store, page_size=3)
+
+    assert [c.id async for c in sync.new_containers("4")] == list(range(10))
+    history += [{"id": i, "agent_id": 4, "status": "finished"} for i in range(10, 12)]
+    assert [c.id async for c in sync.new_containers("4")] == [10, 11]
+    assert store.get("4") == 11
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_containers_without_status_do_not_block_the_watermark(config, store):
+    """Tests that a container with no status is synced rather than waited on forever."""
+    client = PhantombusterClient.create(config)
+    history = [
+        {"id": 3, "agent_id": 2, "status": "finished"},
+        {"id": 2, "agent_id": 2},
+        {"id": 1, "agent_id": 2, "status": "finished"},
+    ]
+    respx.get(url__startswith=f"{client._base_url_v2}/containers/fetch-all").mock(
+        return_value=Response(200, json={"containers": history})
+    )
+
+    assert [c.id async for c in HistorySync(client, store).new_containers("2")] == [1, 2, 3]
+    assert store.get("2") == 3
+    await client.close()
@@ -0,0 +1,132 @@
+import pytest
+import respx
+from httpx import Response
+
+from ..client import PhantombusterClient
+from ..config import DecodeConfig, PhantombusterConfig, RetryConfig
+from ..instrumentation import (
+    DecodeEvent,
+    EventBus,
+    Histogram,
+    HistogramAggregator,
+    RequestEvent,
+)
+from ..__global_exceptions__ import NotFoundError
+from ..__global_models__ import Container
+
+
+@pytest.fixture
+def config():
+    """Provides a mock PhantombusterConfig with fast retries."""
+    return PhantombusterConfig(
+        api_key="test_api_key",
+        retry=RetryConfig(base_delay=0, max_delay=0),
+    )
+
+
+@pytest.fixture
+def client(config):
+    """Provides an independent PhantombusterClient instance."""
+    return PhantombusterClient.create(config)
+
+
+def test_histogram_quantiles():
+    """Tests that quantiles are interpolated within the right buckets."""
+    histogram = Histogram(bounds=(1.0, 2.0, 4.0))
+    for value in (0.5, 1.5, 1.5, 3.0, 10.0):
+        histogram.observe(value)
+
+    assert histogram.count == 5
+    assert histogram.counts == [1, 2, 1, 1]
+    assert 1.0 <= histogram.quantile(0.5) <= 2.0
+    assert histogram.quantile(1.0) == 10.0
+    assert Histogram().quantile(0.5) is None
+
+
+def test_failing_hook_does_not_stop_others():
+    """Tests that an exception in one hook neither propagates nor skips other hooks."""
+    bus = EventBus()
+    received = []
+
+    def broken(event):
+        raise RuntimeError("broken hook")
+
+    bus.subscribe(broken)
+    bus.subscribe(received.append)
+    event = RequestEvent("GET", "v2:/agents/fetch", "v2:agents")
+    bus.emit(event)
+    bus.unsubscribe(broken)
+
+    assert received == [event]
+    assert bus
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_request_event_reports_retries_and_status(client):
+    """Tests that a request's retries, status and sizes are reported once it finishes."""
+    events = []
+    client.events.subscribe(events.append)
+    respx.post(f"{client._base_url_v2}/agents/launch").mock(
+        side_effect=[Response(503, text="busy"), Response(200, json={"containerId": "1"})]
+    )
+
+    await client._request("POST", "/agents/launch", json={"id": "1"})
+
+    assert len(events) == 1
+    event = events[0]
+    assert (event.method, event.endpoint, event.family) == ("POST", "v2:/agents/launch", "v2:agents")
+    assert (event.status, event.error, event.retries) == (200, None, 1)
+    assert event.bytes_sent == 2 * len(b'{"id":"1"}')
+    assert event.bytes_received == len(b"busy") + len(b'{"containerId":"1"}')
+    assert event.duration >= event.network + event.limiter_wait
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_failed_request_and_decode_events(client):
+    """Tests that failures and model decoding are reported and aggregated per endpoint."""
+    histograms = HistogramAggregator()
+    client.events.subscribe(histograms)
+    respx.get(f"{client._base_url_v2}/containers/fetch").mock(
+        side_effect=[Response(404, text="missing"), Response(200, json={"id": 1})]
+    )
+
+    with pytest.raises(NotFoundError):
+        await client._request("GET", "/containers/fetch", params={"id": "1"})
+    response = await client._request("GET", "/containers/fetch", params={"id": "1"})
+    client._parse(Container, response)
+
+    snapshot = histograms.snapshot()["v2:/containers/fetch"]
+    assert snapshot["statuses"] == {"404": 1, "200": 1}
+    assert snapshot["duration"]["count"] == 2
+    assert snapshot["validate"]["count"] == 1
+    assert "decode" not in snapshot
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_trusted_decoding_reports_both_phases():
+    """Tests that trusted decoding reports the JSON parse and model building separately."""
+    pytest.importorskip("orjson")
+    client = PhantombusterClient.create(
+        PhantombusterConfig(
+            api_key="test_api_key", decode=DecodeConfig(trusted=True, json_backend="orjson")
+        )
+    )
+    events = []
+    client.events.subscribe(events.append)
+    respx.post(f"{client._base_url_v2}/org-storage/leads/by-list/1").mock(
+        return_value=Response(200, json={"leads": [{"id": 1, "data": {}}]})
+    )
+
+    await client.org_storage.fetch_leads_by_list(1)
+
+    decode = [event for event in events if isinstance(event, DecodeEvent)]
+    assert len(decode) == 1
+    assert decode[0].endpoint == "v2:/org-storage/leads/by-list/{id}"
+    assert decode[0].model == "LeadListResponse"
+    assert decode[0].decode > 0 and decode[0].validate > 0
+    await client.close()
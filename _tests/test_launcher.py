@@ -0,0 +1,110 @@
+import pytest
+
+from ..client import PhantombusterClient
+from ..config import PhantombusterConfig, RetryConfig
+from ..launcher import BulkLauncher
+from ..mock_server import MockPhantomBuster, MockServerConfig
+from ..__global_exceptions__ import AuthenticationError, NotFoundError, PhantomBusterAPIError
+
+
+@pytest.fixture
+def config():
+    """Provides a mock PhantombusterConfig without retries or coalescing."""
+    return PhantombusterConfig(
+        api_key="test_api_key", retry=RetryConfig(max_attempts=1), coalesce_gets=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_keeps_slots_full(config):
+    """Tests that agents are launched as slots free up, never over capacity."""
+    mock = MockPhantomBuster(MockServerConfig(slots=3, container_duration=0.05))
+    client = PhantombusterClient.create(config, transport=mock)
+    launcher = BulkLauncher(client, min_interval=0.01, max_interval=0.02)
+
+    outcomes = await launcher.run(range(10))
+
+    assert [outcome.agent_id for outcome in outcomes] == list(range(10))
+    assert all(outcome.launched and outcome.attempts == 1 for outcome in outcomes)
+    assert mock.requests["v2:/agents/launch"] == 10
+    assert mock.requests["v2:/orgs/fetch-resources"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_respects_runs_started_elsewhere_and_reserve(config):
+    """Tests that occupied and reserved slots are not launched into."""
+    mock = MockPhantomBuster(MockServerConfig(slots=3, container_duration=0.05))
+    client = PhantombusterClient.create(config, transport=mock)
+    await client.agents.launch(99)
+
+    outcomes = [o async for o in BulkLauncher(client, 0.01, 0.02, reserve=1).launches([1, 2])]
+
+    assert [outcome.agent_id for outcome in outcomes] == [1, 2]
+    assert outcomes[1].waited >= 0.04
+    assert all(outcome.attempts == 1 for outcome in outcomes)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_launches_are_retried_then_reported(config, monkeypatch):
+    """Tests that failures are retried up to max_attempts and reported per agent."""
+    client = PhantombusterClient.create(config, transport=MockPhantomBuster())
+    calls = []
+
+    async def launch(agent_id):
+        calls.append(agent_id)
+        if agent_id == 1:
+            raise NotFoundError("No such agent.", 404)
+        if agent_id == 2 or calls.count(3) == 1:
+            raise PhantomBusterAPIError("Launch failed.", 400)
+        return await original(agent_id)
+
+    original = client.agents.launch
+    monkeypatch.setattr(client.agents, "launch", launch)
+    outcomes = await client.agents.launch_many([1, 2, 3], min_interval=0.01, max_attempts=2)
+
+    assert [(o.attempts, o.launched) for o in outcomes] == [(1, False), (2, False), (2, True)]
+    assert isinstance(outcomes[0].error, NotFoundError)
+    assert outcomes[1].error.status_code == 400
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_capacity_errors(config, monkeypatch):
+    """Tests that unusable capacity and rejected keys stop the launch."""
+    client = PhantombusterClient.create(config, transport=MockPhantomBuster())
+    with pytest.raises(ValueError):
+        await BulkLauncher(client, reserve=5).run([1])
+    assert await BulkLauncher(client).run([]) == []
+
+    async def launch(agent_id):
+        raise AuthenticationError("Invalid API key.", 401)
+
+    monkeypatch.setattr(client.agents, "launch", launch)
+    with pytest.raises(AuthenticationError):
+        await BulkLauncher(client, slots=2).run([1, 2])
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_rejected_key_reports_the_rest_of_its_batch(config, monkeypatch):
+    """Tests that the launches sharing a batch with a rejected one are still yielded."""
+    client = PhantombusterClient.create(config, transport=MockPhantomBuster())
+    launch = client.agents.launch
+
+    async def launch_or_reject(agent_id):
+        if agent_id == 2:
+            raise AuthenticationError("Invalid API key.", 401)
+        return await launch(agent_id)
+
+    monkeypatch.setattr(client.agents, "launch", launch_or_reject)
+    outcomes = []
+    with pytest.raises(AuthenticationError):
+        async for outcome in BulkLauncher(client, slots=3).launches([1, 2, 3]):
+            outcomes.append(outcome)
+
+    assert sorted(outcome.agent_id for outcome in outcomes) == [1, 2, 3]
+    assert [outcome.launched for outcome in outcomes] == [True, False, True]
+    assert isinstance(outcomes[1].error, AuthenticationError)
+    await client.close()
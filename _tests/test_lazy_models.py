@@ -0,0 +1,107 @@
+import pytest
+import respx
+from httpx import Response
+
+from ..client import PhantombusterClient
+from ..config import DecodeConfig, PhantombusterConfig
+from ..lazy_models import LazyModelList
+from ..__global_models__ import Container, Lead
+
+
+@pytest.fixture
+def config():
+    """Provides a mock PhantombusterConfig."""
+    return PhantombusterConfig(api_key="test_api_key")
+
+
+@pytest.fixture
+def client(config):
+    """Provides an independent PhantombusterClient instance."""
+    return PhantombusterClient.create(config)
+
+
+def test_items_are_built_on_access():
+    """Tests that items are only built when accessed."""
+    built = []
+
+    def build(model, item):
+        built.append(item["id"])
+        return model.model_validate(item)
+
+    leads = LazyModelList(Lead, [{"id": index, "data": {}} for index in range(10)], build)
+
+    assert len(leads) == 10
+    assert built == []
+    assert leads[3].id == 3
+    assert leads[-1].id == 9
+    assert built == [3, 9]
+
+
+def test_slicing_stays_lazy():
+    """Tests that a slice shares raw items and builds nothing."""
+    built = []
+
+    def build(model, item):
+        built.append(item["id"])
+        return model.model_validate(item)
+
+    leads = LazyModelList(Lead, [{"id": index, "data": {}} for index in range(10)], build)
+    head = leads[:3]
+
+    assert isinstance(head, LazyModelList)
+    assert built == []
+    assert [lead.id for lead in head] == [0, 1, 2]
+    assert head.raw[0] is leads.raw[0]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fetch_leads_by_list_lazy(client):
+    """Tests fetching leads as a lazy list."""
+    respx.post(f"{client._base_url_v2}/org-storage/leads/by-list/5").mock(
+        return_value=Response(200, json={"leads": [{"id": 1, "data": {"a": 1}}, {"id": 2, "data": {}}]})
+    )
+
+    leads = await client.org_storage.fetch_leads_by_list(5, lazy=True)
+
+    assert isinstance(leads, LazyModelList)
+    assert leads[0] == Lead(id=1, data={"a": 1})
+    assert len(leads.to_list()) == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fetch_all_containers_lazy(client):
+    """Tests fetching an agent's containers as a lazy list."""
+    respx.get(f"{client._base_url_v2}/containers/fetch-all?agentId=4").mock(
+        return_value=Response(200, json={"containers": [{"id": 7, "status": "finished"}]})
+    )
+
+    containers = await client.containers.fetch_all("4", lazy=True)
+
+    assert list(containers) == [Container(id=7, status="finished")]
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_trusted_lazy_items_do_not_share_state():
+    """Tests that trusted lazy items are built from copies of the raw items."""
+    pytest.importorskip("orjson")
+    client = PhantombusterClient.create(
+        PhantombusterConfig(
+            api_key="test_api_key", decode=DecodeConfig(trusted=True, json_backend="orjson")
+        )
+    )
+    respx.post(f"{client._base_url_v2}/org-storage/leads/by-list/4").mock(
+        return_value=Response(200, json={"leads": [{"id": 7, "data": {"a": 1}}]})
+    )
+
+    leads = await client.org_storage.fetch_leads_by_list(4, lazy=True)
+    leads[0].data = {"changed": True}
+
+    assert leads.raw == [{"id": 7, "data": {"a": 1}}]
+    assert leads[0].data == {"a": 1}
+    assert leads[0] is not leads[0]
+    await client.close()
@@ -0,0 +1,124 @@
+import urllib.request
+
+import pytest
+import respx
+from httpx import Response
+
+from ..client import PhantombusterClient
+from ..config import CacheConfig, CircuitBreakerConfig, PhantombusterConfig, RetryConfig
+from ..instrumentation import DecodeEvent, Histogram
+from ..metrics import CONTENT_TYPE, PrometheusExporter
+from ..__global_exceptions__ import ServerError
+
+
+@pytest.fixture
+def config():
+    """Provides a mock PhantombusterConfig with caching and a sensitive breaker."""
+    return PhantombusterConfig(
+        api_key="test_api_key",
+        retry=RetryConfig(max_attempts=1),
+        cache=CacheConfig(enabled=True),
+        circuit_breaker=CircuitBreakerConfig(failure_threshold=1),
+    )
+
+
+@pytest.fixture
+def client(config):
+    """Provides an independent PhantombusterClient instance."""
+    return PhantombusterClient.create(config)
+
+
+def test_histogram_buckets_are_cumulative():
+    """Tests that histogram buckets render cumulatively with +Inf, sum and count."""
+    exporter = PrometheusExporter(buckets=(0.1, 1.0))
+    exporter(DecodeEvent("v2:/agents/fetch", "Agent", 10, decode=0.05, validate=2.0))
+    exporter(DecodeEvent("v2:/agents/fetch", "Agent", 10, decode=0.5))
+
+    text = exporter.render()
+
+    labels = 'endpoint="v2:/agents/fetch",phase="decode"'
+    assert f'phantombuster_decode_seconds_bucket{{{labels},le="0.1"}} 1' in text
+    assert f'phantombuster_decode_seconds_bucket{{{labels},le="1.0"}} 2' in text
+    assert f'phantombuster_decode_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"phantombuster_decode_seconds_count{{{labels}}} 2" in text
+    assert "# TYPE phantombuster_decode_seconds histogram" in text
+
+
+def test_label_values_are_escaped():
+    """Tests that quotes, backslashes and newlines in labels are escaped."""
+    exporter = PrometheusExporter()
+    exporter._decodes[('v2:/a"b\\c\n', "decode")] = Histogram()
+
+    assert 'endpoint="v2:/a\\"b\\\\c\\n"' in exporter.render()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_requests_circuits_and_cache_are_exported(client):
+    """Tests that request counts, circuit states and the cache hit ratio are exported."""
+    exporter = PrometheusExporter()
+    exporter.attach(client)
+    respx.get(f"{client._base_url_v2}/agents/fetch-all").mock(
+        return_value=Response(200, json={"agents": []})
+    )
+    respx.post(f"{client._base_url_v2}/ai/completions").mock(return_value=Response(500))
+
+    await client._request("GET", "/agents/fetch-all")
+    await client._request("GET", "/agents/fetch-all")
+    with pytest.raises(ServerError):
+        await client._request("POST", "/ai/completions", json={})
+
+    text = exporter.render()
+    assert (
+        'phantombuster_requests_total{endpoint="v2:/agents/fetch-all",method="GET",status="200"} 1'
+        in text
+    )
+    assert (
+        'phantombuster_requests_total{endpoint="v2:/ai/completions",method="POST",status="500"} 1'
+        in text
+    )
+    assert 'phantombuster_circuit_state{endpoint="v2:/ai/completions"} 2' in text
+    assert "phantombuster_cache_hit_ratio 0.5" in text
+    assert 'phantombuster_limiter_wait_seconds_count{family="v2:agents"} 1' in text
+    exporter.detach(client)
+    assert not client.events
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_endpoint_labels_are_routes(client):
+    """Tests that requests for different IDs share one series."""
+    exporter = PrometheusExporter()
+    exporter.attach(client)
+    respx.get(url__regex=rf"{client._base_url_v1}/agent/\d+").mock(
+        return_value=Response(200, json={"id": 1})
+    )
+
+    await client._request("GET", "/agent/1", api_version="v1")
+    await client._request("GET", "/agent/2", api_version="v1")
+
+    text = exporter.render()
+    assert (
+        'phantombuster_requests_total{endpoint="v1:/agent/{id}",method="GET",status="200"} 2'
+        in text
+    )
+    assert "/agent/1" not in text
+    exporter.detach(client)
+    await client.close()
+
+
+def test_serve_metrics_over_http():
+    """Tests that the HTTP endpoint serves the rendered metrics."""
+    exporter = PrometheusExporter()
+    server = exporter.serve(port=0)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            body = response.read().decode()
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert body == exporter.render()
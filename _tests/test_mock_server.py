@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+from ..client import PhantombusterClient
+from ..config import PhantombusterConfig, RetryConfig
+from ..mock_server import MockPhantomBuster, MockServerConfig
+from ..__global_exceptions__ import PhantomBusterAPIError, RateLimitError, ServerError
+
+
+@pytest.fixture
+def config():
+    """Provides a mock PhantombusterConfig without retries."""
+    return PhantombusterConfig(api_key="test_api_key", retry=RetryConfig(max_attempts=1))
+
+
+def test_latency_distributions():
+    """Tests that each latency distribution centers on the configured median."""
+    for distribution in ("fixed", "uniform", "exponential", "lognormal"):
+        mock = MockPhantomBuster(
+            MockServerConfig(latency_distribution=distribution, latency=0.1, seed=1)
+        )
+        delays = sorted(mock._latency("v2:/agents/fetch-all") for _ in range(2001))
+        assert 0.08 < delays[1000] < 0.12, distribution
+
+    mock = MockPhantomBuster(MockServerConfig(endpoint_latency={"v2:/ai/completions": 2.0}))
+    assert mock._latency("v2:/ai/completions") == 2.0
+    assert mock._latency("v2:/agents/fetch-all") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_generated_payloads_through_transport(config):
+    """Tests that list endpoints return generated payloads of the configured size."""
+    mock = MockPhantomBuster(MockServerConfig(list_size=250, result_size=40))
+    client = PhantombusterClient.create(config, transport=mock)
+
+    agents = await client.agents.fetch_all()
+    leads = await client.org_storage.fetch_leads_by_list(3)
+    records = [record async for record in client.containers.stream_result_object("1")]
+
+    assert len(agents) == len(leads) == 250
+    assert len(records) == 40
+    assert mock.requests["v2:/org-storage/leads/by-list/3"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_fault_injection(config):
+    """Tests that injected 429s and 5xx carry Retry-After and map to SDK errors."""
+    client = PhantombusterClient.create(
+        config, transport=MockPhantomBuster(MockServerConfig(rate_limit_rate=1.0, retry_after=2))
+    )
+    with pytest.raises(RateLimitError) as info:
+        await client.agents.fetch_all()
+    assert info.value.retry_after == 2
+    await client.close()
+
+    client = PhantombusterClient.create(
+        config,
+        transport=MockPhantomBuster(
+            MockServerConfig(server_error_rate=1.0, server_error_status=502)
+        ),
+    )
+    with pytest.raises(ServerError) as info:
+        await client.scripts.fetch_all()
+    assert info.value.status_code == 502
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_quota_headers_drive_the_limiter(config):
+    """Tests that quota headers are sent, slow the client down and are enforced."""
+    mock = MockPhantomBuster(MockServerConfig(quota=3, quota_window=60))
+    client = PhantombusterClient.create(config, transport=mock)
+
+    await client.location.get_ip()
+    assert client._limiter.rate("v2:location") == client.config.rate_limit.min_rate
+
+    _, (status, headers, _) = mock.respond("GET", "/api/v2/location/ip")
+    assert (status, headers["X-RateLimit-Remaining"]) == (200, "1")
+    mock.respond("GET", "/api/v2/location/ip")
+    _, (status, headers, _) = mock.respond("GET", "/api/v2/location/ip")
+    assert status == 429
+    assert headers["X-RateLimit-Remaining"] == "0"
+    assert 0 < int(headers["Retry-After"]) <= 60
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_launched_containers_use_slots(config):
+    """Tests that launches occupy slots until their containers finish."""
+    mock = MockPhantomBuster(MockServerConfig(slots=1, container_duration=0.05))
+    client = PhantombusterClient.create(config, transport=mock)
+
+    container = await client.agents.launch(4)
+    assert container.status == "running"
+    assert [c.id for c in await client.orgs.fetch_running_containers()] == [container.id]
+    with pytest.raises(PhantomBusterAPIError):
+        await client.agents.launch(5)
+
+    await asyncio.sleep(0.06)
+    assert (await client.containers.fetch(str(container.id))).status == "finished"
+    assert await client.orgs.fetch_running_containers() == []
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_serve_over_http():
+    """Tests that the mock can be served over HTTP to a regular client."""
+    mock = MockPhantomBuster(MockServerConfig(list_size=5))
+    server = mock.serve()
+    host, port = server.server_address[:2]
+    client = PhantombusterClient.create(
+        PhantombusterConfig(
+            api_key="test_api_key",
+            base_url_v1=f"http://{host}:{port}/api/v1",
+            base_url_v2=f"http://{host}:{port}/api/v2",
+        )
+    )
+    try:
+        assert len(await client.agents.fetch_all()) == 5
+        assert (await client.v1.get_agent_record(3)).id == 3
+    finally:
+        await client.close()
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_large_bodies_are_chunked(config):
+    """Tests that bodies larger than the chunk size arrive in several chunks."""
+    mock = MockPhantomBuster(MockServerConfig(result_size=500, chunk_size=1024))
+    client = PhantombusterClient.create(config, transport=mock)
+
+    async with client._stream("GET", "/containers/fetch-result-object?id=1") as response:
+        chunks = [chunk async for chunk in response.aiter_raw()]
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 1024 for chunk in chunks)
+    assert sum(map(len, chunks)) == int(response.headers["Content-Length"])
+    await client.close()
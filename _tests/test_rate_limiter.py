@@ -0,0 +1,76 @@
+import pytest
+import respx
+from httpx import Response
+
+from ..client import PhantombusterClient
+from ..config import PhantombusterConfig, RateLimitConfig
+from ..rate_limiter import AdaptiveRateLimiter, endpoint_family, parse_retry_after
+from ..__global_exceptions__ import RateLimitError
+
+
+@pytest.fixture
+def config():
+    """Provides a mock PhantombusterConfig."""
+    return PhantombusterConfig(api_key="test_api_key")
+
+
+@pytest.fixture
+def client(config):
+    """Provides an independent PhantombusterClient instance."""
+    return PhantombusterClient.create(config)
+
+
+def test_endpoint_family():
+    """Tests that endpoints are grouped by API version and first path segment."""
+    assert endpoint_family("/agents/fetch-all") == "v2:agents"
+    assert endpoint_family("/agents/launch?id=1") == "v2:agents"
+    assert endpoint_family("/agent/42", api_version="v1") == "v1:agent"
+
+
+def test_parse_retry_after():
+    """Tests parsing of the delta-seconds form of Retry-After."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+
+
+def test_quota_headers_set_rate():
+    """Tests that quota headers pin the family rate under the remaining quota."""
+    limiter = AdaptiveRateLimiter(RateLimitConfig(safety_margin=0.5))
+    limiter.observe(
+        "v2:agents",
+        200,
+        {"X-RateLimit-Remaining": "40", "X-RateLimit-Reset": "2"},
+    )
+    assert limiter.rate("v2:agents") == pytest.approx(10.0)
+    assert limiter.rate("v2:ai") == pytest.approx(10.0)
+
+
+def test_429_backs_off():
+    """Tests that a 429 halves the rate of the family and blocks it."""
+    limiter = AdaptiveRateLimiter(RateLimitConfig())
+    limiter.observe("v2:ai", 429, {"Retry-After": "1"})
+    assert limiter.rate("v2:ai") == pytest.approx(5.0)
+    assert limiter._bucket("v2:ai").blocked_until > 0
+
+
+def test_non_adaptive_keeps_rate():
+    """Tests that a non-adaptive limiter ignores quota headers."""
+    limiter = AdaptiveRateLimiter(RateLimitConfig(adaptive=False, requests_per_second=3))
+    limiter.observe("v2:agents", 200, {"X-RateLimit-Limit": "100"})
+    assert limiter.rate("v2:agents") == 3
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_client_feeds_limiter(client):
+    """Tests that the client reports 429 responses to the limiter."""
+    respx.get(f"{client._base_url_v2}/ai/test").mock(
+        return_value=Response(429, headers={"Retry-After": "0"})
+    )
+
+    with pytest.raises(RateLimitError):
+        await client._request("GET", "/ai/test")
+
+    assert client._limiter.rate("v2:ai") < client.config.rate_limit.requests_per_second
+    await client.close()
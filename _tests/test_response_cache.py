@@ -0,0 +1,101 @@
+import pytest
+import respx
+from httpx import Response
+
+from ..client import PhantombusterClient
+from ..config import CacheConfig, PhantombusterConfig
+from ..response_cache import ResponseCache
+
+
+@pytest.fixture
+def config():
+    """Provides a mock PhantombusterConfig with the response cache enabled."""
+    return PhantombusterConfig(api_key="test_api_key", cache=CacheConfig(enabled=True))
+
+
+@pytest.fixture
+def client(config):
+    """Provides an independent PhantombusterClient instance."""
+    return PhantombusterClient.create(config)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_cached_read_skips_network(client):
+    """Tests that a fresh cached response is served without a request."""
+    route = respx.get(f"{client._base_url_v2}/agents/fetch-all").mock(
+        return_value=Response(200, json={"agents": [{"id": 1}]})
+    )
+
+    await client.agents.fetch_all()
+    agents = await client.agents.fetch_all()
+
+    assert route.call_count == 1
+    assert agents[0].id == 1
+    assert client._cache.stats()["hits"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_uncached_endpoint_always_hits_network(client):
+    """Tests that endpoints without a TTL are not cached."""
+    route = respx.get(f"{client._base_url_v2}/orgs/fetch-resources").mock(
+        return_value=Response(200, json={"slots": 5})
+    )
+
+    await client.orgs.fetch_resources()
+    await client.orgs.fetch_resources()
+
+    assert route.call_count == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_mutation_invalidates(client):
+    """Tests that agents.save evicts the cached agents.fetch_all."""
+    fetch = respx.get(f"{client._base_url_v2}/agents/fetch-all").mock(
+        return_value=Response(200, json={"agents": []})
+    )
+    respx.post(f"{client._base_url_v2}/agents/save").mock(
+        return_value=Response(200, json={"id": 2, "name": "new"})
+    )
+
+    await client.agents.fetch_all()
+    await client.agents.save(name="new", script_id=1)
+    await client.agents.fetch_all()
+
+    assert fetch.call_count == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_stale_entry_is_revalidated(client):
+    """Tests that a stale entry with an ETag is renewed by a 304."""
+    client.config.cache.ttls["v1:/user"] = 0.0
+    route = respx.get(f"{client._base_url_v1}/user").mock(
+        side_effect=[
+            Response(200, json={"id": 1}, headers={"ETag": '"v1"'}),
+            Response(304),
+        ]
+    )
+
+    await client._request("GET", "/user", api_version="v1")
+    response = await client._request("GET", "/user", api_version="v1")
+
+    assert response.json() == {"id": 1}
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert client._cache.stats()["revalidations"] == 1
+    await client.close()
+
+
+def test_lru_eviction():
+    """Tests that the least recently used entry is evicted past the size cap."""
+    cache = ResponseCache(CacheConfig(enabled=True, max_entries=2))
+    for index in range(3):
+        cache._store(("v2", f"/scripts/fetch?id={index}", ""), Response(200), f"/scripts/fetch?id={index}", "v2", 60)
+
+    assert len(cache) == 2
+    assert cache.get(("v2", "/scripts/fetch?id=0", "")) is None
@@ -0,0 +1,124 @@
+import asyncio
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+
+from ..client import PhantombusterClient
+from ..config import PhantombusterConfig, RateLimitConfig, RetryConfig
+from ..rate_limiter import AdaptiveRateLimiter
+from ..retries import RetryBudget, RetryPolicy
+from ..__global_exceptions__ import NotFoundError, RateLimitError, ServerError, TransportError
+
+
+@pytest.fixture
+def config():
+    """Provides a mock PhantombusterConfig with fast retries."""
+    return PhantombusterConfig(
+        api_key="test_api_key",
+        retry=RetryConfig(base_delay=0, max_delay=0),
+    )
+
+
+@pytest.fixture
+def client(config):
+    """Provides an independent PhantombusterClient instance."""
+    return PhantombusterClient.create(config)
+
+
+def test_retry_budget():
+    """Tests that the budget caps retries and refills from new requests."""
+    budget = RetryBudget(ratio=0.5, min_tokens=1, max_tokens=1)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+def test_policy_honors_retry_after():
+    """Tests that the policy waits for Retry-After and gives up past the cap."""
+    policy = RetryPolicy(RetryConfig(max_retry_after=5))
+    assert policy.delay(RateLimitError("slow down", 429, retry_after=2), 0) == 2
+    assert policy.delay(RateLimitError("slow down", 429, retry_after=30), 0) is None
+    assert policy.delay(NotFoundError("missing", 404), 0) is None
+    assert policy.delay(ServerError("boom", 500), 2) is None
+
+
+@pytest.mark.asyncio
+async def test_limiter_serves_lower_tickets_first():
+    """Tests that a re-queued request keeps its place ahead of newer ones."""
+    limiter = AdaptiveRateLimiter(RateLimitConfig(requests_per_second=1, burst=1))
+    await limiter.acquire("v2:agents")
+    order = []
+
+    async def acquire(ticket):
+        await limiter.acquire("v2:agents", ticket)
+        order.append(ticket)
+
+    newer = asyncio.create_task(acquire(10))
+    await asyncio.sleep(0)
+    retried = asyncio.create_task(acquire(1))
+    await asyncio.gather(newer, retried)
+    assert order == [1, 10]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_request_retries_rate_limited(client):
+    """Tests that a 429 is retried and the request then succeeds."""
+    route = respx.get(f"{client._base_url_v2}/agents/fetch-all").mock(
+        side_effect=[
+            Response(429, headers={"Retry-After": "0"}),
+            Response(200, json={"agents": []}),
+        ]
+    )
+
+    response = await client._request("GET", "/agents/fetch-all")
+
+    assert response.status_code == 200
+    assert route.call_count == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_exhausted_budget_stops_retries(client):
+    """Tests that retries stop once the shared budget is spent."""
+    client._retry_budget = RetryBudget(ratio=0, min_tokens=0, max_tokens=0)
+    route = respx.get(f"{client._base_url_v2}/agents/fetch-all").mock(
+        return_value=Response(503)
+    )
+
+    with pytest.raises(ServerError):
+        await client._request("GET", "/agents/fetch-all")
+
+    assert route.call_count == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_read_timeout_does_not_resend_a_launch(config):
+    """Tests that a POST whose response timed out is not sent again."""
+    sent = []
+
+    def handler(request):
+        sent.append(request.method)
+        if request.method == "POST":
+            raise httpx.ReadTimeout("timed out", request=request)
+        if len(sent) == 1:
+            raise httpx.ReadTimeout("timed out", request=request)
+        return Response(200, json={"id": 1, "status": "finished"})
+
+    client = PhantombusterClient.create(config, transport=httpx.MockTransport(handler))
+    assert (await client.containers.fetch("1")).id == 1
+    with pytest.raises(TransportError):
+        await client.agents.launch(1)
+    assert sent == ["GET", "GET", "POST"]
+
+    policy = RetryPolicy(RetryConfig())
+    connect = TransportError("refused")
+    connect.__cause__ = httpx.ConnectError("refused")
+    assert policy.is_retryable(connect, "POST")
+    await client.close()
@@ -0,0 +1,83 @@
+import pytest
+import respx
+from httpx import Response
+
+from ..client import PhantombusterClient
+from ..config import PhantombusterConfig, ScriptCacheConfig
+from ..script_store import ScriptCodeStore
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Provides a mock PhantombusterConfig with an on-disk script cache."""
+    return PhantombusterConfig(
+        api_key="test_api_key",
+        script_cache=ScriptCacheConfig(path=str(tmp_path / "scripts.db")),
+    )
+
+
+@pytest.fixture
+def client(config):
+    """Provides an independent PhantombusterClient instance."""
+    return PhantombusterClient.create(config)
+
+
+def test_store_round_trip(tmp_path):
+    """Tests that code is stored per version and survives reopening."""
+    store = ScriptCodeStore(tmp_path / "scripts.db")
+    store.put("1", 3, "console.log('v3')")
+    store.close()
+
+    store = ScriptCodeStore(tmp_path / "scripts.db")
+    assert store.get("1", 3) == "console.log('v3')"
+    assert store.get("1", 4) is None
+    store.close()
+
+
+def test_store_evicts_least_recently_used(tmp_path):
+    """Tests that the store stays under its size cap."""
+    store = ScriptCodeStore(tmp_path / "scripts.db", max_bytes=10)
+    store.put("1", 1, "aaaaa")
+    store.put("2", 1, "bbbbb")
+    store.get("1", 1)
+    store.put("3", 1, "ccccc")
+
+    assert store.size() <= 10
+    assert store.get("2", 1) is None
+    assert store.get("1", 1) == "aaaaa"
+    store.close()
+
+
+def _script(version, code):
+    return {"id": "42", "name": "s.js", "version": version, "script": code, "visibility": "private"}
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_code_uses_store(client):
+    """Tests that an unchanged version is served without a network call."""
+    route = respx.get(f"{client._base_url_v2}/scripts/fetch?id=42").mock(
+        return_value=Response(200, json=_script(7, "module.exports = 1"))
+    )
+
+    first = await client.scripts.get_code("42", version=7)
+    second = await client.scripts.get_code("42", version=7)
+
+    assert first == second == "module.exports = 1"
+    assert route.call_count == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_code_stores_the_reported_version(client):
+    """Tests that code is stored under the version the API reports, not the caller's."""
+    respx.get(f"{client._base_url_v2}/scripts/fetch?id=42").mock(
+        return_value=Response(200, json=_script(8, "module.exports = 2"))
+    )
+
+    assert await client.scripts.get_code("42", version=7) == "module.exports = 2"
+    assert await client.scripts.get_code("42") == "module.exports = 2"
+    assert client._script_store.get("42", 7) is None
+    assert client._script_store.get("42", 8) == "module.exports = 2"
+    await client.close()
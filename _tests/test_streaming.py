@@ -0,0 +1,222 @@
+import json
+from array import array
+
+import pytest
+import respx
+from httpx import Response
+
+from ..client import PhantombusterClient
+from ..config import PhantombusterConfig
+from ..streaming import ColumnBuilder, CSVStreamParser, JSONStreamParser, coerce_value
+from ..__global_exceptions__ import NotFoundError
+
+
+@pytest.fixture
+def config():
+    """Provides a mock PhantombusterConfig."""
+    return PhantombusterConfig(api_key="test_api_key")
+
+
+@pytest.fixture
+def client(config):
+    """Provides an independent PhantombusterClient instance."""
+    return PhantombusterClient.create(config)
+
+
+def parse_in_chunks(document: bytes, size: int) -> list:
+    parser = JSONStreamParser()
+    items = []
+    for index in range(0, len(document), size):
+        items.extend(parser.feed(document[index:index + size]))
+    items.extend(parser.close())
+    return items
+
+
+@pytest.mark.parametrize("size", [1, 3, 1024])
+def test_array_items(size):
+    """Tests that array items are split correctly across any chunk boundary."""
+    records = [
+        {"name": 'quote " and \\\\ backslash', "tags": ["[", "]", "{", ","]},
+        [1, [2, {"three": 3}]],
+        "plain",
+        42.5,
+        None,
+        {"unicode": "café ☃"},
+    ]
+    document = json.dumps(records, ensure_ascii=False).encode("utf-8")
+    assert parse_in_chunks(document, size) == records
+
+
+def test_object_members():
+    """Tests that a top-level object yields its members as pairs."""
+    document = b'{"a": 1, "b": {"c": [1, 2]}, "d": "}"}'
+    assert parse_in_chunks(document, 2) == [("a", 1), ("b", {"c": [1, 2]}), ("d", "}")]
+
+
+@pytest.mark.parametrize("size", [1, 5, 1024])
+def test_items_under_a_key(size):
+    """Tests that only the items of the array under the key are returned."""
+    document = b'{"total": 2, "leads": [{"id": 1}, {"id": [2]}], "leads2": [3]}'
+    parser = JSONStreamParser("leads")
+    items = []
+    for index in range(0, len(document), size):
+        items.extend(parser.feed(document[index:index + size]))
+    items.extend(parser.close())
+    assert items == [{"id": 1}, {"id": [2]}]
+    with pytest.raises(ValueError):
+        JSONStreamParser("leads").feed(b"[1]")
+
+
+def test_scalar_and_empty_documents():
+    """Tests top-level scalars and empty containers."""
+    assert parse_in_chunks(b' "just a string" ', 4) == ["just a string"]
+    assert parse_in_chunks(b"[]", 1) == []
+    assert parse_in_chunks(b"{ }", 1) == []
+
+
+def test_truncated_document():
+    """Tests that a document cut short is reported."""
+    parser = JSONStreamParser()
+    parser.feed(b'[{"a": 1}, {"b"')
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+@pytest.mark.parametrize("document", [b"[1}", b"[1,]", b'{"a": 1]', b"[[1}]", b"[1] 2"])
+def test_malformed_documents(document):
+    """Tests that mismatched brackets, trailing commas and extra data are reported."""
+    with pytest.raises(ValueError):
+        parse_in_chunks(document, 1024)
+
+
+def test_numbers_split_across_chunks():
+    """Tests that a number cut by a chunk boundary is not returned early."""
+    assert parse_in_chunks(b"[12.5e3, 7]", 1) == [12500.0, 7]
+    assert parse_in_chunks(b"[12.5e3, 7]", 4) == [12500.0, 7]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_stream_result_object(client):
+    """Tests streaming the records of a container's result object."""
+    records = [{"profile": index} for index in range(50)]
+    respx.get(f"{client._base_url_v2}/containers/fetch-result-object?id=7").mock(
+        return_value=Response(200, content=json.dumps(records).encode())
+    )
+
+    streamed = [record async for record in client.containers.stream_result_object("7")]
+
+    assert streamed == records
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_download_result_object(client, tmp_path):
+    """Tests writing a result object straight to a file."""
+    body = b'{"result": "some data"}'
+    respx.get(f"{client._base_url_v2}/containers/fetch-result-object?id=7").mock(
+        return_value=Response(200, content=body)
+    )
+
+    written = await client.containers.download_result_object("7", tmp_path / "result.json")
+
+    assert written == len(body)
+    assert (tmp_path / "result.json").read_bytes() == body
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_stream_maps_errors(client):
+    """Tests that streamed requests raise the usual SDK exceptions."""
+    respx.get(f"{client._base_url_v2}/containers/fetch-result-object?id=8").mock(
+        return_value=Response(404, text="missing")
+    )
+
+    with pytest.raises(NotFoundError, match="missing"):
+        async for _ in client.containers.stream_result_object("8"):
+            pass
+    await client.close()
+
+
+def test_coerce_value():
+    """Tests that only unambiguous numbers are converted."""
+    assert coerce_value("42") == 42
+    assert coerce_value("-1.5e2") == -150.0
+    assert coerce_value("007") == "007"
+    assert coerce_value("") is None
+    assert coerce_value("agent") == "agent"
+
+
+@pytest.mark.parametrize("size", [1, 5, 4096])
+def test_csv_records_across_chunks(size):
+    """Tests CSV records split at any byte, including quoted newlines."""
+    document = 'id,name,note\r\n1,"café","two\nlines"\r\n2,plain,"a ""quote"""\r\n'.encode()
+    parser = CSVStreamParser()
+    records = []
+    for index in range(0, len(document), size):
+        records.extend(parser.feed(document[index:index + size]))
+    records.extend(parser.close())
+
+    assert records == [
+        ["id", "name", "note"],
+        ["1", "café", "two\nlines"],
+        ["2", "plain", 'a "quote"'],
+    ]
+
+
+def test_column_builder_promotes_types():
+    """Tests that columns widen from int to float to string as needed."""
+    builder = ColumnBuilder(["count", "duration", "label"])
+    builder.append(["1", "2", "3"])
+    builder.append(["", "2.5", "x"])
+
+    columns = builder.columns()
+    assert columns["count"] == array("q", [1, 0])
+    assert columns["duration"] == array("d", [2.0, 2.5])
+    assert columns["label"] == ["3", "x"]
+
+
+def test_column_builder_falls_back_losslessly():
+    """Tests that a column falling back to strings keeps every field's text."""
+    builder = ColumnBuilder(["mixed", "id", "exponent"])
+    for record in (["1", "7", "1e3"], ["2.5", "", "+2"], ["", "123456789012345678901234", "x"]):
+        builder.append(record)
+
+    columns = builder.columns()
+    assert columns["id"] == ["7", None, "123456789012345678901234"]
+    assert columns["exponent"] == ["1e3", "+2", "x"]
+    builder.append(["abc", "1", "y"])
+    assert builder.columns()["mixed"] == ["1", "2.5", None, "abc"]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_stream_agent_usage(client):
+    """Tests streaming typed rows of the agent usage export."""
+    respx.get(f"{client._base_url_v2}/orgs/export-agent-usage").mock(
+        return_value=Response(200, text="agentId,name,executionTime\n1,First,12.5\n2,Second,\n")
+    )
+
+    rows = [row async for row in client.orgs.stream_agent_usage()]
+
+    assert rows == [
+        {"agentId": 1, "name": "First", "executionTime": 12.5},
+        {"agentId": 2, "name": "Second", "executionTime": None},
+    ]
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_export_container_usage_columns(client):
+    """Tests loading the container usage export into columns."""
+    respx.get(f"{client._base_url_v2}/orgs/export-container-usage").mock(
+        return_value=Response(200, text="containerId,duration\n10,5\n11,7\n")
+    )
+
+    columns = await client.orgs.export_container_usage_columns()
+
+    assert columns == {"containerId": array("q", [10, 11]), "duration": array("q", [5, 7])}
+    await client.close()
@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from ..client import PhantombusterClient
+from ..config import PhantombusterConfig, RetryConfig
+from ..mock_server import MockPhantomBuster, MockServerConfig
+from ..watcher import ContainerWatcher
+from ..__global_exceptions__ import AuthenticationError, NotFoundError
+from ..__global_models__ import Container
+
+
+@pytest.fixture
+def config():
+    """Provides a mock PhantombusterConfig without retries or coalescing."""
+    return PhantombusterConfig(
+        api_key="test_api_key", retry=RetryConfig(max_attempts=1), coalesce_gets=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_one_poll_per_tick_for_many_containers(config):
+    """Tests that many containers cost one poll per tick plus one fetch each at the end."""
+    mock = MockPhantomBuster(MockServerConfig(slots=20, container_duration=0.1))
+    client = PhantombusterClient.create(config, transport=mock)
+    launched = [await client.agents.launch(agent_id) for agent_id in range(20)]
+
+    async with ContainerWatcher(client, min_interval=0.02, max_interval=0.04) as watcher:
+        finished = [c async for c in watcher.completions(c.id for c in launched)]
+
+    assert sorted(c.id for c in finished) == sorted(c.id for c in launched)
+    assert {c.status for c in finished} == {"finished"}
+    assert mock.requests["v2:/orgs/fetch-running-containers"] == watcher.ticks
+    assert watcher.ticks <= 8
+    assert mock.requests["v2:/containers/fetch"] == 20
+    assert watcher.watching == 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_futures_are_shared_and_resolve(config):
+    """Tests that watching a container twice shares one future."""
+    mock = MockPhantomBuster(MockServerConfig(container_duration=0.05))
+    client = PhantombusterClient.create(config, transport=mock)
+    container = await client.agents.launch(1)
+    watcher = ContainerWatcher(client, min_interval=0.01, max_interval=0.02)
+
+    assert watcher.watch(container.id) is watcher.watch(str(container.id))
+    first, second = await asyncio.gather(watcher.wait(container.id), watcher.wait(container.id))
+    assert first.status == second.status == "finished"
+    await watcher.close()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_backs_off_while_nothing_finishes(config):
+    """Tests that the interval doubles while nothing finishes and resets on new watches."""
+    mock = MockPhantomBuster(MockServerConfig(container_duration=10))
+    client = PhantombusterClient.create(config, transport=mock)
+    container = await client.agents.launch(1)
+    watcher = ContainerWatcher(client, min_interval=0.01, max_interval=0.08)
+
+    watcher.watch(container.id)
+    await asyncio.sleep(0.3)
+    assert 4 <= watcher.ticks <= 7
+    assert mock.requests.get("v2:/containers/fetch", 0) == 0
+
+    ticks = watcher.ticks
+    assert (await watcher.wait(12)).status == "finished"
+    assert watcher.ticks == ticks + 1
+    await watcher.close()
+    assert watcher.watching == 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_errors_fail_the_futures(config, monkeypatch):
+    """Tests that unknown containers and rejected keys fail their futures."""
+    client = PhantombusterClient.create(config, transport=MockPhantomBuster())
+
+    async def fetch(container_id):
+        if container_id == "404":
+            raise NotFoundError("No such container.", 404)
+        return Container(id=int(container_id), status="finished")
+
+    monkeypatch.setattr(client.containers, "fetch", fetch)
+    watcher = ContainerWatcher(client, min_interval=0.01)
+    with pytest.raises(NotFoundError):
+        await watcher.wait(404)
+
+    async def fetch_running_containers():
+        raise AuthenticationError("Invalid API key.", 401)
+
+    monkeypatch.setattr(client.orgs, "fetch_running_containers", fetch_running_containers)
+    with pytest.raises(AuthenticationError):
+        await watcher.wait(1)
+    await watcher.close()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_unexpected_errors_fail_the_futures(config, monkeypatch):
+    """Tests that errors other than API errors fail the futures instead of hanging them."""
+    client = PhantombusterClient.create(config, transport=MockPhantomBuster())
+
+    async def fetch(container_id):
+        raise ValueError("Malformed container.")
+
+    monkeypatch.setattr(client.containers, "fetch", fetch)
+    watcher = ContainerWatcher(client, min_interval=0.01)
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(watcher.wait(1), 1)
+
+    async def fetch_running_containers():
+        raise KeyError("containers")
+
+    monkeypatch.setattr(client.orgs, "fetch_running_containers", fetch_running_containers)
+    with pytest.raises(KeyError):
+        await asyncio.wait_for(watcher.wait(2), 1)
+    assert watcher.watching == 0
+    await watcher.close()
+    await client.close()
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    TypeVar,
+)
 
 from ..__global_models__ import (
     Agent,
@@ -9,9 +18,13 @@ from ..__global_models__ import (
     LaunchAgentRequest,
     SaveAgentRequest,
 )
+from ..deadlines import current_deadline
 
 if TYPE_CHECKING:
     from ..client import PhantombusterClient
+    from ..launcher import LaunchOutcome
+
+ResultT = TypeVar("ResultT")
 
 
 class AgentsAPI:
@@ -29,7 +42,7 @@ class AgentsAPI:
             A list of Agent objects.
         """
         response = await self._client._request(method="GET", url="/agents/fetch-all")
-        return AgentListResponse.model_validate(response.json()).agents
+        return self._client._parse(AgentListResponse, response).agents
 
     async def launch(self, agent_id: int) -> Container:
         """Launches an agent.
@@ -46,7 +59,93 @@ class AgentsAPI:
             url="/agents/launch",
             json=request_data.model_dump(),
         )
-        return Container.model_validate(response.json())
+        return self._client._parse(Container, response)
+
+    async def launch_many(self, agent_ids: Iterable[int], **options: Any) -> list[LaunchOutcome]:
+        """Launches many agents, as fast as the organization's slots allow.
+
+        Args:
+            agent_ids: The IDs of the agents to launch, in launch order.
+            **options: Options of ``launcher.BulkLauncher``, such as
+                ``reserve`` or ``max_attempts``.
+
+        Returns:
+            One LaunchOutcome per agent, in the order of ``agent_ids``.
+        """
+        from ..launcher import BulkLauncher
+
+        return await BulkLauncher(self._client, **options).run(agent_ids)
+
+    async def launch_and_wait(self, agent_id: int, timeout: float | None = None) -> Container:
+        """Launches an agent and waits for its run to finish.
+
+        Runs are waited for by the client's shared ``watcher``, so any
+        number of concurrent waiters cost one poll per tick between them.
+
+        Args:
+            agent_id: The ID of the agent to launch.
+            timeout: Most seconds to wait, launch included. Combined with
+                any deadline from the context.
+
+        Returns:
+            The finished Container.
+
+        Raises:
+            DeadlineExceededError: If the run has not finished in time. The
+                run itself keeps going.
+        """
+        return await self._bounded(timeout, lambda: self._launch_and_wait(agent_id))
+
+    async def launch_and_fetch_result(
+        self, agent_id: int, timeout: float | None = None
+    ) -> Dict[str, Any]:
+        """Launches an agent, waits for its run and fetches its result object.
+
+        Args:
+            agent_id: The ID of the agent to launch.
+            timeout: Most seconds for the launch, the wait and the fetch.
+
+        Returns:
+            A dictionary representing the result object.
+        """
+
+        async def run() -> Dict[str, Any]:
+            container = await self._launch_and_wait(agent_id)
+            return await self._client.containers.fetch_result_object(str(container.id))
+
+        return await self._bounded(timeout, run)
+
+    async def launch_and_stream_result(
+        self, agent_id: int, timeout: float | None = None
+    ) -> AsyncIterator[Any]:
+        """Launches an agent and streams its result object once the run finishes.
+
+        The result starts streaming as soon as the watcher sees the run
+        finish, and records are yielded as they arrive.
+
+        Args:
+            agent_id: The ID of the agent to launch.
+            timeout: Most seconds for the launch and the wait; reading the
+                result is not bounded by it.
+
+        Yields:
+            The records of the result object.
+        """
+        container = await self.launch_and_wait(agent_id, timeout)
+        async for record in self._client.containers.stream_result_object(str(container.id)):
+            yield record
+
+    async def _launch_and_wait(self, agent_id: int) -> Container:
+        container = await self.launch(agent_id)
+        return await self._client.watcher.wait(container.id)
+
+    async def _bounded(
+        self, timeout: float | None, call: Callable[[], Awaitable[ResultT]]
+    ) -> ResultT:
+        at = current_deadline(timeout)
+        if at is None:
+            return await call()
+        return await self._client._bounded(at, call)
 
     async def save(
         self, name: str, script_id: int, agent_id: int | None = None
@@ -67,5 +166,5 @@ class AgentsAPI:
             url="/agents/save",
             json=request_data.model_dump(exclude_none=True),
         )
-        return Agent.model_validate(response.json())
+        return self._client._parse(Agent, response)
 
@@ -54,4 +54,4 @@ class AIAPI:
             url="/ai/completions",
             json=request_data.model_dump(exclude_none=True),
         )
-        return AICompletionsResponse.model_validate(response.json())
+        return self._client._parse(AICompletionsResponse, response)
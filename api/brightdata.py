@@ -60,4 +60,4 @@ class BrightDataAPI:
             url="/brightdata/serp",
             params=params.model_dump(exclude_none=True),
         )
-        return response.json()
+        return self._client._json(response)
@@ -36,7 +36,7 @@ class CaptchaAPI:
             url="/hcaptcha",
             json=request_data.model_dump(),
         )
-        return CaptchaResponse.model_validate(response.json())
+        return self._client._parse(CaptchaResponse, response)
 
     async def solve_recaptcha(self, sitekey: str, pageurl: str) -> CaptchaResponse:
         """Solves a reCAPTCHA challenge.
@@ -54,4 +54,4 @@ class CaptchaAPI:
             url="/recaptcha",
             json=request_data.model_dump(),
         )
-        return CaptchaResponse.model_validate(response.json())
+        return self._client._parse(CaptchaResponse, response)
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict
+import asyncio
+import os
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict
 
 from ..__global_models__ import Container, ContainerListResponse
+from ..compact import ContainerTable
+from ..lazy_models import LazyModelList
+from ..streaming import JSONStreamParser
 
 if TYPE_CHECKING:
     from ..client import PhantombusterClient
@@ -28,21 +33,105 @@ class ContainersAPI:
         response = await self._client._request(
             method="GET", url=f"/containers/fetch?id={container_id}"
         )
-        return Container.model_validate(response.json())
+        return self._client._parse(Container, response)
 
-    async def fetch_all(self, agent_id: str) -> list[Container]:
+    async def fetch_all(
+        self, agent_id: str, lazy: bool = False, compact: bool = False
+    ) -> list[Container] | LazyModelList[Container] | ContainerTable:
         """Fetches all containers for a given agent.
 
         Args:
             agent_id: The ID of the agent.
+            lazy: Return a LazyModelList that builds each Container only
+                when it is accessed, instead of building them all up front.
+            compact: Return a column-oriented ContainerTable instead of models,
+                filled as the response arrives.
 
         Returns:
-            A list of Container objects.
+            A list of Container objects, a LazyModelList of them with
+            ``lazy``, or a ContainerTable with ``compact``.
         """
+        if lazy and compact:
+            raise ValueError("Only one of lazy and compact can be set.")
+        url = f"/containers/fetch-all?agentId={agent_id}"
+        if compact:
+            return await self._client._stream_table(
+                ContainerTable(), "containers", method="GET", url=url
+            )
+        response = await self._client._request(method="GET", url=url)
+        if lazy:
+            return self._client._parse_lazy(Container, response, "containers")
+        return self._client._parse(ContainerListResponse, response).containers
+
+    async def iter_all(
+        self, agent_id: str, page_size: int = 100, prefetch: bool = True
+    ) -> AsyncIterator[Container]:
+        """Iterates over the containers of a given agent, one page at a time.
+
+        Pages are requested newest first with the ``limit`` and ``beforeId``
+        parameters, so the first containers are available after one small
+        request and stopping early skips the remaining pages. If the API
+        answers with the whole history instead of a page, it is iterated
+        from that single response, and if it ignores ``beforeId``, the
+        containers older than the first pages are read with one
+        :meth:`fetch_all`.
+
+        Args:
+            agent_id: The ID of the agent.
+            page_size: Containers requested per page.
+            prefetch: Request the next page while the current one is being
+                consumed.
+
+        Yields:
+            Container objects, newest first.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1.")
+        before: int | None = None
+        next_page: asyncio.Future[list[Container]] | None = None
+        try:
+            page = await self._page(agent_id, page_size, before)
+            while True:
+                if len(page) > page_size:
+                    # The API ignored the paging parameters.
+                    for container in page:
+                        yield container
+                    return
+                if before is not None and any(c.id is None or c.id >= before for c in page):
+                    # The API honored limit but not beforeId, so paging would
+                    # repeat the first page; read the rest in one request.
+                    history = await self.fetch_all(agent_id)
+                    rest = [c for c in history if c.id is not None and c.id < before]
+                    for container in sorted(rest, key=lambda c: c.id, reverse=True):
+                        yield container
+                    return
+                more = len(page) == page_size and page[-1].id is not None
+                if more:
+                    before = min(c.id for c in page)
+                    if prefetch:
+                        next_page = asyncio.ensure_future(self._page(agent_id, page_size, before))
+                for container in page:
+                    yield container
+                if not more:
+                    return
+                if next_page is not None:
+                    page, next_page = await next_page, None
+                else:
+                    page = await self._page(agent_id, page_size, before)
+        finally:
+            if next_page is not None:
+                if next_page.done() and not next_page.cancelled():
+                    next_page.exception()
+                next_page.cancel()
+
+    async def _page(self, agent_id: str, limit: int, before: int | None) -> list[Container]:
+        params: dict[str, Any] = {"agentId": agent_id, "limit": limit}
+        if before is not None:
+            params["beforeId"] = before
         response = await self._client._request(
-            method="GET", url=f"/containers/fetch-all?agentId={agent_id}"
+            method="GET", url="/containers/fetch-all", params=params
         )
-        return ContainerListResponse.model_validate(response.json()).containers
+        return self._client._parse(ContainerListResponse, response).containers
 
     async def fetch_result_object(self, container_id: str) -> Dict[str, Any]:
         """Fetches the result object for a given container.
@@ -56,5 +145,54 @@ class ContainersAPI:
         response = await self._client._request(
             method="GET", url=f"/containers/fetch-result-object?id={container_id}"
         )
-        return response.json()
+        return self._client._json(response)
+
+
+    async def stream_result_object(self, container_id: str) -> AsyncIterator[Any]:
+        """Streams the result object for a given container, one record at a time.
+
+        The body is parsed incrementally as it arrives, so memory use stays
+        flat however large the result object is. The items of a top-level
+        array are yielded one by one; for a top-level object each member is
+        yielded as a ``(key, value)`` tuple.
+
+        Args:
+            container_id: The ID of the container.
+
+        Yields:
+            The top-level records of the result object.
+        """
+        async with self._client._stream(
+            method="GET", url=f"/containers/fetch-result-object?id={container_id}"
+        ) as response:
+            parser = JSONStreamParser()
+            async for chunk in response.aiter_bytes():
+                for record in parser.feed(chunk):
+                    yield record
+            for record in parser.close():
+                yield record
+
+    async def download_result_object(
+        self, container_id: str, path: str | os.PathLike[str]
+    ) -> int:
+        """Writes the raw result object for a given container to a file.
+
+        The body is copied to disk chunk by chunk without being parsed or
+        held in memory.
+
+        Args:
+            container_id: The ID of the container.
+            path: The file to write the result object to.
 
+        Returns:
+            The number of bytes written.
+        """
+        written = 0
+        async with self._client._stream(
+            method="GET", url=f"/containers/fetch-result-object?id={container_id}"
+        ) as response:
+            with open(path, "wb") as file:
+                async for chunk in response.aiter_bytes():
+                    file.write(chunk)
+                    written += len(chunk)
+        return written
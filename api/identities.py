@@ -32,4 +32,4 @@ class IdentitiesAPI:
             url="/identities/save-with-token",
             json=request_data.model_dump(),
         )
-        return Identity.model_validate(response.json())
+        return self._client._parse(Identity, response)
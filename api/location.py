@@ -23,4 +23,4 @@ class LocationAPI:
             The location information for the IP address.
         """
         response = await self._client._request(method="GET", url="/location/ip")
-        return LocationInfo.model_validate(response.json())
+        return self._client._parse(LocationInfo, response)
@@ -10,6 +10,8 @@ from ..__global_models__ import (
     SaveLeadRequest,
     SuccessResponse,
 )
+from ..compact import LeadTable
+from ..lazy_models import LazyModelList
 
 if TYPE_CHECKING:
     from ..client import PhantombusterClient
@@ -23,19 +25,31 @@ class OrgStorageAPI:
     def __init__(self, client: PhantombusterClient):
         self._client = client
 
-    async def fetch_leads_by_list(self, list_id: int) -> list[Lead]:
+    async def fetch_leads_by_list(
+        self, list_id: int, lazy: bool = False, compact: bool = False
+    ) -> list[Lead] | LazyModelList[Lead] | LeadTable:
         """Fetches leads by their list ID.
 
         Args:
             list_id: The ID of the list to fetch leads from.
+            lazy: Return a LazyModelList that builds each Lead only when it
+                is accessed, instead of building them all up front.
+            compact: Return a column-oriented LeadTable instead of models,
+                filled as the response arrives.
 
         Returns:
-            A list of Lead objects.
+            A list of Lead objects, a LazyModelList of them with ``lazy``,
+            or a LeadTable with ``compact``.
         """
-        response = await self._client._request(
-            method="POST", url=f"/org-storage/leads/by-list/{list_id}"
-        )
-        return LeadListResponse.model_validate(response.json()).leads
+        if lazy and compact:
+            raise ValueError("Only one of lazy and compact can be set.")
+        url = f"/org-storage/leads/by-list/{list_id}"
+        if compact:
+            return await self._client._stream_table(LeadTable(), "leads", method="POST", url=url)
+        response = await self._client._request(method="POST", url=url)
+        if lazy:
+            return self._client._parse_lazy(Lead, response, "leads")
+        return self._client._parse(LeadListResponse, response).leads
 
     async def save_lead(
         self, list_id: int, data: dict[str, Any], lead_id: int | None = None
@@ -56,7 +70,7 @@ class OrgStorageAPI:
             url="/org-storage/leads/save",
             json=request_data.model_dump(exclude_none=True),
         )
-        return Lead.model_validate(response.json())
+        return self._client._parse(Lead, response)
 
     async def delete_many_leads(self, lead_ids: list[int]) -> SuccessResponse:
         """Deletes many leads.
@@ -73,7 +87,7 @@ class OrgStorageAPI:
             url="/org-storage/leads/delete-many",
             json=request_data.model_dump(),
         )
-        return SuccessResponse.model_validate(response.json())
+        return self._client._parse(SuccessResponse, response)
 
     async def delete_list(self, list_id: int) -> SuccessResponse:
         """Deletes a list.
@@ -90,4 +104,4 @@ class OrgStorageAPI:
             url="/org-storage/lists/delete",
             json=request_data.model_dump(),
         )
-        return SuccessResponse.model_validate(response.json())
+        return self._client._parse(SuccessResponse, response)
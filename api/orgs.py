@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import sys
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
 from ..__global_models__ import (
     OrgResources,
@@ -9,6 +10,7 @@ from ..__global_models__ import (
     AgentGroup,
     AgentGroupListResponse,
 )
+from ..streaming import ColumnBuilder, CSVStreamParser, coerce_value
 
 if TYPE_CHECKING:
     from ..client import PhantombusterClient
@@ -31,7 +33,7 @@ class OrgsAPI:
         response = await self._client._request(
             method="GET", url="/orgs/fetch-resources"
         )
-        return OrgResources.model_validate(response.json())
+        return self._client._parse(OrgResources, response)
 
     async def export_agent_usage(self) -> str:
         """Exports agent usage as a CSV string.
@@ -53,7 +55,7 @@ class OrgsAPI:
         response = await self._client._request(
             method="GET", url="/orgs/fetch-running-containers"
         )
-        return ContainerListResponse.model_validate(response.json()).containers
+        return self._client._parse(ContainerListResponse, response).containers
 
     async def fetch_agent_groups(self) -> list[AgentGroup]:
         """Fetches the agent groups for the current organization.
@@ -64,7 +66,7 @@ class OrgsAPI:
         response = await self._client._request(
             method="GET", url="/orgs/fetch-agent-groups"
         )
-        return AgentGroupListResponse.model_validate(response.json()).agent_groups
+        return self._client._parse(AgentGroupListResponse, response).agent_groups
 
     async def export_container_usage(self) -> str:
         """Exports container usage as a CSV string.
@@ -76,3 +78,74 @@ class OrgsAPI:
             method="GET", url="/orgs/export-container-usage"
         )
         return response.text
+
+    async def stream_agent_usage(self) -> AsyncIterator[dict[str, Any]]:
+        """Streams the agent usage export as typed rows.
+
+        Rows are parsed as the CSV arrives, with numeric fields converted
+        to ``int``/``float`` and empty fields to ``None``.
+
+        Yields:
+            One dictionary per row, keyed by column name.
+        """
+        async for row in self._stream_csv("/orgs/export-agent-usage"):
+            yield row
+
+    async def stream_container_usage(self) -> AsyncIterator[dict[str, Any]]:
+        """Streams the container usage export as typed rows.
+
+        Yields:
+            One dictionary per row, keyed by column name.
+        """
+        async for row in self._stream_csv("/orgs/export-container-usage"):
+            yield row
+
+    async def export_agent_usage_columns(self, use_numpy: bool = False) -> dict[str, Any]:
+        """Loads the agent usage export column by column.
+
+        Args:
+            use_numpy: Return numeric columns as NumPy arrays. Requires numpy.
+
+        Returns:
+            A mapping of column name to an ``array``/NumPy array for numeric
+            columns or a list of strings otherwise.
+        """
+        return await self._csv_columns("/orgs/export-agent-usage", use_numpy)
+
+    async def export_container_usage_columns(self, use_numpy: bool = False) -> dict[str, Any]:
+        """Loads the container usage export column by column.
+
+        Args:
+            use_numpy: Return numeric columns as NumPy arrays. Requires numpy.
+
+        Returns:
+            A mapping of column name to an ``array``/NumPy array for numeric
+            columns or a list of strings otherwise.
+        """
+        return await self._csv_columns("/orgs/export-container-usage", use_numpy)
+
+    async def _csv_records(self, url: str) -> AsyncIterator[list[str]]:
+        async with self._client._stream(method="GET", url=url) as response:
+            parser = CSVStreamParser()
+            async for chunk in response.aiter_bytes():
+                for record in parser.feed(chunk):
+                    yield record
+            for record in parser.close():
+                yield record
+
+    async def _stream_csv(self, url: str) -> AsyncIterator[dict[str, Any]]:
+        header = None
+        async for record in self._csv_records(url):
+            if header is None:
+                header = [sys.intern(name) for name in record]
+                continue
+            yield {name: coerce_value(value) for name, value in zip(header, record)}
+
+    async def _csv_columns(self, url: str, use_numpy: bool) -> dict[str, Any]:
+        builder = None
+        async for record in self._csv_records(url):
+            if builder is None:
+                builder = ColumnBuilder(record)
+            else:
+                builder.append(record)
+        return builder.columns(use_numpy) if builder is not None else {}
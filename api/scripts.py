@@ -36,7 +36,7 @@ class ScriptsAPI:
         response = await self._client._request(
             method="GET", url=f"/scripts/fetch?id={script_id}"
         )
-        return Script.model_validate(response.json())
+        return self._client._parse(Script, response)
 
     async def fetch_all(self) -> list[Script]:
         """Fetches all scripts for the current user.
@@ -45,21 +45,36 @@ class ScriptsAPI:
             A list of Script objects.
         """
         response = await self._client._request(method="GET", url="/scripts/fetch-all")
-        return ScriptListResponse.model_validate(response.json()).scripts
+        return self._client._parse(ScriptListResponse, response).scripts
 
-    async def get_code(self, script_id: str) -> str:
+    async def get_code(self, script_id: str, version: int | None = None) -> str:
         """Gets the code of a script.
 
+        When the client has a script cache configured, the code is served
+        from disk if ``version`` was downloaded before. Otherwise the script
+        is fetched and its code stored under the version the API reports
+        with it, so a stale ``version`` never labels newer code.
+
         Args:
             script_id: The ID of the script.
+            version: The script's current version, e.g. from ``fetch_all``.
 
         Returns:
             The script code as a string.
         """
-        response = await self._client._request(
-            method="GET", url=f"/scripts/code?id={script_id}"
-        )
-        return response.text
+        store = self._client._script_store
+        if store is None:
+            response = await self._client._request(
+                method="GET", url=f"/scripts/code?id={script_id}"
+            )
+            return response.text
+        if version is not None:
+            code = store.get(script_id, version)
+            if code is not None:
+                return code
+        script = await self.fetch(script_id)
+        store.put(script_id, script.version, script.script)
+        return script.script
 
     async def set_visibility(self, script_id: str, visibility: str) -> SuccessResponse:
         """Updates the visibility of a script.
@@ -77,7 +92,7 @@ class ScriptsAPI:
             url="/scripts/visibility",
             json=request_data.model_dump(),
         )
-        return SuccessResponse.model_validate(response.json())
+        return self._client._parse(SuccessResponse, response)
 
     async def set_access_list(
         self, script_id: str, access_list: list[str]
@@ -99,7 +114,7 @@ class ScriptsAPI:
             url="/scripts/access-list",
             json=request_data.model_dump(by_alias=True),
         )
-        return SuccessResponse.model_validate(response.json())
+        return self._client._parse(SuccessResponse, response)
 
     async def save(
         self, script: str, script_id: str | None = None, name: str | None = None
@@ -123,7 +138,7 @@ class ScriptsAPI:
             url="/scripts/save",
             json=request_data.model_dump(exclude_none=True),
         )
-        return SuccessResponse.model_validate(response.json())
+        return self._client._parse(SuccessResponse, response)
 
     async def delete(self, script_id: str) -> SuccessResponse:
         """Deletes a script by its ID.
@@ -140,4 +155,4 @@ class ScriptsAPI:
             url="/scripts/delete",
             json=request_data.model_dump(),
         )
-        return SuccessResponse.model_validate(response.json())
+        return self._client._parse(SuccessResponse, response)
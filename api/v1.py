@@ -30,7 +30,7 @@ class V1API:
             url=f"/agent/{agent_id}",
             api_version="v1",
         )
-        return Agent.model_validate(response.json())
+        return self._client._parse(Agent, response)
 
     async def get_script_by_name(self, mode: str, name: str) -> Script:
         """Get a script record by its name.
@@ -47,7 +47,7 @@ class V1API:
             url=f"/script/by-name/{mode}/{name}",
             api_version="v1",
         )
-        return Script.model_validate(response.json())
+        return self._client._parse(Script, response)
 
     async def get_user(self) -> User:
         """Get information about your Phantombuster account.
@@ -60,4 +60,4 @@ class V1API:
             url="/user",
             api_version="v1",
         )
-        return User.model_validate(response.json())
+        return self._client._parse(User, response)
@@ -0,0 +1,79 @@
+"""
+Runs the whole benchmark suite and prints one JSON object per result.
+
+Every result carries a ``benchmark`` field naming the benchmark it comes
+from, and the first line describes the environment, so runs of two
+releases can be diffed line by line:
+
+    python -m phantombuster.benchmarks --output results.jsonl
+    python -m phantombuster.benchmarks --quick
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Iterator
+
+from . import decode, import_time, memory, throughput
+
+
+def environment() -> dict[str, Any]:
+    """Describes the interpreter and dependency versions the suite ran with."""
+    versions = {}
+    for package in ("httpx", "pydantic", "pydantic-core", "orjson"):
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = None
+    return {
+        "benchmark": "environment",
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        **versions,
+    }
+
+
+def run(quick: bool = False) -> Iterator[dict[str, Any]]:
+    """Runs every benchmark, yielding results as they are produced.
+
+    Args:
+        quick: Use small sizes, for a smoke run rather than a measurement.
+    """
+    yield environment()
+    requests, items = (200, 2000) if quick else (2000, 50000)
+    for result in throughput.run([1, 8, 32, 128], requests):
+        yield {"benchmark": "throughput", **result}
+    for result in throughput.run([1, 32], requests // 2, latency=0.005, distribution="lognormal"):
+        yield {"benchmark": "throughput", **result}
+    for result in decode.run(items // 2, repeat=1 if quick else 3):
+        yield {"benchmark": "decode", **result}
+    for result in memory.run(items):
+        yield {"benchmark": "memory", **result}
+    for result in import_time.run(repeat=1 if quick else 5):
+        yield {"benchmark": "import_time", **result}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="Small sizes for a smoke run.")
+    parser.add_argument("--output", help="Also write the results to this JSON lines file.")
+    args = parser.parse_args(argv)
+    output = open(args.output, "w") if args.output else None
+    try:
+        for result in run(args.quick):
+            line = json.dumps(result)
+            print(line, flush=True)
+            if output is not None:
+                output.write(line + "\n")
+    finally:
+        if output is not None:
+            output.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,130 @@
+"""
+Benchmark of response decoding and model construction.
+
+Compares the previous ``model_validate(response.json())`` path with the
+client's validated path (pydantic-core parsing the body directly) and
+its trusted path for each JSON backend, on large list responses:
+
+    python -m phantombuster.benchmarks.decode --items 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Callable
+
+from ..__global_models__ import AgentListResponse, ContainerListResponse, LeadListResponse
+from ..decoding import construct_trusted, json_loader
+
+
+def lead_payload(items: int) -> dict[str, Any]:
+    """Returns a ``LeadListResponse`` body with ``items`` leads."""
+    return {
+        "leads": [
+            {
+                "id": index,
+                "data": {
+                    "firstName": f"First{index}",
+                    "lastName": f"Last{index}",
+                    "company": f"Company {index % 500}",
+                    "profileUrl": f"https://www.linkedin.com/in/profile-{index}",
+                    "connections": index % 1000,
+                },
+            }
+            for index in range(items)
+        ]
+    }
+
+
+def container_payload(items: int) -> dict[str, Any]:
+    """Returns a ``ContainerListResponse`` body with ``items`` containers."""
+    return {
+        "containers": [
+            {"id": index, "agent_id": index % 100, "status": "finished"} for index in range(items)
+        ]
+    }
+
+
+def agent_payload(items: int) -> dict[str, Any]:
+    """Returns an ``AgentListResponse`` body with ``items`` agents."""
+    return {
+        "agents": [
+            {"id": index, "name": f"Agent {index}", "script_id": index % 50, "org_id": 1}
+            for index in range(items)
+        ]
+    }
+
+
+PAYLOADS = {
+    "LeadListResponse": (LeadListResponse, lead_payload),
+    "ContainerListResponse": (ContainerListResponse, container_payload),
+    "AgentListResponse": (AgentListResponse, agent_payload),
+}
+
+
+def _best_of(repeat: int, function: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run(items: int = 20000, repeat: int = 3) -> list[dict[str, Any]]:
+    """Times every decode path on every payload.
+
+    Returns:
+        One result per payload and path, with the best time in seconds and
+        the speedup over ``json.loads`` + ``model_validate``.
+    """
+    backends = ["json"]
+    try:
+        json_loader("orjson")
+        backends.append("orjson")
+    except ImportError:
+        pass
+
+    results = []
+    for name, (model, build) in PAYLOADS.items():
+        body = json.dumps(build(items)).encode()
+        paths: dict[str, Callable[[], Any]] = {
+            "json+model_validate": lambda model=model: model.model_validate(json.loads(body)),
+            "model_validate_json": lambda model=model: model.model_validate_json(body),
+        }
+        for backend in backends:
+            loads = json_loader(backend)
+            paths[f"{backend}+trusted"] = (
+                lambda model=model, loads=loads: construct_trusted(model, loads(body))
+            )
+        baseline = None
+        for path, function in paths.items():
+            seconds = _best_of(repeat, function)
+            if baseline is None:
+                baseline = seconds
+            results.append(
+                {
+                    "payload": name,
+                    "items": items,
+                    "bytes": len(body),
+                    "path": path,
+                    "seconds": round(seconds, 6),
+                    "speedup": round(baseline / seconds, 2),
+                }
+            )
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=20000, help="Items per list response.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the best is kept.")
+    args = parser.parse_args(argv)
+    for result in run(args.items, args.repeat):
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
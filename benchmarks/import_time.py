@@ -0,0 +1,87 @@
+"""
+Benchmark of importing the client and building a first client.
+
+Each run starts a fresh interpreter, as in a serverless cold start or a
+short-lived CLI job. ``lazy`` imports the client and builds a client,
+which is all that happens until an API namespace is used; ``eager`` also
+loads every API namespace, which is what building a client used to cost;
+``namespaces`` is that difference on its own:
+
+    python -m phantombuster.benchmarks.import_time --repeat 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Any
+
+_PACKAGE = __package__.rpartition(".")[0]
+_NAMESPACES = (
+    "branches", "scripts", "orgs", "containers", "agents", "org_storage",
+    "identities", "brightdata", "location", "captcha", "ai", "v1",
+)
+
+_SCRIPT = """
+import time
+started = time.perf_counter()
+from {package}.client import PhantombusterClient
+from {package}.config import PhantombusterConfig
+imported = time.perf_counter()
+client = PhantombusterClient.create(PhantombusterConfig(api_key="benchmark"))
+built = time.perf_counter()
+for name in {namespaces!r}:
+    getattr(client, name)
+loaded = time.perf_counter()
+print(imported - started, built - imported, loaded - built)
+"""
+
+
+def _measure() -> tuple[float, float, float]:
+    """Runs one cold start in a new interpreter and returns its timings."""
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    script = _SCRIPT.format(package=_PACKAGE, namespaces=_NAMESPACES)
+    path = os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")]))
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        env=dict(os.environ, PYTHONPATH=path),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    imported, built, loaded = (float(value) for value in output.split())
+    return imported, built, loaded
+
+
+def run(repeat: int = 5) -> list[dict[str, Any]]:
+    """Times cold starts with and without loading every API namespace.
+
+    Returns:
+        One result per scenario, with the best time in seconds to import
+        the client and build it, plus to load every namespace for
+        ``eager``, and the speedup over ``eager``.
+    """
+    samples = [_measure() for _ in range(repeat)]
+    lazy = min(imported + built for imported, built, _ in samples)
+    eager = min(sum(sample) for sample in samples)
+    namespaces = min(loaded for _, _, loaded in samples)
+    return [
+        {"scenario": "lazy", "seconds": round(lazy, 6), "speedup": round(eager / lazy, 2)},
+        {"scenario": "eager", "seconds": round(eager, 6), "speedup": 1.0},
+        {"scenario": "namespaces", "seconds": round(namespaces, 6), "speedup": None},
+    ]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the best is kept.")
+    args = parser.parse_args(argv)
+    for result in run(args.repeat):
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark of peak memory when fetching large results.
+
+Measures, with tracemalloc, the peak memory allocated while fetching a
+large container result object and a large lead list through each of the
+client's paths. The mock API's payloads are generated before tracing
+starts, so only the client's allocations are counted:
+
+    python -m phantombuster.benchmarks.memory --items 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable
+
+from ..client import PhantombusterClient
+from ..mock_server import MockPhantomBuster, MockServerConfig
+from .throughput import unthrottled_config
+
+
+async def _drain(iterator: Any) -> int:
+    count = 0
+    async for _ in iterator:
+        count += 1
+    return count
+
+
+def _scenarios(client: PhantombusterClient, path: str) -> dict[str, Callable[[], Awaitable[Any]]]:
+    return {
+        "result_object.fetch": lambda: client.containers.fetch_result_object("1"),
+        "result_object.stream": lambda: _drain(client.containers.stream_result_object("1")),
+        "result_object.download": lambda: client.containers.download_result_object("1", path),
+        "leads.models": lambda: client.org_storage.fetch_leads_by_list(1),
+        "leads.lazy": lambda: client.org_storage.fetch_leads_by_list(1, lazy=True),
+        "leads.compact": lambda: client.org_storage.fetch_leads_by_list(1, compact=True),
+    }
+
+
+async def _measure(items: int) -> list[dict[str, Any]]:
+    mock = MockPhantomBuster(MockServerConfig(list_size=items, result_size=items))
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "result.json")
+        warm_up = PhantombusterClient.create(unthrottled_config(), transport=mock)
+        for call in _scenarios(warm_up, path).values():
+            await call()
+        await warm_up.close()
+
+        names = list(_scenarios(warm_up, path))
+        for name in names:
+            client = PhantombusterClient.create(unthrottled_config(), transport=mock)
+            call = _scenarios(client, path)[name]
+            tracemalloc.start()
+            started = time.perf_counter()
+            result = await call()
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del result
+            await client.close()
+            results.append(
+                {
+                    "scenario": name,
+                    "items": items,
+                    "peak_bytes": peak,
+                    "peak_mb": round(peak / 2 ** 20, 2),
+                    "seconds": round(elapsed, 6),
+                }
+            )
+    return results
+
+
+def run(items: int = 50000) -> list[dict[str, Any]]:
+    """Measures the peak memory of each fetch path.
+
+    Returns:
+        One result per scenario, with the peak traced memory and the time
+        the fetch took under tracing.
+    """
+    return asyncio.run(_measure(items))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=50000, help="Records and leads per fetch.")
+    args = parser.parse_args(argv)
+    for result in run(args.items):
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
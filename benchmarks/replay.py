@@ -0,0 +1,82 @@
+"""
+Benchmark that replays a recorded cassette through the client.
+
+Drives ``PhantombusterClient`` with the calls recorded by
+``cassettes.CassetteRecorder``, answered from the cassette by the mock
+API, so two SDK versions can be compared on an identical workload:
+
+    python -m phantombuster.benchmarks.replay traffic.jsonl.gz --speed 10 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+from typing import Any
+
+from ..cassettes import ReplayTransport, load, replay
+from ..client import PhantombusterClient
+from ..config import PhantombusterConfig
+from .throughput import unthrottled_config
+
+
+async def _replay(
+    path: str, speed: float, latency_scale: float, throttled: bool
+) -> dict[str, Any]:
+    interactions = load(path)
+    config = PhantombusterConfig(api_key="benchmark") if throttled else unthrottled_config()
+    client = PhantombusterClient.create(
+        config, transport=ReplayTransport(interactions, latency_scale)
+    )
+    try:
+        return await replay(client, interactions, speed)
+    finally:
+        await client.close()
+
+
+def run(
+    path: str,
+    speed: list[float] | None = None,
+    latency_scale: float = 1.0,
+    throttled: bool = False,
+) -> list[dict[str, Any]]:
+    """Replays a cassette at each speed.
+
+    Args:
+        path: The cassette file.
+        speed: How many times faster than recorded to replay; ``inf``
+            starts every call at once and is reported as null.
+        latency_scale: Factor applied to the recorded response times.
+        throttled: Keep the default rate limiter instead of disabling it.
+
+    Returns:
+        One result per speed.
+    """
+    return [
+        {
+            "speed": factor if math.isfinite(factor) else None,
+            **asyncio.run(_replay(path, factor, latency_scale, throttled)),
+        }
+        for factor in speed or [1.0]
+    ]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("cassette", help="The cassette file to replay.")
+    parser.add_argument("--speed", type=float, nargs="+", default=[1.0])
+    parser.add_argument(
+        "--latency-scale", type=float, default=1.0, help="Factor on recorded response times."
+    )
+    parser.add_argument(
+        "--throttled", action="store_true", help="Keep the client's default rate limiter."
+    )
+    args = parser.parse_args(argv)
+    for result in run(args.cassette, args.speed, args.latency_scale, args.throttled):
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
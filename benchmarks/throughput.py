@@ -0,0 +1,114 @@
+"""
+Benchmark of client throughput and latency at several concurrency levels.
+
+Drives ``PhantombusterClient`` against the in-process mock API, so what is
+measured is the SDK's own overhead plus the simulated server latency:
+
+    python -m phantombuster.benchmarks.throughput --concurrency 1 16 64 --requests 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+
+from ..client import PhantombusterClient
+from ..config import PhantombusterConfig, RateLimitConfig
+from ..mock_server import MockPhantomBuster, MockServerConfig
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Returns the ``q`` quantile of already sorted values, by nearest rank."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def unthrottled_config() -> PhantombusterConfig:
+    """Returns a client configuration whose rate limiter never delays a request."""
+    return PhantombusterConfig(
+        api_key="benchmark",
+        rate_limit=RateLimitConfig(
+            requests_per_second=1e9, burst=10 ** 9, max_rate=1e9, adaptive=False
+        ),
+    )
+
+
+async def _measure(concurrency: int, requests: int, server: MockServerConfig) -> dict[str, Any]:
+    client = PhantombusterClient.create(unthrottled_config(), transport=MockPhantomBuster(server))
+    latencies: list[float] = []
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            # Distinct IDs so that concurrent requests are not coalesced.
+            await client.containers.fetch(str(remaining))
+            latencies.append(time.perf_counter() - started)
+
+    await client.containers.fetch("0")
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    await client.close()
+
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "seconds": round(elapsed, 6),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "server_latency_ms": server.latency * 1000,
+    }
+
+
+def run(
+    concurrency: list[int] | None = None,
+    requests: int = 2000,
+    latency: float = 0.0,
+    distribution: str = "fixed",
+) -> list[dict[str, Any]]:
+    """Measures throughput and latency at each concurrency level.
+
+    Args:
+        concurrency: The numbers of requests kept in flight at once.
+        requests: Requests made at each level.
+        latency: Median simulated server latency, in seconds.
+        distribution: Shape of the simulated latency, see ``MockServerConfig``.
+
+    Returns:
+        One result per concurrency level.
+    """
+    server = MockServerConfig(latency=latency, latency_distribution=distribution, seed=0)
+    return [
+        asyncio.run(_measure(level, requests, server))
+        for level in concurrency or [1, 8, 32, 128]
+    ]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per level.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Server latency in seconds.")
+    parser.add_argument(
+        "--distribution",
+        default="fixed",
+        choices=["fixed", "uniform", "exponential", "lognormal"],
+        help="Shape of the server latency.",
+    )
+    args = parser.parse_args(argv)
+    for result in run(args.concurrency, args.requests, args.latency, args.distribution):
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
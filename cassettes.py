@@ -0,0 +1,369 @@
+"""
+Record and replay of API traffic for the PhantomBuster SDK.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import math
+import time
+from dataclasses import asdict, dataclass
+from typing import IO, TYPE_CHECKING, Any, Iterable
+
+import httpx
+
+from .mock_server import MockPhantomBuster, MockServerConfig, _Reply
+from .__global_exceptions__ import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    PhantomBusterAPIError,
+)
+
+if TYPE_CHECKING:
+    from .client import PhantombusterClient
+
+FORMAT_VERSION = 1
+
+# Recorded errors without a status that the client raised itself; any other
+# is replayed as a failed connection, which the client reports as TransportError.
+_CLIENT_ERRORS: dict[str, type[PhantomBusterAPIError]] = {
+    error.__name__: error for error in (CircuitOpenError, DeadlineExceededError)
+}
+
+
+@dataclass
+class Interaction:
+    """One recorded ``_request`` call.
+
+    Attributes:
+        offset: Seconds from the start of the recording to the call.
+        method: The HTTP method.
+        path: The URL the SDK passed, relative to the API base URL, with
+            its IDs, names and query values anonymized.
+        api_version: ``"v1"`` or ``"v2"``.
+        params: Query parameters passed separately from ``path``.
+        request: The JSON request body, anonymized.
+        request_bytes: Size of the request body.
+        status: The final status code, or None if no response arrived.
+        error: The name of the exception the call raised, if any.
+        response: The JSON response body, anonymized; None if the body
+            was not JSON.
+        response_bytes: Size of the response body.
+        duration: Seconds the call took, retries included.
+    """
+
+    offset: float
+    method: str
+    path: str
+    api_version: str = "v2"
+    params: dict[str, Any] | None = None
+    request: Any = None
+    request_bytes: int = 0
+    status: int | None = None
+    error: str | None = None
+    response: Any = None
+    response_bytes: int = 0
+    duration: float = 0.0
+
+
+def anonymize(value: Any) -> Any:
+    """Replaces every string in a JSON value with one of the same length.
+
+    Keys, numbers, booleans and the shape of the value are kept, so the
+    anonymized value costs about the same to send, decode and validate.
+    """
+    if isinstance(value, str):
+        return "x" * len(value)
+    if isinstance(value, dict):
+        return {key: anonymize(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [anonymize(item) for item in value]
+    return value
+
+
+def anonymize_path(path: str) -> str:
+    """Anonymizes the IDs, names and query values in a URL path.
+
+    Numeric segments and query values become zeros, and the other query
+    values and the segments after ``by-name`` become ``x``, each of the
+    same length. Parameter names and the other segments are kept, so the
+    path still names the same route, and an ID the mock API parses as a
+    number is still one.
+    """
+    path, _, query = path.partition("?")
+    segments = []
+    named = False
+    for segment in path.split("/"):
+        if named:
+            segments.append("x" * len(segment))
+        elif segment.isdigit():
+            segments.append("0" * len(segment))
+        else:
+            segments.append(segment)
+            named = segment == "by-name"
+    path = "/".join(segments)
+    if not query:
+        return path
+    pairs = []
+    for pair in query.split("&"):
+        name, equals, value = pair.partition("=")
+        pairs.append(name + equals + ("0" if value.isdigit() else "x") * len(value))
+    return f"{path}?{'&'.join(pairs)}"
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def load(path: str) -> list[Interaction]:
+    """Reads the interactions of a cassette written by ``CassetteRecorder``.
+
+    Raises:
+        ValueError: If the file is not a cassette of a supported version.
+    """
+    with _open(path, "r") as file:
+        header = json.loads(file.readline() or "{}")
+        if header.get("cassette") != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} cassette.")
+        return [Interaction(**json.loads(line)) for line in file if line.strip()]
+
+
+class CassetteRecorder:
+    """Records a client's ``_request`` calls to a JSON lines cassette.
+
+    The first line is a header and each following line one
+    :class:`Interaction`; a path ending in ``.gz`` is gzip-compressed.
+    URL paths, query parameters, and request and response bodies are
+    anonymized unless ``anonymize`` is False. Streamed requests, such as
+    ``stream_result_object``, are not recorded.
+
+    Example:
+        with CassetteRecorder("traffic.jsonl.gz") as recorder:
+            recorder.attach(client)
+            await run_workload(client)
+    """
+
+    def __init__(self, path: str, anonymize: bool = True):
+        self.path = path
+        self.anonymize = anonymize
+        self.recorded = 0
+        self._file = _open(path, "w")
+        self._file.write(_dumps({"cassette": FORMAT_VERSION}) + "\n")
+        self._started = time.monotonic()
+
+    def attach(self, client: PhantombusterClient) -> None:
+        """Starts recording every ``_request`` call made through ``client``."""
+        send = client._request
+
+        async def request(
+            method: str, url: str, api_version: str = "v2", **kwargs: Any
+        ) -> httpx.Response:
+            started = time.monotonic()
+            try:
+                response = await send(method, url, api_version, **kwargs)
+            except PhantomBusterAPIError as e:
+                self.record(method, url, api_version, kwargs, started, error=e)
+                raise
+            self.record(method, url, api_version, kwargs, started, response=response)
+            return response
+
+        client._request = request
+
+    def detach(self, client: PhantombusterClient) -> None:
+        """Stops recording ``client``'s calls."""
+        client.__dict__.pop("_request", None)
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        api_version: str,
+        kwargs: dict[str, Any],
+        started: float,
+        response: httpx.Response | None = None,
+        error: PhantomBusterAPIError | None = None,
+    ) -> None:
+        """Writes one call to the cassette."""
+        interaction = Interaction(
+            offset=round(started - self._started, 6),
+            method=method.upper(),
+            path=url,
+            api_version=api_version,
+            params=kwargs.get("params"),
+            duration=round(time.monotonic() - started, 6),
+        )
+        if kwargs.get("json") is not None:
+            interaction.request = kwargs["json"]
+            interaction.request_bytes = len(_dumps(kwargs["json"]).encode())
+        elif kwargs.get("content") is not None:
+            interaction.request_bytes = len(kwargs["content"])
+        if response is not None:
+            interaction.status = response.status_code
+            interaction.response_bytes = len(response.content)
+            try:
+                interaction.response = response.json()
+            except ValueError:
+                pass
+        else:
+            interaction.status = error.status_code
+            interaction.error = type(error).__name__
+        if self.anonymize:
+            interaction.path = anonymize_path(interaction.path)
+            interaction.params = anonymize(interaction.params)
+            interaction.request = anonymize(interaction.request)
+            interaction.response = anonymize(interaction.response)
+        fields = {key: value for key, value in asdict(interaction).items() if value is not None}
+        self._file.write(_dumps(fields) + "\n")
+        self.recorded += 1
+
+    def close(self) -> None:
+        """Flushes and closes the cassette file."""
+        self._file.close()
+
+    def __enter__(self) -> CassetteRecorder:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _replay_key(method: str, url: httpx.URL) -> tuple[str, str]:
+    return method.upper(), url.raw_path.decode("ascii").split("/api/", 1)[-1]
+
+
+class ReplayTransport(MockPhantomBuster):
+    """The mock API, answering recorded requests with their recorded responses.
+
+    Requests that match a recorded one by method, API version, path and
+    query get its status and body after its recorded duration, scaled by
+    ``latency_scale``; identical requests are answered in recorded order,
+    and the last answer repeats once they run out, as for retries. A call
+    recorded as failing without a status fails again with the recorded
+    error: CircuitOpenError and DeadlineExceededError as themselves, any
+    other as a failed connection. Any other request is answered by the
+    mock API.
+    """
+
+    def __init__(
+        self,
+        interactions: Iterable[Interaction],
+        latency_scale: float = 1.0,
+        config: MockServerConfig | None = None,
+    ):
+        super().__init__(config)
+        self.latency_scale = latency_scale
+        self._replies: dict[tuple[str, str], list[Interaction]] = {}
+        for interaction in interactions:
+            url = httpx.URL(f"/api/{interaction.api_version}{interaction.path}")
+            if interaction.params:
+                url = url.copy_merge_params(interaction.params)
+            key = _replay_key(interaction.method, url)
+            self._replies.setdefault(key, []).append(interaction)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        replies = self._replies.get(_replay_key(request.method, request.url))
+        if replies and replies[0].status is None:
+            with self._lock:
+                interaction = self._take(replies)
+            await asyncio.sleep(interaction.duration * self.latency_scale)
+            error = _CLIENT_ERRORS.get(interaction.error or "")
+            if error is not None:
+                raise error(f"Replayed {error.__name__}.")
+            raise httpx.ConnectError("Replayed connection failure.", request=request)
+        return await super().handle_async_request(request)
+
+    def respond(self, method: str, url: str, body: bytes = b"") -> tuple[float, _Reply]:
+        with self._lock:
+            replies = self._replies.get(_replay_key(method, httpx.URL(url)))
+            interaction = self._take(replies) if replies else None
+        if interaction is None:
+            return super().respond(method, url, body)
+        if interaction.response is not None:
+            headers = {"Content-Type": "application/json"}
+            content = _dumps(interaction.response).encode()
+        else:
+            headers = {"Content-Type": "text/plain"}
+            content = b"x" * interaction.response_bytes
+        return interaction.duration * self.latency_scale, (interaction.status, headers, content)
+
+    @staticmethod
+    def _take(replies: list[Interaction]) -> Interaction:
+        return replies.pop(0) if len(replies) > 1 else replies[0]
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, max(0, round(q * len(sorted_values)) - 1))]
+
+
+async def replay(
+    client: PhantombusterClient, interactions: list[Interaction], speed: float = 1.0
+) -> dict[str, Any]:
+    """Makes the recorded calls through ``client``, on the recorded schedule.
+
+    Each call starts at its recorded offset divided by ``speed``, whether
+    or not earlier calls have finished, so the client sees the recorded
+    arrival pattern. JSON responses are decoded, as the API methods would.
+
+    Args:
+        client: The client to drive, usually built with a ``ReplayTransport``.
+        interactions: The calls to make, as returned by :func:`load`.
+        speed: How many times faster than recorded to replay; ``math.inf``
+            starts every call at once.
+
+    Returns:
+        The number of calls and errors, the throughput, the p50 and p99
+        call latency, and how late the latest call started.
+    """
+    if speed <= 0:
+        raise ValueError("speed must be positive.")
+    latencies: list[float] = []
+    errors = 0
+    max_lag = 0.0
+    started = time.monotonic()
+
+    async def play(interaction: Interaction) -> None:
+        nonlocal errors, max_lag
+        at = started + (0.0 if math.isinf(speed) else interaction.offset / speed)
+        if at > time.monotonic():
+            await asyncio.sleep(at - time.monotonic())
+        call_started = time.monotonic()
+        max_lag = max(max_lag, call_started - at)
+        kwargs: dict[str, Any] = {}
+        if interaction.params:
+            kwargs["params"] = interaction.params
+        if interaction.request is not None:
+            kwargs["json"] = interaction.request
+        elif interaction.request_bytes:
+            kwargs["content"] = b"x" * interaction.request_bytes
+        try:
+            response = await client._request(
+                interaction.method, interaction.path, interaction.api_version, **kwargs
+            )
+            if interaction.response is not None:
+                client._json(response)
+        except PhantomBusterAPIError:
+            errors += 1
+        latencies.append(time.monotonic() - call_started)
+
+    await asyncio.gather(*(play(interaction) for interaction in interactions))
+    elapsed = time.monotonic() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": round(elapsed, 6),
+        "requests_per_second": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(_percentile(latencies, 0.5) * 1000, 3),
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 3),
+        "max_lag_ms": round(max_lag * 1000, 3),
+    }
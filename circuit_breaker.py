@@ -0,0 +1,143 @@
+"""
+Per-endpoint circuit breaker for the PhantomBuster SDK.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from .__global_exceptions__ import CircuitOpenError
+
+if TYPE_CHECKING:
+    from .config import CircuitBreakerConfig
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "successes", "opened_at", "probes")
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.successes = 0
+        self.opened_at = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """Stops sending requests to endpoints that keep failing.
+
+    Each endpoint has its own circuit. A closed circuit lets every request
+    through and opens after ``failure_threshold`` consecutive failures. An
+    open circuit fails requests immediately with :class:`CircuitOpenError`,
+    without waiting in the rate limiter, until ``reset_timeout`` has
+    passed. It is then half-open: up to ``half_open_max_calls`` probe
+    requests are let through, and ``success_threshold`` successes close
+    the circuit again while a single failure re-opens it.
+
+    Only 5xx responses and transport failures count as failures. Any other
+    response shows the endpoint is up, except a 429, which is the rate
+    limiter's business and counts as neither.
+    """
+
+    def __init__(self, config: CircuitBreakerConfig):
+        self.config = config
+        self._circuits: dict[str, _Circuit] = {}
+
+    def _circuit(self, key: str) -> _Circuit:
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit()
+        return circuit
+
+    def state(self, key: str) -> str:
+        """Returns the state of an endpoint's circuit."""
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            return CLOSED
+        if circuit.state == OPEN and self._remaining(circuit) <= 0:
+            return HALF_OPEN
+        return circuit.state
+
+    def states(self) -> dict[str, str]:
+        """Returns the state of every circuit that has seen a request."""
+        # Copied first so that another thread, such as a metrics
+        # exporter, can read the states while requests run.
+        return {key: self.state(key) for key in list(self._circuits)}
+
+    def _remaining(self, circuit: _Circuit) -> float:
+        return circuit.opened_at + self.config.reset_timeout - time.monotonic()
+
+    def before(self, key: str) -> bool:
+        """Admits a request to an endpoint.
+
+        Every admitted request must be followed by exactly one call to
+        :meth:`success`, :meth:`failure` or :meth:`release`, passing back
+        the value returned here.
+
+        Returns:
+            Whether the request is a half-open probe.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open, or it is
+                half-open and already has its probes in flight.
+        """
+        circuit = self._circuit(key)
+        if circuit.state == CLOSED:
+            return False
+        if circuit.state == OPEN:
+            remaining = self._remaining(circuit)
+            if remaining > 0:
+                raise CircuitOpenError(
+                    f"Circuit open for {key}; retry in {remaining:.1f}s.",
+                    retry_after=remaining,
+                )
+            circuit.state = HALF_OPEN
+            circuit.successes = 0
+            circuit.probes = 0
+        if circuit.probes >= self.config.half_open_max_calls:
+            raise CircuitOpenError(f"Circuit half-open for {key}; probe already in flight.")
+        circuit.probes += 1
+        return True
+
+    def success(self, key: str, probe: bool) -> None:
+        """Records that an admitted request reached a healthy endpoint."""
+        circuit = self._circuit(key)
+        if probe:
+            self.release(key, probe)
+            if circuit.state != HALF_OPEN:
+                return
+            circuit.successes += 1
+            if circuit.successes < self.config.success_threshold:
+                return
+            circuit.state = CLOSED
+        if circuit.state == CLOSED:
+            circuit.failures = 0
+
+    def failure(self, key: str, probe: bool) -> None:
+        """Records that an admitted request failed because of the endpoint."""
+        circuit = self._circuit(key)
+        if probe:
+            self.release(key, probe)
+            if circuit.state != HALF_OPEN:
+                return
+        elif circuit.state == CLOSED:
+            circuit.failures += 1
+            if circuit.failures < self.config.failure_threshold:
+                return
+        else:
+            # Admitted before the circuit opened; it is open already.
+            return
+        circuit.state = OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.failures = 0
+
+    def release(self, key: str, probe: bool) -> None:
+        """Records that an admitted request ended without telling either way."""
+        if probe:
+            circuit = self._circuit(key)
+            circuit.probes = max(0, circuit.probes - 1)
@@ -2,39 +2,105 @@
 Main client for the PhantomBuster SDK.
 """
 
-import httpx
-from threading import Lock
-from typing import Any, Dict, Optional
+import asyncio
+import functools
+import importlib
+import time
+from contextlib import asynccontextmanager
 
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from aiolimiter import AsyncLimiter
+import httpx
+from threading import RLock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Optional,
+    TypeVar,
+    overload,
+)
 
 from .config import PhantombusterConfig
-from .api.branches import BranchesAPI
-from .api.scripts import ScriptsAPI
-from .api.orgs import OrgsAPI
-from .api.containers import ContainersAPI
-from .api.agents import AgentsAPI
-from .api.org_storage import OrgStorageAPI
-from .api.identities import IdentitiesAPI
-from .api.brightdata import BrightDataAPI
-from .api.location import LocationAPI
-from .api.captcha import CaptchaAPI
-from .api.ai import AIAPI
-from .api.v1 import V1API
+from .rate_limiter import AdaptiveRateLimiter, endpoint_family, parse_retry_after
+from .retries import RetryBudget, RetryPolicy
+from .circuit_breaker import CircuitBreaker
+from .deadlines import current_deadline, deadline, remaining
+from .coalescing import SingleFlight, coalescing_key
+from .response_cache import ResponseCache, route_key
+from .decoding import ModelT, ResponseDecoder
+from .instrumentation import DecodeEvent, EventBus, RequestEvent
+from .lazy_models import LazyModelList
+from .streaming import JSONStreamParser
 from .__global_exceptions__ import (
     PhantomBusterAPIError,
     AuthenticationError,
     NotFoundError,
     RateLimitError,
     ServerError,
+    TransportError,
+    CircuitOpenError,
+    DeadlineExceededError,
 )
 
+if TYPE_CHECKING:
+    from .api.branches import BranchesAPI
+    from .api.scripts import ScriptsAPI
+    from .api.orgs import OrgsAPI
+    from .api.containers import ContainersAPI
+    from .api.agents import AgentsAPI
+    from .api.org_storage import OrgStorageAPI
+    from .api.identities import IdentitiesAPI
+    from .api.brightdata import BrightDataAPI
+    from .api.location import LocationAPI
+    from .api.captcha import CaptchaAPI
+    from .api.ai import AIAPI
+    from .api.v1 import V1API
+    from .watcher import ContainerWatcher
+    from .compact import CompactTable
+
+APIT = TypeVar("APIT")
+TableT = TypeVar("TableT", bound="CompactTable")
+
+
+class _LazyAPI(Generic[APIT]):
+    """An API namespace that is imported and built on first access.
+
+    The built object is stored on the client instance under the same
+    name, so later lookups find it directly and never reach this
+    descriptor again. Until then neither the API module nor the models it
+    uses are imported.
+    """
+
+    def __init__(self, module: str, class_name: str):
+        self._module = module
+        self._class_name = class_name
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    @overload
+    def __get__(self, client: None, owner: type) -> "_LazyAPI[APIT]": ...
+
+    @overload
+    def __get__(self, client: "PhantombusterClient", owner: type) -> APIT: ...
+
+    def __get__(self, client, owner):
+        if client is None:
+            return self
+        module = importlib.import_module(self._module, __package__)
+        api = getattr(module, self._class_name)(client)
+        client.__dict__[self._name] = api
+        return api
+
+
 class PhantombusterClient:
     """Asynchronous client for interacting with the PhantomBuster API."""
 
     _instance = None
-    _lock = Lock()
+    _lock = RLock()
 
     def __new__(cls, config: PhantombusterConfig | None = None):
         if not cls._instance:
@@ -47,30 +113,82 @@ class PhantombusterClient:
         if not hasattr(self, '_initialized'):
             if config is None:
                 raise ValueError("Configuration must be provided for the first client initialization.")
-            self.config = config
-            self._base_url_v1 = self.config.base_url_v1
-            self._base_url_v2 = self.config.base_url_v2
-            self._client = httpx.AsyncClient(
-                headers={
-                    "X-Phantombuster-Key-1": self.config.api_key,
-                    "Content-Type": "application/json",
-                },
-                timeout=30.0,
+            self._setup(config)
+
+    def _setup(
+        self,
+        config: PhantombusterConfig,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.config = config
+        self._base_url_v1 = self.config.base_url_v1
+        self._base_url_v2 = self.config.base_url_v2
+        transport_config = self.config.transport
+        self._client = httpx.AsyncClient(
+            transport=transport,
+            headers={
+                "X-Phantombuster-Key-1": self.config.api_key,
+                "Content-Type": "application/json",
+            },
+            http2=transport_config.http2,
+            limits=httpx.Limits(
+                max_connections=transport_config.max_connections,
+                max_keepalive_connections=transport_config.max_keepalive_connections,
+                keepalive_expiry=transport_config.keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(
+                connect=transport_config.connect_timeout,
+                read=transport_config.read_timeout,
+                write=transport_config.write_timeout,
+                pool=transport_config.pool_timeout,
+            ),
+        )
+        self._limiter = AdaptiveRateLimiter(self.config.rate_limit)
+        self._retry_policy = RetryPolicy(self.config.retry)
+        self._retry_budget = RetryBudget(
+            self.config.retry.budget_ratio,
+            self.config.retry.budget_min_tokens,
+            self.config.retry.budget_max_tokens,
+        )
+        self._breaker = (
+            CircuitBreaker(self.config.circuit_breaker)
+            if self.config.circuit_breaker.enabled
+            else None
+        )
+        self._decoder = ResponseDecoder(self.config.decode)
+        self.events = EventBus()
+        self._single_flight = SingleFlight() if self.config.coalesce_gets else None
+        self._cache = ResponseCache(self.config.cache) if self.config.cache.enabled else None
+        self._watcher = None
+        self._script_store = None
+        if self.config.script_cache.path:
+            from .script_store import ScriptCodeStore
+
+            self._script_store = ScriptCodeStore(
+                self.config.script_cache.path, self.config.script_cache.max_bytes
             )
-            self._limiter = AsyncLimiter(10, 1)  # 10 requests per second
-            self._branches_api = BranchesAPI(self)
-            self._scripts_api = ScriptsAPI(self)
-            self._orgs_api = OrgsAPI(self)
-            self._containers_api = ContainersAPI(self)
-            self._agents_api = AgentsAPI(self)
-            self._org_storage_api = OrgStorageAPI(self)
-            self._identities_api = IdentitiesAPI(self)
-            self._brightdata_api = BrightDataAPI(self)
-            self._location_api = LocationAPI(self)
-            self._captcha_api = CaptchaAPI(self)
-            self._ai_api = AIAPI(self)
-            self._v1_api = V1API(self)
-            self._initialized = True
+        self._initialized = True
+
+    @classmethod
+    def create(
+        cls,
+        config: PhantombusterConfig,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> 'PhantombusterClient':
+        """Create an independent client that is not the process-wide singleton.
+
+        Each client created this way has its own connection pool, rate
+        limiter and retry budget.
+
+        Args:
+            config: The client configuration.
+            transport: An httpx transport to send requests through instead
+                of the network, such as ``mock_server.MockPhantomBuster``.
+                ``config.transport`` pool settings do not apply to it.
+        """
+        client = super().__new__(cls)
+        client._setup(config, transport)
+        return client
 
     @classmethod
     def get_instance(cls, config: PhantombusterConfig | None = None) -> 'PhantombusterClient':
@@ -81,85 +199,399 @@ class PhantombusterClient:
                     cls._instance = cls(config)
         return cls._instance
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.ConnectError, ServerError)),
-    )
     async def _request(
         self, method: str, url: str, api_version: str = "v2", **kwargs: Any
     ) -> httpx.Response:
-        """Make an async request with error handling and retry logic."""
+        """Make an async request with error handling and retry logic.
+
+        Identical concurrent GET requests are coalesced into a single
+        upstream call when ``config.coalesce_gets`` is enabled, and served
+        from the response cache when ``config.cache`` is enabled. Any
+        other request evicts the cache entries it may have made stale.
+        The request is bounded by the context's deadline and
+        ``config.call_timeout``.
+        """
+        at = current_deadline(self.config.call_timeout)
+        if at is None:
+            return await self._route(method, url, api_version, **kwargs)
+        return await self._bounded(at, lambda: self._route(method, url, api_version, **kwargs))
+
+    async def _route(
+        self, method: str, url: str, api_version: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Route a request through coalescing and the response cache."""
+        key = coalescing_key(method, url, api_version, kwargs)
+        if key is None:
+            try:
+                return await self._execute(method, url, api_version, **kwargs)
+            finally:
+                if self._cache is not None and method.upper() not in ("GET", "HEAD"):
+                    self._cache.invalidate_for(url, api_version)
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        if self._single_flight is not None:
+            return await self._single_flight.do(
+                key, lambda: self._shared_fetch(key, method, url, api_version, **kwargs)
+            )
+        return await self._fetch(key, method, url, api_version, **kwargs)
+
+    async def _shared_fetch(
+        self, key: Any, method: str, url: str, api_version: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Fetch for a coalesced call.
+
+        Only ``config.call_timeout`` cancels the call; the callers'
+        deadlines bound their own waits and which retries are worth making.
+        """
+        timeout = self.config.call_timeout
+        at = None if timeout is None else time.monotonic() + timeout
+        if at is None:
+            return await self._fetch(key, method, url, api_version, **kwargs)
+        return await self._bounded(
+            at, lambda: self._fetch(key, method, url, api_version, **kwargs)
+        )
+
+    async def _bounded(
+        self, at: float, call: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Run a request, cancelling it if it is still running at the deadline ``at``."""
+        left = at - time.monotonic()
+        if left <= 0:
+            raise DeadlineExceededError("Deadline exceeded before the request was sent.")
+        with deadline(left):
+            task = asyncio.ensure_future(call())
+        expired = False
+
+        def expire() -> None:
+            nonlocal expired
+            expired = True
+            task.cancel()
+
+        timer = asyncio.get_running_loop().call_later(left, expire)
+        try:
+            return await task
+        except asyncio.CancelledError:
+            if not expired:
+                raise
+            raise DeadlineExceededError(f"Deadline exceeded after {left:.3f}s.") from None
+        finally:
+            timer.cancel()
+
+    async def _fetch(
+        self, key: Any, method: str, url: str, api_version: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Run a read request, going through the response cache if enabled."""
+        if self._cache is None:
+            return await self._execute(method, url, api_version, **kwargs)
+
+        async def send(headers: dict[str, str] | None) -> httpx.Response:
+            if headers:
+                return await self._execute(method, url, api_version, headers=headers, **kwargs)
+            return await self._execute(method, url, api_version, **kwargs)
+
+        return await self._cache.fetch(key, url, api_version, send)
+
+    async def _execute(
+        self, method: str, url: str, api_version: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Run a request, retrying transient failures.
+
+        Transient failures are retried according to ``config.retry``. A
+        retry honors the server's ``Retry-After``, draws on the client-wide
+        retry budget and re-queues in the limiter with the request's
+        original ticket, so it is not sent behind newer requests.
+        """
+        family = endpoint_family(url, api_version)
+        ticket = self._limiter.ticket()
+        self._retry_budget.deposit()
+        event = (
+            RequestEvent(method.upper(), route_key(url, api_version), family)
+            if self.events
+            else None
+        )
+        started = time.perf_counter()
+        attempt = 0
+        try:
+            while True:
+                try:
+                    response = await self._send(
+                        method, url, api_version, family, ticket, event=event, **kwargs
+                    )
+                    if event is not None:
+                        event.status = response.status_code
+                    return response
+                except PhantomBusterAPIError as e:
+                    delay = self._retry_policy.delay(e, attempt, method)
+                    if delay is None:
+                        raise
+                    left = remaining()
+                    # A retry that cannot start before the deadline only delays the error.
+                    if left is not None and delay >= left:
+                        raise
+                    if not self._retry_budget.withdraw():
+                        raise
+                attempt += 1
+                await asyncio.sleep(delay)
+        except BaseException as e:
+            if event is not None:
+                event.status = getattr(e, "status_code", None)
+                event.error = type(e).__name__
+            raise
+        finally:
+            if event is not None:
+                event.retries = attempt
+                event.duration = time.perf_counter() - started
+                self.events.emit(event)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        api_version: str,
+        family: str,
+        ticket: int,
+        stream: bool = False,
+        event: RequestEvent | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a single attempt of a request through the circuit breaker and limiter.
+
+        With ``stream`` the body is left unread and the caller must close
+        the response.
+        """
+        if self._breaker is None:
+            return await self._attempt(method, url, api_version, family, ticket, stream, event, **kwargs)
+        key = route_key(url, api_version)
+        probe = self._breaker.before(key)
+        try:
+            response = await self._attempt(
+                method, url, api_version, family, ticket, stream, event, **kwargs
+            )
+        except (ServerError, TransportError):
+            self._breaker.failure(key, probe)
+            raise
+        except RateLimitError:
+            self._breaker.release(key, probe)
+            raise
+        except (CircuitOpenError, DeadlineExceededError):
+            # Raised by a client, not answered by the endpoint.
+            self._breaker.release(key, probe)
+            raise
+        except PhantomBusterAPIError:
+            self._breaker.success(key, probe)
+            raise
+        except BaseException:
+            self._breaker.release(key, probe)
+            raise
+        self._breaker.success(key, probe)
+        return response
+
+    async def _attempt(
+        self,
+        method: str,
+        url: str,
+        api_version: str,
+        family: str,
+        ticket: int,
+        stream: bool,
+        event: RequestEvent | None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Wait for the limiter, then send the request and map failures."""
         base_url = self._base_url_v1 if api_version == "v1" else self._base_url_v2
-        async with self._limiter:
+        waited = await self._limiter.acquire(family, ticket)
+        try:
+            full_url = f"{base_url}{url}"
+            request = self._client.build_request(method, full_url, **kwargs)
+            if event is None:
+                response = await self._client.send(request, stream=stream)
+            else:
+                event.limiter_wait += waited
+                response = await self._send_traced(request, stream, event)
+        except httpx.RequestError as e:
+            raise TransportError(f"Request error: {e}") from e
+        self._limiter.observe(family, response.status_code, response.headers)
+        if response.is_success or response.status_code == 304:
+            return response
+        if stream:
             try:
-                full_url = f"{base_url}{url}"
-                response = await self._client.request(method, full_url, **kwargs)
-                response.raise_for_status()
-                return response
-            except httpx.HTTPStatusError as e:
-                status_code = e.response.status_code
-                message = f"HTTP error {status_code}: {e.response.text}"
-                if status_code == 401:
-                    raise AuthenticationError(message, status_code)
-                if status_code == 404:
-                    raise NotFoundError(message, status_code)
-                if status_code == 429:
-                    raise RateLimitError(message, status_code)
-                if 500 <= status_code < 600:
-                    raise ServerError(message, status_code)
-                raise PhantomBusterAPIError(message, status_code)
-            except httpx.RequestError as e:
-                raise PhantomBusterAPIError(f"Request error: {e}")
+                await response.aread()
+            except httpx.RequestError:
+                pass
+            finally:
+                await response.aclose()
+        raise self._error_for(response)
 
-    async def close(self):
-        """Close the underlying HTTP client."""
-        await self._client.aclose()
+    async def _send_traced(
+        self, request: httpx.Request, stream: bool, event: RequestEvent
+    ) -> httpx.Response:
+        """Send a request, adding its connect, TTFB, network time and sizes to ``event``."""
+        marks: dict[str, float] = {}
 
-    @property
-    def branches(self) -> BranchesAPI:
-        return self._branches_api
+        async def trace(name: str, info: dict[str, Any]) -> None:
+            now = time.perf_counter()
+            if name == "connection.connect_tcp.started":
+                marks["connect"] = now
+            elif name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+                started = marks.pop("connect", None)
+                if started is not None:
+                    event.connect = (event.connect or 0.0) + now - started
+                    marks["connect"] = now
+            elif name.endswith(".send_request_headers.started"):
+                marks["sent"] = now
+            elif name.endswith(".receive_response_headers.complete") and "sent" in marks:
+                event.ttfb = (event.ttfb or 0.0) + now - marks.pop("sent")
 
-    @property
-    def scripts(self) -> ScriptsAPI:
-        return self._scripts_api
+        request.extensions["trace"] = trace
+        started = time.perf_counter()
+        try:
+            response = await self._client.send(request, stream=stream)
+        finally:
+            event.network += time.perf_counter() - started
+        if isinstance(request.stream, httpx.ByteStream):
+            event.bytes_sent += len(request.content)
+        event.bytes_received += response.num_bytes_downloaded
+        return response
 
-    @property
-    def orgs(self) -> OrgsAPI:
-        return self._orgs_api
+    @staticmethod
+    def _error_for(response: httpx.Response) -> PhantomBusterAPIError:
+        """Map an unsuccessful response to the matching SDK exception."""
+        status_code = response.status_code
+        message = f"HTTP error {status_code}: {response.text}"
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if status_code == 401:
+            return AuthenticationError(message, status_code)
+        if status_code == 404:
+            return NotFoundError(message, status_code)
+        if status_code == 429:
+            return RateLimitError(message, status_code, retry_after)
+        if 500 <= status_code < 600:
+            return ServerError(message, status_code, retry_after)
+        return PhantomBusterAPIError(message, status_code)
 
-    @property
-    def containers(self) -> ContainersAPI:
-        return self._containers_api
+    @asynccontextmanager
+    async def _stream(
+        self, method: str, url: str, api_version: str = "v2", **kwargs: Any
+    ) -> AsyncIterator[httpx.Response]:
+        """Open a request whose body is read incrementally.
 
-    @property
-    def agents(self) -> AgentsAPI:
-        return self._agents_api
+        Failures are retried like any other request until the response
+        headers arrive; once the body is being read it is not retried.
+        Streamed requests bypass coalescing and the response cache. The
+        deadline covers the request until the headers arrive, not the
+        reading of the body.
+        """
+        at = current_deadline(self.config.call_timeout)
+        if at is None:
+            response = await self._execute(method, url, api_version, stream=True, **kwargs)
+        else:
+            response = await self._bounded(
+                at, lambda: self._execute(method, url, api_version, stream=True, **kwargs)
+            )
+        try:
+            yield response
+        finally:
+            await response.aclose()
 
-    @property
-    def org_storage(self) -> OrgStorageAPI:
-        return self._org_storage_api
+    def _json(self, response: httpx.Response) -> Any:
+        """Decode a response body with the configured JSON backend."""
+        if not self.events:
+            return self._decoder.json(response)
+        started = time.perf_counter()
+        data = self._decoder.json(response)
+        self._emit_decode(response, None, time.perf_counter() - started, 0.0)
+        return data
 
-    @property
-    def identities(self) -> IdentitiesAPI:
-        return self._identities_api
+    def _parse(self, model: type[ModelT], response: httpx.Response) -> ModelT:
+        """Decode a response body into a model, honoring ``config.decode``."""
+        if not self.events:
+            return self._decoder.model(model, response)
+        started = time.perf_counter()
+        if self._decoder.trusts(model):
+            data = self._decoder.json(response)
+            decoded = time.perf_counter()
+            result = self._decoder.build(model, data)
+        else:
+            # pydantic-core parses and validates in a single pass.
+            decoded = started
+            result = self._decoder.model(model, response)
+        self._emit_decode(response, model, decoded - started, time.perf_counter() - decoded)
+        return result
 
-    @property
-    def brightdata(self) -> BrightDataAPI:
-        return self._brightdata_api
+    def _parse_lazy(
+        self, model: type[ModelT], response: httpx.Response, key: str
+    ) -> LazyModelList[ModelT]:
+        """Decode a list response into a sequence that builds items on access."""
+        build = functools.partial(self._decoder.build, copy=True)
+        return LazyModelList(model, self._json(response)[key], build)
 
-    @property
-    def location(self) -> LocationAPI:
-        return self._location_api
+    async def _stream_table(
+        self, table: TableT, key: str, method: str, url: str, **kwargs: Any
+    ) -> TableT:
+        """Fill a compact table with the items of a list response as its body
+        arrives, so the whole decoded response is never held in memory."""
+        async with self._stream(method, url, **kwargs) as response:
+            parser = JSONStreamParser(key)
+            async for chunk in response.aiter_bytes():
+                table.extend(parser.feed(chunk))
+            table.extend(parser.close())
+        return table
 
-    @property
-    def captcha(self) -> CaptchaAPI:
-        return self._captcha_api
+    def _emit_decode(
+        self, response: httpx.Response, model: type | None, decode: float, validate: float
+    ) -> None:
+        path = response.request.url.path
+        endpoint = path
+        for api_version, base_url in (("v2", self._base_url_v2), ("v1", self._base_url_v1)):
+            base_path = httpx.URL(base_url).path.rstrip("/")
+            if path.startswith(base_path + "/"):
+                endpoint = route_key(path[len(base_path):], api_version)
+                break
+        self.events.emit(
+            DecodeEvent(
+                endpoint=endpoint,
+                model=model.__name__ if model is not None else None,
+                bytes=len(response.content),
+                decode=decode,
+                validate=validate,
+            )
+        )
 
     @property
-    def ai(self) -> AIAPI:
-        return self._ai_api
+    def watcher(self) -> "ContainerWatcher":
+        """The container watcher shared by everything waiting on this client's runs."""
+        if self._watcher is None:
+            from .watcher import ContainerWatcher
 
-    @property
-    def v1(self) -> V1API:
-        return self._v1_api
+            self._watcher = ContainerWatcher(
+                self, self.config.watcher.min_interval, self.config.watcher.max_interval
+            )
+        return self._watcher
+
+    def clear_cache(self) -> None:
+        """Evict every cached response."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    async def close(self):
+        """Close the underlying HTTP client."""
+        if self._watcher is not None:
+            await self._watcher.close()
+        await self._client.aclose()
+        if self._script_store is not None:
+            self._script_store.close()
+
+    branches: _LazyAPI["BranchesAPI"] = _LazyAPI(".api.branches", "BranchesAPI")
+    scripts: _LazyAPI["ScriptsAPI"] = _LazyAPI(".api.scripts", "ScriptsAPI")
+    orgs: _LazyAPI["OrgsAPI"] = _LazyAPI(".api.orgs", "OrgsAPI")
+    containers: _LazyAPI["ContainersAPI"] = _LazyAPI(".api.containers", "ContainersAPI")
+    agents: _LazyAPI["AgentsAPI"] = _LazyAPI(".api.agents", "AgentsAPI")
+    org_storage: _LazyAPI["OrgStorageAPI"] = _LazyAPI(".api.org_storage", "OrgStorageAPI")
+    identities: _LazyAPI["IdentitiesAPI"] = _LazyAPI(".api.identities", "IdentitiesAPI")
+    brightdata: _LazyAPI["BrightDataAPI"] = _LazyAPI(".api.brightdata", "BrightDataAPI")
+    location: _LazyAPI["LocationAPI"] = _LazyAPI(".api.location", "LocationAPI")
+    captcha: _LazyAPI["CaptchaAPI"] = _LazyAPI(".api.captcha", "CaptchaAPI")
+    ai: _LazyAPI["AIAPI"] = _LazyAPI(".api.ai", "AIAPI")
+    v1: _LazyAPI["V1API"] = _LazyAPI(".api.v1", "V1API")
@@ -0,0 +1,104 @@
+"""
+A pool of PhantomBuster clients, one per API key.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import Iterator, Literal, Mapping, Sequence
+
+from .client import PhantombusterClient
+from .config import PhantombusterConfig
+from .rate_limiter import endpoint_family
+
+
+class PhantombusterClientPool:
+    """Holds one independent client per API key and routes work between them.
+
+    Every client has its own connection pool, rate limiter and retry
+    budget, so the pool's throughput is the sum of its keys' quotas.
+    Org-scoped work (an org's agents, containers, storage) must go to that
+    org's key with :meth:`client`; work any key can serve is spread with
+    :meth:`pick`.
+
+    Example:
+        pool = PhantombusterClientPool({"acme": acme_config, "globex": globex_config})
+        agents = await pool.client("acme").agents.fetch_all()
+        location = await pool.pick("/location/ip").location.get_ip()
+        await pool.close()
+    """
+
+    def __init__(
+        self,
+        configs: Mapping[str, PhantombusterConfig] | Sequence[PhantombusterConfig],
+        strategy: Literal["round_robin", "least_loaded"] = "least_loaded",
+    ):
+        if strategy not in ("round_robin", "least_loaded"):
+            raise ValueError(f"Unknown routing strategy: {strategy!r}")
+        if not isinstance(configs, Mapping):
+            configs = {str(index): config for index, config in enumerate(configs)}
+        if not configs:
+            raise ValueError("At least one configuration must be provided.")
+        self.strategy = strategy
+        self._clients: dict[str, PhantombusterClient] = {
+            org: PhantombusterClient.create(config) for org, config in configs.items()
+        }
+        self._cycle = itertools.cycle(list(self._clients))
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __iter__(self) -> Iterator[PhantombusterClient]:
+        return iter(self._clients.values())
+
+    @property
+    def orgs(self) -> list[str]:
+        """The org names the pool holds a client for."""
+        return list(self._clients)
+
+    def client(self, org: str) -> PhantombusterClient:
+        """Returns the client bound to an org's API key.
+
+        Raises:
+            KeyError: If the pool has no client for ``org``.
+        """
+        try:
+            return self._clients[org]
+        except KeyError:
+            raise KeyError(f"No client configured for org {org!r}.") from None
+
+    def pick(self, url: str = "", api_version: str = "v2") -> PhantombusterClient:
+        """Returns a client for work that any key can serve.
+
+        With the ``least_loaded`` strategy the client whose limiter has the
+        most capacity left for the endpoint's family is chosen, so load
+        spreads across the combined quota; ties go round-robin.
+
+        Args:
+            url: The endpoint path the work will call, used to pick the family.
+            api_version: The API version of the endpoint.
+        """
+        if self.strategy == "round_robin":
+            return self._clients[next(self._cycle)]
+        family = endpoint_family(url, api_version)
+        start = next(self._cycle)
+        orgs = list(self._clients)
+        offset = orgs.index(start)
+        best = None
+        best_available = float("-inf")
+        for org in orgs[offset:] + orgs[:offset]:
+            available = self._clients[org]._limiter.available(family)
+            if available > best_available:
+                best, best_available = org, available
+        return self._clients[best]
+
+    async def close(self) -> None:
+        """Close every client in the pool."""
+        for client in self._clients.values():
+            await client.close()
+
+    async def __aenter__(self) -> PhantombusterClientPool:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
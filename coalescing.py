@@ -0,0 +1,80 @@
+"""
+Single-flight coalescing of identical in-flight requests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from typing import Any, Awaitable, Callable, Hashable, Mapping
+
+import httpx
+
+from .deadlines import SharedDeadline, current_deadline
+
+# Request arguments that carry a body; requests with any of them are never coalesced.
+_BODY_ARGUMENTS = frozenset({"json", "content", "data", "files"})
+
+
+def coalescing_key(
+    method: str, url: str, api_version: str, kwargs: Mapping[str, Any]
+) -> Hashable | None:
+    """Returns the key identical requests share, or None if the request
+    must not be coalesced.
+
+    Only GET requests without a body and without per-call headers or
+    options are considered identical.
+    """
+    if method.upper() != "GET" or set(kwargs) - {"params"}:
+        return None
+    params = kwargs.get("params")
+    query = str(httpx.QueryParams(params)) if params else ""
+    return (api_version, url, query)
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its outcome.
+
+    The call runs in its own task, so a caller that is cancelled, or whose
+    deadline passes, does not cancel the call for everyone else waiting on
+    it. The call's deadline is the latest of its callers' deadlines, and
+    none once a caller without one waits on it.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task[Any]] = {}
+        self._deadlines: dict[Hashable, SharedDeadline] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """The number of calls currently running."""
+        return len(self._calls)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Runs ``call`` unless a call with the same key is already running,
+        in which case its result (or exception) is shared."""
+        task = self._calls.get(key)
+        if task is None:
+            shared = SharedDeadline(current_deadline())
+            # A fresh context, so the call carries no caller's deadline but
+            # the shared one; each caller's own deadline bounds its wait.
+            task = contextvars.Context().run(self._start, shared, call)
+            self._calls[key] = task
+            self._deadlines[key] = shared
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self._deadlines[key].extend(current_deadline())
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _start(shared: SharedDeadline, call: Callable[[], Awaitable[Any]]) -> asyncio.Task[Any]:
+        with shared.applied():
+            return asyncio.ensure_future(call())
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+            del self._deadlines[key]
+        if not task.cancelled():
+            # Mark the exception retrieved in case every caller went away.
+            task.exception()
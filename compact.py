@@ -0,0 +1,262 @@
+"""
+Compact column-oriented collections for large lead and container lists.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Any, Iterable, Iterator, Sequence, overload
+
+from .__global_models__ import Container, Lead
+
+_MISSING = object()
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+# Short strings such as statuses or company names repeat a lot; interning
+# them stores each distinct value once.
+_INTERN_MAX_LENGTH = 64
+
+
+class _Column:
+    """One column of values, stored in a typed array when it can be.
+
+    A column whose present values are all ints is an ``array('q')``, all
+    floats an ``array('d')``, and anything else a list. ``present`` marks
+    the rows that had a value at all.
+    """
+
+    __slots__ = ("values", "present")
+
+    def __init__(self, rows: int = 0):
+        self.values: array | list | None = None
+        self.present = bytearray(rows)
+
+    def append(self, value: Any) -> None:
+        if value is _MISSING:
+            self.present.append(0)
+            if self.values is not None:
+                self.values.append(None if type(self.values) is list else 0)
+            return
+        values = self.values
+        if values is None:
+            values = self.values = self._start(value)
+        kind = type(value)
+        if type(values) is array:
+            if values.typecode == "q" and kind is int and _INT64_MIN <= value <= _INT64_MAX:
+                values.append(value)
+            elif values.typecode == "d" and kind is float:
+                values.append(value)
+            else:
+                values = self.values = [
+                    item if present else None for item, present in zip(values, self.present)
+                ]
+        if type(values) is list:
+            if kind is str and len(value) <= _INTERN_MAX_LENGTH:
+                value = sys.intern(value)
+            values.append(value)
+        self.present.append(1)
+
+    def _start(self, value: Any) -> array | list:
+        """Creates the storage for a column's first present value."""
+        rows = len(self.present)
+        kind = type(value)
+        if kind is int and _INT64_MIN <= value <= _INT64_MAX:
+            return array("q", bytes(8 * rows))
+        if kind is float:
+            return array("d", bytes(8 * rows))
+        return [None] * rows
+
+    def get(self, index: int) -> Any:
+        """Returns the value of a row, or ``_MISSING``."""
+        if not self.present[index]:
+            return _MISSING
+        return self.values[index]
+
+
+class CompactRow:
+    """A lightweight view of one row of a compact table."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: CompactTable, index: int):
+        self._table = table
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        column = self._table._columns.get(name)
+        if column is None:
+            raise AttributeError(name)
+        value = column.get(self._index)
+        return None if value is _MISSING else value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the row as a plain dictionary."""
+        return self._table._row_dict(self._index)
+
+    def to_model(self) -> Any:
+        """Builds the row's model."""
+        return self._table.model.model_validate(self.to_dict())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactRow):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class LeadRow(CompactRow):
+    """A view of one lead. Its data fields can be read with ``row[key]``."""
+
+    __slots__ = ()
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """The lead's data, rebuilt as a dictionary."""
+        return self._table._data_dict(self._index)
+
+    def __getitem__(self, key: str) -> Any:
+        column = self._table._data_columns.get(key)
+        value = _MISSING if column is None else column.get(self._index)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns a data field, or ``default`` if the lead does not have it."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+class CompactTable(Sequence[CompactRow]):
+    """A column-oriented collection of model rows.
+
+    Fields are stored column by column in typed arrays where possible, and
+    rows are returned as ``__slots__`` views that read from the columns,
+    so a million rows cost a few arrays rather than a million models.
+    """
+
+    model: type = object
+    row_class: type[CompactRow] = CompactRow
+    fields: tuple[str, ...] = ()
+
+    def __init__(self, items: Iterable[dict[str, Any]] = ()):
+        self._columns: dict[str, _Column] = {name: _Column() for name in self.fields}
+        self._rows = 0
+        self.extend(items)
+
+    def append(self, item: dict[str, Any]) -> None:
+        """Appends one decoded item."""
+        for name, column in self._columns.items():
+            column.append(item.get(name, _MISSING))
+        self._rows += 1
+
+    def extend(self, items: Iterable[dict[str, Any]]) -> None:
+        """Appends decoded items."""
+        for item in items:
+            self.append(item)
+
+    def column(self, name: str) -> array | list:
+        """Returns the storage of a field's column.
+
+        Rows without a value hold ``0``/``0.0`` in numeric columns and
+        ``None`` in lists.
+        """
+        values = self._columns[name].values
+        return values if values is not None else [None] * self._rows
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @overload
+    def __getitem__(self, index: int) -> CompactRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[CompactRow]: ...
+
+    def __getitem__(self, index: int | slice) -> CompactRow | list[CompactRow]:
+        if isinstance(index, slice):
+            return [self.row_class(self, row) for row in range(*index.indices(self._rows))]
+        if index < 0:
+            index += self._rows
+        if not 0 <= index < self._rows:
+            raise IndexError("row index out of range")
+        return self.row_class(self, index)
+
+    def __iter__(self) -> Iterator[CompactRow]:
+        row_class = self.row_class
+        for index in range(self._rows):
+            yield row_class(self, index)
+
+    def to_models(self) -> list[Any]:
+        """Builds every row's model."""
+        return [row.to_model() for row in self]
+
+    def _row_dict(self, index: int) -> dict[str, Any]:
+        row = {}
+        for name, column in self._columns.items():
+            value = column.get(index)
+            if value is not _MISSING:
+                row[name] = value
+        return row
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._rows} rows)"
+
+
+class ContainerTable(CompactTable):
+    """A compact collection of containers."""
+
+    model = Container
+    fields = tuple(Container.model_fields)
+
+
+class LeadTable(CompactTable):
+    """A compact collection of leads.
+
+    Each key of the leads' free-form ``data`` becomes its own column, with
+    the key interned once for the whole table.
+    """
+
+    model = Lead
+    row_class = LeadRow
+    fields = ("id",)
+
+    def __init__(self, items: Iterable[dict[str, Any]] = ()):
+        self._data_columns: dict[str, _Column] = {}
+        super().__init__(items)
+
+    def append(self, item: dict[str, Any]) -> None:
+        data = item.get("data") or {}
+        for key in data.keys() - self._data_columns.keys():
+            self._data_columns[sys.intern(key)] = _Column(self._rows)
+        for key, column in self._data_columns.items():
+            column.append(data.get(key, _MISSING))
+        super().append(item)
+
+    @property
+    def data_keys(self) -> list[str]:
+        """Every data key seen in the table."""
+        return list(self._data_columns)
+
+    def data_column(self, key: str) -> array | list:
+        """Returns the storage of one data key's column."""
+        values = self._data_columns[key].values
+        return values if values is not None else [None] * self._rows
+
+    def _data_dict(self, index: int) -> dict[str, Any]:
+        data = {}
+        for key, column in self._data_columns.items():
+            value = column.get(index)
+            if value is not _MISSING:
+                data[key] = value
+        return data
+
+    def _row_dict(self, index: int) -> dict[str, Any]:
+        row = super()._row_dict(index)
+        row["data"] = self._data_dict(index)
+        return row
@@ -2,8 +2,215 @@
 Configuration for the PhantomBuster SDK.
 """
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
+class RateLimitConfig(BaseModel):
+    """Configuration for the adaptive, per-endpoint-family rate limiter."""
+
+    requests_per_second: float = Field(
+        default=10.0,
+        gt=0,
+        description="Initial rate for every endpoint family, in requests per second.",
+    )
+    burst: int | None = Field(
+        default=None,
+        ge=1,
+        description="Bucket capacity. Defaults to one second's worth of requests.",
+    )
+    family_rates: dict[str, float] = Field(
+        default_factory=dict,
+        description="Initial rates for specific families, e.g. {'v2:ai': 2.0}.",
+    )
+    adaptive: bool = Field(
+        default=True,
+        description="Whether to adjust rates from response headers and 429s at runtime.",
+    )
+    min_rate: float = Field(default=0.5, gt=0, description="Lowest rate the limiter will fall to.")
+    max_rate: float = Field(default=50.0, gt=0, description="Highest rate the limiter will climb to.")
+    safety_margin: float = Field(
+        default=0.9,
+        gt=0,
+        le=1,
+        description="Fraction of the server-advertised quota to actually use.",
+    )
+    increase_step: float = Field(
+        default=0.1,
+        ge=0,
+        description="Rate added after each successful response without quota headers.",
+    )
+    decrease_factor: float = Field(
+        default=0.5,
+        gt=0,
+        lt=1,
+        description="Factor the rate is multiplied by after a 429.",
+    )
+
+class RetryConfig(BaseModel):
+    """Configuration for retrying transient failures."""
+
+    max_attempts: int = Field(default=3, ge=1, description="Attempts per request, including the first.")
+    base_delay: float = Field(default=0.5, ge=0, description="Backoff ceiling for the first retry, in seconds.")
+    max_delay: float = Field(default=10.0, ge=0, description="Largest backoff ceiling, in seconds.")
+    retry_rate_limited: bool = Field(default=True, description="Whether 429 responses are retried.")
+    respect_retry_after: bool = Field(
+        default=True,
+        description="Whether to wait exactly as long as the server's Retry-After header asks.",
+    )
+    max_retry_after: float = Field(
+        default=60.0,
+        ge=0,
+        description="A Retry-After longer than this fails the request instead of waiting.",
+    )
+    budget_ratio: float = Field(
+        default=0.2,
+        ge=0,
+        description="Retry tokens earned per request; caps retries at this fraction of traffic.",
+    )
+    budget_min_tokens: float = Field(default=10.0, ge=0, description="Retry tokens available up front.")
+    budget_max_tokens: float = Field(default=100.0, ge=0, description="Most retry tokens that can be banked.")
+
+class TransportConfig(BaseModel):
+    """Configuration for the underlying HTTP transport and connection pool."""
+
+    http2: bool = Field(
+        default=False,
+        description="Whether to negotiate HTTP/2. Requires the 'h2' package (httpx[http2]).",
+    )
+    max_connections: int | None = Field(
+        default=100,
+        ge=1,
+        description="Maximum number of concurrent connections. None means unlimited.",
+    )
+    max_keepalive_connections: int | None = Field(
+        default=20,
+        ge=0,
+        description="Maximum number of idle connections kept open. None means unlimited.",
+    )
+    keepalive_expiry: float | None = Field(
+        default=5.0,
+        ge=0,
+        description="Seconds an idle connection is kept open. None keeps it indefinitely.",
+    )
+    connect_timeout: float | None = Field(default=30.0, description="Seconds to wait for a connection.")
+    read_timeout: float | None = Field(default=30.0, description="Seconds to wait for response data.")
+    write_timeout: float | None = Field(default=30.0, description="Seconds to wait to send request data.")
+    pool_timeout: float | None = Field(
+        default=30.0,
+        description="Seconds to wait for a free connection from the pool.",
+    )
+
+class CircuitBreakerConfig(BaseModel):
+    """Configuration for the per-endpoint circuit breaker."""
+
+    enabled: bool = Field(default=True, description="Whether failing endpoints are cut off.")
+    failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive 5xx or transport failures that open an endpoint's circuit.",
+    )
+    reset_timeout: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds an open circuit fails fast before letting a probe through.",
+    )
+    half_open_max_calls: int = Field(
+        default=1,
+        ge=1,
+        description="Probe requests allowed in flight while a circuit is half-open.",
+    )
+    success_threshold: int = Field(
+        default=1,
+        ge=1,
+        description="Successful probes needed to close a half-open circuit.",
+    )
+
+def _default_cache_ttls() -> dict[str, float]:
+    return {
+        "v2:/scripts/fetch-all": 300.0,
+        "v2:/scripts/fetch": 300.0,
+        "v2:/agents/fetch-all": 60.0,
+        "v2:/orgs/fetch-agent-groups": 300.0,
+        "v2:/branches/fetch-all": 300.0,
+        "v1:/user": 300.0,
+    }
+
+def _default_cache_invalidates() -> dict[str, list[str]]:
+    return {
+        "v2:/agents/save": ["v2:/orgs/fetch-agent-groups", "v1:/agent/", "v1:/user"],
+        "v2:/scripts/save": ["v2:/branches/", "v1:/script/"],
+        "v2:/scripts/delete": ["v2:/branches/", "v1:/script/"],
+        "v2:/scripts/visibility": ["v1:/script/"],
+        "v2:/scripts/access-list": ["v1:/script/"],
+        "v2:/branches/release": ["v2:/scripts/"],
+    }
+
+class CacheConfig(BaseModel):
+    """Configuration for the opt-in in-memory response cache."""
+
+    enabled: bool = Field(default=False, description="Whether GET responses are cached.")
+    max_entries: int = Field(default=1024, ge=1, description="Most responses kept in the cache.")
+    max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=0,
+        description="Most response body bytes kept in the cache.",
+    )
+    ttls: dict[str, float] = Field(
+        default_factory=_default_cache_ttls,
+        description="Seconds to cache each endpoint, keyed '<version>:<path>'. Unlisted endpoints are not cached.",
+    )
+    invalidates: dict[str, list[str]] = Field(
+        default_factory=_default_cache_invalidates,
+        description=(
+            "Cached endpoint prefixes evicted by a mutation, keyed '<version>:<path>'. "
+            "A mutation always evicts its own endpoint family as well."
+        ),
+    )
+
+class ScriptCacheConfig(BaseModel):
+    """Configuration for the persistent on-disk script code cache."""
+
+    path: str | None = Field(
+        default=None,
+        description="Path of the SQLite database. The cache is disabled when None.",
+    )
+    max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        description="Most bytes of script code kept on disk.",
+    )
+
+class DecodeConfig(BaseModel):
+    """Configuration for decoding responses into models."""
+
+    json_backend: Literal["json", "orjson", "auto"] = Field(
+        default="json",
+        description="JSON parser: the standard library, orjson, or orjson when installed.",
+    )
+    trusted: bool = Field(
+        default=False,
+        description=(
+            "Build leads from orjson-decoded JSON without validation, where that is "
+            "faster than validating. Malformed lead responses are not detected. Has "
+            "no effect with the json backend, nor on other models, which validate faster."
+        ),
+    )
+
+class WatcherConfig(BaseModel):
+    """Configuration for the shared container completion watcher."""
+
+    min_interval: float = Field(
+        default=1.0,
+        gt=0,
+        description="Seconds between polls while watched containers keep finishing.",
+    )
+    max_interval: float = Field(
+        default=30.0,
+        gt=0,
+        description="Most seconds between polls once they have backed off.",
+    )
+
 class PhantombusterConfig(BaseModel):
     """Configuration for the PhantomBuster API client."""
 
@@ -15,4 +222,48 @@ class PhantombusterConfig(BaseModel):
     base_url_v2: str = Field(
         default="https://api.phantombuster.com/api/v2",
         description="The base URL for the PhantomBuster API v2.",
-    )
\ No newline at end of file
+    )
+    rate_limit: RateLimitConfig = Field(
+        default_factory=RateLimitConfig,
+        description="Rate limiter settings.",
+    )
+    retry: RetryConfig = Field(
+        default_factory=RetryConfig,
+        description="Retry settings.",
+    )
+    transport: TransportConfig = Field(
+        default_factory=TransportConfig,
+        description="HTTP transport and connection pool settings.",
+    )
+    circuit_breaker: CircuitBreakerConfig = Field(
+        default_factory=CircuitBreakerConfig,
+        description="Circuit breaker settings.",
+    )
+    cache: CacheConfig = Field(
+        default_factory=CacheConfig,
+        description="Response cache settings.",
+    )
+    script_cache: ScriptCacheConfig = Field(
+        default_factory=ScriptCacheConfig,
+        description="Persistent script code cache settings.",
+    )
+    decode: DecodeConfig = Field(
+        default_factory=DecodeConfig,
+        description="Response decoding settings.",
+    )
+    watcher: WatcherConfig = Field(
+        default_factory=WatcherConfig,
+        description="Polling settings for waiting on launched runs.",
+    )
+    call_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Most seconds any call may take, including rate limiter waits, retries "
+            "and network time. None leaves calls bounded only by deadlines."
+        ),
+    )
+    coalesce_gets: bool = Field(
+        default=True,
+        description="Whether identical concurrent GET requests share one upstream call.",
+    )
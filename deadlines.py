@@ -0,0 +1,119 @@
+"""
+Deadlines for calls into the PhantomBuster SDK.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+_DEADLINE: ContextVar[float | SharedDeadline | _CappedDeadline | None] = ContextVar(
+    "phantombuster_deadline", default=None
+)
+
+
+class SharedDeadline:
+    """The deadline of a call several callers wait on: the latest of theirs.
+
+    Attributes:
+        at: The deadline, as a ``time.monotonic()`` timestamp, or None once
+            a caller without a deadline waits on the call.
+    """
+
+    def __init__(self, at: float | None):
+        self.at = at
+
+    def extend(self, at: float | None) -> None:
+        """Pushes the deadline back to cover one more caller's deadline ``at``."""
+        if self.at is not None:
+            self.at = None if at is None else max(self.at, at)
+
+    @contextmanager
+    def applied(self) -> Iterator[SharedDeadline]:
+        """Makes this the deadline of every SDK call made inside the block."""
+        token = _DEADLINE.set(self)
+        try:
+            yield self
+        finally:
+            _DEADLINE.reset(token)
+
+
+class _CappedDeadline:
+    """A shared deadline with a fixed limit of its own, which callers joining
+    later still push back up to that limit."""
+
+    def __init__(self, shared: SharedDeadline, limit: float):
+        self.shared = shared
+        self.limit = limit
+
+    @property
+    def at(self) -> float:
+        return self.limit if self.shared.at is None else min(self.limit, self.shared.at)
+
+
+def _get() -> float | None:
+    at = _DEADLINE.get()
+    return at.at if isinstance(at, (SharedDeadline, _CappedDeadline)) else at
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """Bounds every SDK call made inside the block.
+
+    The deadline covers the whole call: the wait for the rate limiter,
+    every retry and backoff, and the network time. A call still running
+    when it passes is cancelled and raises ``DeadlineExceededError``.
+    Deadlines follow the context into tasks created inside the block, and
+    a nested deadline can only shorten the one around it.
+
+    Example:
+        with deadline(2.0):
+            container = await client.containers.fetch(container_id)
+
+    Yields:
+        The deadline, as a ``time.monotonic()`` timestamp.
+    """
+    at = time.monotonic() + seconds
+    current = _DEADLINE.get()
+    value: float | _CappedDeadline
+    if isinstance(current, (SharedDeadline, _CappedDeadline)):
+        # Keep following the shared deadline, which may still move back.
+        if isinstance(current, _CappedDeadline):
+            at = min(at, current.limit)
+            current = current.shared
+        value = _CappedDeadline(current, at)
+        at = value.at
+    else:
+        if current is not None:
+            at = min(at, current)
+        value = at
+    token = _DEADLINE.set(value)
+    try:
+        yield at
+    finally:
+        _DEADLINE.reset(token)
+
+
+def current_deadline(timeout: float | None = None) -> float | None:
+    """Returns the deadline of a call starting now, as a ``time.monotonic()`` timestamp.
+
+    Args:
+        timeout: A limit on the call of its own, combined with any
+            deadline from the context.
+
+    Returns:
+        The earlier of the two, or None if there is neither.
+    """
+    at = _get()
+    if timeout is not None:
+        limit = time.monotonic() + timeout
+        at = limit if at is None else min(at, limit)
+    return at
+
+
+def remaining() -> float | None:
+    """Returns the seconds left before the context's deadline, or None without one."""
+    at = _get()
+    return None if at is None else at - time.monotonic()
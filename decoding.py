@@ -0,0 +1,185 @@
+"""
+Response decoding for the PhantomBuster SDK.
+"""
+
+from __future__ import annotations
+
+import json
+import types
+import typing
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+import httpx
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from .config import DecodeConfig
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Names of the SDK models whose payloads are mostly free-form dicts. Only
+# these build faster without validation than pydantic-core validates them,
+# and only when orjson decodes them; smaller fixed-shape models validate faster.
+TRUSTED_MODELS = frozenset({"Lead", "LeadListResponse"})
+_MODELS_MODULE = f"{__package__}.__global_models__" if __package__ else "__global_models__"
+
+
+def json_loader(backend: str = "json") -> Callable[[bytes], Any]:
+    """Returns the ``loads`` function of a JSON backend.
+
+    Args:
+        backend: ``"json"`` for the standard library, ``"orjson"`` for the
+            optional orjson package, or ``"auto"`` for orjson when it is
+            installed and the standard library otherwise.
+
+    Raises:
+        ImportError: If ``"orjson"`` is requested but not installed.
+        ValueError: If the backend is unknown.
+    """
+    if backend not in ("json", "orjson", "auto"):
+        raise ValueError(f"Unknown JSON backend: {backend!r}")
+    if backend != "json":
+        try:
+            import orjson
+        except ImportError as e:
+            if backend == "orjson":
+                raise ImportError("The 'orjson' JSON backend requires the 'orjson' package.") from e
+        else:
+            return orjson.loads
+    return json.loads
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _field_builder(annotation: Any) -> Callable[[Any, bool], Any] | None:
+    """Returns a function building a field value of nested models, or None
+    if the field holds no models and can be used as decoded."""
+    annotation = _unwrap_optional(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return lambda value, copy: (
+            construct_trusted(annotation, value, copy) if isinstance(value, dict) else value
+        )
+    if typing.get_origin(annotation) in (list, typing.List):
+        args = typing.get_args(annotation)
+        item = _field_builder(args[0]) if args else None
+        if item is not None:
+            return lambda value, copy: (
+                [item(element, copy) for element in value] if isinstance(value, list) else value
+            )
+    return None
+
+
+def _constructor(model: type[ModelT]) -> Callable[[dict[str, Any], bool], ModelT]:
+    fields = model.model_fields
+    aliases = {field.alias: name for name, field in fields.items() if field.alias}
+    names = frozenset(fields) | frozenset(aliases)
+    optional = [(name, field) for name, field in fields.items() if not field.is_required()]
+    builders = []
+    for name, field in fields.items():
+        builder = _field_builder(field.annotation)
+        if builder is not None:
+            builders.append((name, builder))
+    field_count = len(fields)
+    new = model.__new__
+    setattr_ = object.__setattr__
+
+    def construct(data: dict[str, Any], copy: bool) -> ModelT:
+        # The decoded dict is owned by the caller's response, so it is
+        # reused as the instance's __dict__ when it needs no cleaning up,
+        # unless the caller keeps the data and asked for a copy.
+        if copy or not names.issuperset(data):
+            data = {key: value for key, value in data.items() if key in names}
+        if aliases:
+            data = {aliases.get(key, key): value for key, value in data.items()}
+        for name, builder in builders:
+            if name in data:
+                data[name] = builder(data[name], copy)
+        fields_set = set(data)
+        if len(data) < field_count:
+            for name, field in optional:
+                if name not in data:
+                    data[name] = field.get_default(call_default_factory=True)
+        instance = new(model)
+        setattr_(instance, "__dict__", data)
+        setattr_(instance, "__pydantic_fields_set__", fields_set)
+        setattr_(instance, "__pydantic_extra__", None)
+        setattr_(instance, "__pydantic_private__", None)
+        return instance
+
+    return construct
+
+
+_CONSTRUCTORS: dict[type, Callable[[dict[str, Any], bool], Any]] = {}
+
+
+def construct_trusted(model: type[ModelT], data: dict[str, Any], copy: bool = False) -> ModelT:
+    """Builds a model, and any nested models, from trusted data without validation.
+
+    No type checking or coercion is done: the data must already have the
+    model's shape. Unknown keys are dropped and missing optional fields
+    get their defaults, as with ``model_construct``, but the instance is
+    assembled directly, which is considerably cheaper.
+
+    Args:
+        model: The model class to build.
+        data: The decoded data. Unless ``copy`` is set, its dicts may
+            become the instances' ``__dict__``.
+        copy: Build from copies of the dicts, for data the caller keeps.
+    """
+    constructor = _CONSTRUCTORS.get(model)
+    if constructor is None:
+        constructor = _CONSTRUCTORS[model] = _constructor(model)
+    return constructor(data, copy)
+
+
+class ResponseDecoder:
+    """Decodes response bodies and builds SDK models from them.
+
+    Validated models are parsed straight from the body by pydantic-core,
+    which skips building the intermediate Python objects. With
+    ``config.trusted`` and orjson as the backend, the models in
+    :data:`TRUSTED_MODELS` are decoded with orjson and constructed without
+    validation instead. Plain JSON bodies always use the configured backend.
+    """
+
+    def __init__(self, config: DecodeConfig):
+        self.config = config
+        self._loads = json_loader(config.json_backend)
+        self._trusting = config.trusted and self._loads is not json.loads
+
+    def trusts(self, model: type[BaseModel]) -> bool:
+        """Whether ``model`` is built without validation."""
+        return (
+            self._trusting
+            and model.__name__ in TRUSTED_MODELS
+            and model.__module__ == _MODELS_MODULE
+        )
+
+    def json(self, response: httpx.Response) -> Any:
+        """Decodes a response body as JSON."""
+        return self._loads(response.content)
+
+    def build(self, model: type[ModelT], data: Any, copy: bool = False) -> ModelT:
+        """Builds a model from already decoded data.
+
+        Args:
+            model: The model class to build.
+            data: The decoded data.
+            copy: Never share ``data``'s dicts with the model, for data
+                the caller keeps using.
+        """
+        if self.trusts(model):
+            return construct_trusted(model, data, copy)
+        return model.model_validate(data)
+
+    def model(self, model: type[ModelT], response: httpx.Response) -> ModelT:
+        """Decodes a response body into a model."""
+        if self.trusts(model):
+            return construct_trusted(model, self._loads(response.content))
+        return model.model_validate_json(response.content)
@@ -0,0 +1,168 @@
+"""
+Incremental sync of agents' container history.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, Iterable
+
+from .watcher import ACTIVE_STATUSES
+
+if TYPE_CHECKING:
+    from .client import PhantombusterClient
+    from .__global_models__ import Container
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS watermarks (
+    agent_id TEXT PRIMARY KEY,
+    container_id INTEGER NOT NULL,
+    updated REAL NOT NULL
+)
+"""
+
+
+def _settled(container: Container) -> bool:
+    # A container without a status would otherwise hold the watermark back forever.
+    return container.status not in ACTIVE_STATUSES
+
+
+class WatermarkStore:
+    """A SQLite-backed record of the newest container synced for each agent.
+
+    Every update is its own committed transaction, so a watermark survives
+    a crash right after it is set, and watermarks only ever move forward.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+
+    def get(self, agent_id: str) -> int | None:
+        """Returns the ID of the newest container synced for an agent, or None."""
+        row = self._db.execute(
+            "SELECT container_id FROM watermarks WHERE agent_id = ?", (str(agent_id),)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def set(self, agent_id: str, container_id: int) -> None:
+        """Moves an agent's watermark forward to ``container_id``."""
+        self._db.execute(
+            "INSERT INTO watermarks (agent_id, container_id, updated) VALUES (?, ?, ?)"
+            " ON CONFLICT (agent_id) DO UPDATE SET"
+            " container_id = MAX(container_id, excluded.container_id),"
+            " updated = excluded.updated",
+            (str(agent_id), container_id, time.time()),
+        )
+
+    def reset(self, agent_id: str) -> None:
+        """Forgets an agent's watermark, so its whole history is synced again."""
+        self._db.execute("DELETE FROM watermarks WHERE agent_id = ?", (str(agent_id),))
+
+    def all(self) -> dict[str, int]:
+        """Returns every agent's watermark."""
+        return dict(self._db.execute("SELECT agent_id, container_id FROM watermarks"))
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM watermarks").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        self._db.close()
+
+
+class HistorySync:
+    """Yields only the containers of each agent that are newer than its watermark.
+
+    History is paged newest first with ``containers.iter_all`` and paging
+    stops at the watermark, so a sync costs requests in proportion to the
+    new runs rather than to the whole history. Container IDs are assumed
+    to grow with launch time.
+
+    New containers are yielded oldest first, and an agent's watermark is
+    moved past a container once the consumer asks for the next one, or
+    when the agent's containers run out. A sync interrupted by a crash
+    therefore resumes from the first container not fully processed, and
+    at most that one container is seen twice. Yielding stops at the first
+    run that has not finished, so it is picked up with its final status
+    by a later sync; a container without a status counts as finished.
+
+    Example:
+        sync = HistorySync(client, WatermarkStore("history.db"))
+        async for agent_id, container in sync.sync(agent_ids):
+            report(agent_id, container)
+    """
+
+    def __init__(
+        self,
+        client: PhantombusterClient,
+        store: WatermarkStore,
+        page_size: int = 100,
+        backfill: bool = True,
+    ):
+        self._client = client
+        self.store = store
+        self.page_size = page_size
+        self.backfill = backfill
+
+    async def new_containers(self, agent_id: str) -> AsyncIterator[Container]:
+        """Yields an agent's containers newer than its watermark, oldest first.
+
+        An agent without a watermark has its whole history yielded, or,
+        with ``backfill`` off, its watermark set to the newest container
+        older than its first unfinished run, and nothing yielded.
+        """
+        watermark = self.store.get(agent_id)
+        pending = await self._newer(agent_id, watermark)
+        if watermark is None and not self.backfill:
+            finished: int | None = None
+            for container in pending:
+                if not _settled(container):
+                    break
+                finished = container.id
+            if finished is not None:
+                self.store.set(agent_id, finished)
+            return
+        previous: int | None = None
+        for container in pending:
+            if not _settled(container):
+                break
+            if previous is not None:
+                self.store.set(agent_id, previous)
+            yield container
+            previous = container.id
+        if previous is not None:
+            self.store.set(agent_id, previous)
+
+    async def sync(self, agent_ids: Iterable[str]) -> AsyncIterator[tuple[str, Container]]:
+        """Yields the new containers of each agent in turn, with the agent's ID."""
+        for agent_id in agent_ids:
+            async for container in self.new_containers(agent_id):
+                yield agent_id, container
+
+    async def _newer(self, agent_id: str, watermark: int | None) -> list[Container]:
+        newer: list[Container] = []
+        previous: int | None = None
+        pages = self._client.containers.iter_all(
+            agent_id, self.page_size, prefetch=watermark is None
+        )
+        try:
+            async for container in pages:
+                if container.id is None:
+                    continue
+                if watermark is None or container.id > watermark:
+                    newer.append(container)
+                elif previous is not None and previous > container.id:
+                    # Newest first and past the watermark: the rest is older.
+                    break
+                previous = container.id
+        finally:
+            await pages.aclose()
+        newer.sort(key=lambda container: container.id)
+        return newer
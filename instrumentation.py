@@ -0,0 +1,237 @@
+"""
+Request lifecycle instrumentation for the PhantomBuster SDK.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Callable, Union
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestEvent:
+    """What happened to one request, reported when it finishes.
+
+    ``endpoint`` is the route, with IDs and names in the path replaced by
+    placeholders, so it is safe to use as a metric label. Times are in
+    seconds and cover every attempt. ``connect`` and
+    ``ttfb`` come from the HTTP transport's trace and are None when it
+    reported nothing, e.g. when a pooled connection was reused or the
+    transport is mocked. The bodies of streamed responses are not counted
+    in ``bytes_received``.
+    """
+
+    method: str
+    endpoint: str
+    family: str
+    status: int | None = None
+    error: str | None = None
+    retries: int = 0
+    duration: float = 0.0
+    limiter_wait: float = 0.0
+    network: float = 0.0
+    connect: float | None = None
+    ttfb: float | None = None
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+
+@dataclass
+class DecodeEvent:
+    """The cost of turning one response body into Python objects.
+
+    With validation, pydantic-core parses and validates the body in one
+    pass, all of which is reported as ``validate``. Trusted decoding
+    reports the JSON parse as ``decode`` and building the models as
+    ``validate``; plain JSON and lazy lists only decode.
+    """
+
+    endpoint: str
+    model: str | None
+    bytes: int
+    decode: float = 0.0
+    validate: float = 0.0
+
+
+Event = Union[RequestEvent, DecodeEvent]
+Hook = Callable[[Event], Any]
+
+
+class EventBus:
+    """Delivers instrumentation events to subscribed hooks.
+
+    Hooks are called synchronously on the event loop as each request
+    finishes, so they should only record the event. An exception raised
+    by a hook is logged and does not affect the request. Nothing is
+    measured while no hook is subscribed.
+
+    Example:
+        histograms = HistogramAggregator()
+        client.events.subscribe(histograms)
+        ...
+        print(histograms.snapshot())
+    """
+
+    def __init__(self) -> None:
+        self._hooks: tuple[Hook, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self._hooks)
+
+    def subscribe(self, hook: Hook) -> None:
+        """Starts calling ``hook`` with every event."""
+        self._hooks = (*self._hooks, hook)
+
+    def unsubscribe(self, hook: Hook) -> None:
+        """Stops calling ``hook``."""
+        hooks = list(self._hooks)
+        hooks.remove(hook)
+        self._hooks = tuple(hooks)
+
+    def emit(self, event: Event) -> None:
+        """Delivers an event to every hook."""
+        for hook in self._hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("Instrumentation hook %r failed", hook)
+
+
+# Exponential bucket bounds from 0.25ms to about 65s, in seconds.
+LATENCY_BUCKETS: tuple[float, ...] = tuple(0.00025 * 2 ** power for power in range(19))
+
+
+class Histogram:
+    """A fixed-bucket histogram of non-negative values.
+
+    Quantiles are interpolated within buckets, so they are accurate to the
+    width of the bucket they fall in.
+    """
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS):
+        self.bounds = bounds
+        # One extra bucket for values above the last bound.
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Records one value."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float | None:
+        """Returns the estimated ``q`` quantile, or None if nothing was recorded."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.max
+
+    def summary(self) -> dict[str, float | int | None]:
+        """Returns the count, mean, extremes and usual percentiles."""
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else None,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+
+_REQUEST_TIMINGS = ("duration", "limiter_wait", "network", "connect", "ttfb")
+
+
+class HistogramAggregator:
+    """An in-memory hook keeping latency histograms and counters per endpoint.
+
+    Subscribe it to a client's :class:`EventBus` and read
+    :meth:`snapshot` to see, per endpoint, how long requests spent queued
+    in the limiter, on the network and being decoded and validated.
+    """
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS):
+        self.bounds = bounds
+        self._histograms: dict[tuple[str, str], Histogram] = {}
+        self._statuses: dict[tuple[str, str], int] = {}
+        self._retries: dict[str, int] = {}
+        self._bytes: dict[tuple[str, str], int] = {}
+
+    def __call__(self, event: Event) -> None:
+        if isinstance(event, RequestEvent):
+            for name in _REQUEST_TIMINGS:
+                value = getattr(event, name)
+                if value is not None:
+                    self._observe(event.endpoint, name, value)
+            outcome = str(event.status) if event.status is not None else event.error or "error"
+            key = (event.endpoint, outcome)
+            self._statuses[key] = self._statuses.get(key, 0) + 1
+            self._retries[event.endpoint] = self._retries.get(event.endpoint, 0) + event.retries
+            self._count_bytes(event.endpoint, "sent", event.bytes_sent)
+            self._count_bytes(event.endpoint, "received", event.bytes_received)
+        else:
+            if event.decode:
+                self._observe(event.endpoint, "decode", event.decode)
+            if event.validate:
+                self._observe(event.endpoint, "validate", event.validate)
+
+    def _observe(self, endpoint: str, name: str, value: float) -> None:
+        histogram = self._histograms.get((endpoint, name))
+        if histogram is None:
+            histogram = self._histograms[endpoint, name] = Histogram(self.bounds)
+        histogram.observe(value)
+
+    def _count_bytes(self, endpoint: str, direction: str, count: int) -> None:
+        self._bytes[endpoint, direction] = self._bytes.get((endpoint, direction), 0) + count
+
+    def histogram(self, endpoint: str, name: str) -> Histogram | None:
+        """Returns one histogram, e.g. ``("v2:/agents/fetch", "limiter_wait")``."""
+        return self._histograms.get((endpoint, name))
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Returns every endpoint's timing summaries, status counts, retries and bytes."""
+        endpoints: dict[str, dict[str, Any]] = {}
+
+        def entry(endpoint: str) -> dict[str, Any]:
+            return endpoints.setdefault(
+                endpoint,
+                {"statuses": {}, "retries": 0, "bytes_sent": 0, "bytes_received": 0},
+            )
+
+        for (endpoint, name), histogram in self._histograms.items():
+            entry(endpoint)[name] = histogram.summary()
+        for (endpoint, outcome), count in self._statuses.items():
+            entry(endpoint)["statuses"][outcome] = count
+        for endpoint, retries in self._retries.items():
+            entry(endpoint)["retries"] = retries
+        for (endpoint, direction), count in self._bytes.items():
+            entry(endpoint)[f"bytes_{direction}"] = count
+        return endpoints
+
+    def reset(self) -> None:
+        """Forgets everything recorded so far."""
+        self._histograms.clear()
+        self._statuses.clear()
+        self._retries.clear()
+        self._bytes.clear()
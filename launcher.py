@@ -0,0 +1,163 @@
+"""
+Slot-aware bulk launching of agents.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, AsyncIterator, Iterable
+
+from .__global_exceptions__ import AuthenticationError, NotFoundError, PhantomBusterAPIError
+
+if TYPE_CHECKING:
+    from .client import PhantombusterClient
+    from .__global_models__ import Container
+
+
+@dataclass
+class LaunchOutcome:
+    """The outcome of launching one agent.
+
+    Attributes:
+        index: Position of the agent in the launched sequence.
+        agent_id: The ID of the agent.
+        container: The container of the run, if the agent was launched.
+        error: The error of the last attempt, if it was not.
+        attempts: The number of launch attempts made.
+        waited: Seconds from the start of the bulk launch until the agent
+            was launched or given up on.
+    """
+
+    index: int
+    agent_id: int
+    container: Container | None = None
+    error: PhantomBusterAPIError | None = None
+    attempts: int = 0
+    waited: float = 0.0
+
+    @property
+    def launched(self) -> bool:
+        """Whether the agent was launched."""
+        return self.container is not None
+
+
+class BulkLauncher:
+    """Launches many agents, keeping the organization's execution slots full.
+
+    Capacity is the plan's ``slots`` from ``orgs.fetch_resources``, less
+    ``reserve``. Occupancy is polled with ``orgs.fetch_running_containers``,
+    so runs started elsewhere are accounted for. Each poll launches as many
+    queued agents as there are free slots; containers launched since the
+    previous poll count as occupied even if the running list does not show
+    them yet. While no slot frees up the poll interval doubles, up to
+    ``max_interval``, and it resets as soon as one does.
+
+    A failed launch is queued again, up to ``max_attempts`` attempts, except
+    for NotFoundError, which is final, and AuthenticationError, which stops
+    the bulk launch once the other launches of its batch have finished.
+
+    Example:
+        launcher = BulkLauncher(client, reserve=1)
+        for outcome in await launcher.run(agent_ids):
+            print(outcome.agent_id, outcome.container or outcome.error)
+    """
+
+    def __init__(
+        self,
+        client: PhantombusterClient,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        max_attempts: int = 3,
+        reserve: int = 0,
+        slots: int | None = None,
+    ):
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Poll intervals must satisfy 0 < min_interval <= max_interval.")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self._client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_attempts = max_attempts
+        self.reserve = reserve
+        self.slots = slots
+
+    async def run(self, agent_ids: Iterable[int]) -> list[LaunchOutcome]:
+        """Launches every agent and waits until each is launched or given up on.
+
+        Returns:
+            One outcome per agent, in the order of ``agent_ids``.
+        """
+        outcomes = [outcome async for outcome in self.launches(agent_ids)]
+        outcomes.sort(key=lambda outcome: outcome.index)
+        return outcomes
+
+    async def launches(self, agent_ids: Iterable[int]) -> AsyncIterator[LaunchOutcome]:
+        """Launches every agent, yielding each outcome as soon as it is final.
+
+        Raises:
+            ValueError: If the plan's slot count is unknown and ``slots``
+                was not given, or ``reserve`` leaves no slot.
+            AuthenticationError: If the API key is rejected, once the
+                outcomes of the batch it happened in have been yielded.
+        """
+        queue = deque(LaunchOutcome(index, agent_id) for index, agent_id in enumerate(agent_ids))
+        if not queue:
+            return
+        capacity = await self._capacity()
+        started = time.monotonic()
+        interval = self.min_interval
+        recent: set[int] = set()
+        while queue:
+            running = {c.id for c in await self._client.orgs.fetch_running_containers()}
+            free = capacity - len(running | recent)
+            batch = [queue.popleft() for _ in range(max(0, min(free, len(queue))))]
+            results = await asyncio.gather(
+                *(self._launch(outcome) for outcome in batch), return_exceptions=True
+            )
+            # Finish the batch before raising, so no launched container goes unreported.
+            failure = next((r for r in results if isinstance(r, BaseException)), None)
+            recent = set()
+            for outcome in batch:
+                outcome.waited = time.monotonic() - started
+                if outcome.container is not None:
+                    if outcome.container.id is not None:
+                        recent.add(outcome.container.id)
+                    yield outcome
+                elif (
+                    failure is not None
+                    or isinstance(outcome.error, NotFoundError)
+                    or outcome.attempts >= self.max_attempts
+                ):
+                    yield outcome
+                else:
+                    queue.append(outcome)
+            if failure is not None:
+                raise failure
+            if queue:
+                interval = self.min_interval if free > 0 else min(interval * 2, self.max_interval)
+                await asyncio.sleep(interval)
+
+    async def _capacity(self) -> int:
+        slots = self.slots
+        if slots is None:
+            slots = (await self._client.orgs.fetch_resources()).slots
+        if slots is None:
+            raise ValueError("The plan does not report its slots; pass slots explicitly.")
+        if slots - self.reserve < 1:
+            raise ValueError(f"Reserving {self.reserve} of {slots} slots leaves none to launch.")
+        return slots - self.reserve
+
+    async def _launch(self, outcome: LaunchOutcome) -> None:
+        outcome.attempts += 1
+        try:
+            outcome.container = await self._client.agents.launch(outcome.agent_id)
+            outcome.error = None
+        except AuthenticationError as e:
+            outcome.error = e
+            raise
+        except PhantomBusterAPIError as e:
+            outcome.error = e
@@ -0,0 +1,72 @@
+"""
+Lazily validated model sequences for large list responses.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator, Sequence, overload
+
+from .decoding import ModelT
+
+
+class LazyModelList(Sequence[ModelT]):
+    """A read-only sequence of models backed by the decoded raw items.
+
+    An item is only turned into a model when it is accessed, and the
+    model is not kept, so iterating over 100k leads holds one ``Lead`` at
+    a time on top of the raw data. Slicing returns another lazy list
+    sharing the same raw items.
+
+    Example:
+        leads = await client.org_storage.fetch_leads_by_list(list_id, lazy=True)
+        for lead in leads[:100]:
+            ...
+    """
+
+    __slots__ = ("_model", "_items", "_build")
+
+    def __init__(
+        self,
+        model: type[ModelT],
+        items: list[dict[str, Any]],
+        build: Callable[[type[ModelT], dict[str, Any]], ModelT],
+    ):
+        self._model = model
+        self._items = items
+        self._build = build
+
+    @property
+    def model(self) -> type[ModelT]:
+        """The model class items are built as."""
+        return self._model
+
+    @property
+    def raw(self) -> list[dict[str, Any]]:
+        """The decoded items, as returned by the API."""
+        return self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> ModelT: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> LazyModelList[ModelT]: ...
+
+    def __getitem__(self, index: int | slice) -> ModelT | LazyModelList[ModelT]:
+        if isinstance(index, slice):
+            return LazyModelList(self._model, self._items[index], self._build)
+        return self._build(self._model, self._items[index])
+
+    def __iter__(self) -> Iterator[ModelT]:
+        build, model = self._build, self._model
+        for item in self._items:
+            yield build(model, item)
+
+    def to_list(self) -> list[ModelT]:
+        """Builds every item and returns them as a regular list."""
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"LazyModelList[{self._model.__name__}]({len(self._items)} items)"
@@ -0,0 +1,237 @@
+"""
+Prometheus metrics exporter for the PhantomBuster SDK.
+"""
+
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Iterable
+
+from .circuit_breaker import CLOSED, HALF_OPEN, OPEN
+from .instrumentation import LATENCY_BUCKETS, DecodeEvent, Event, Histogram, RequestEvent
+
+if TYPE_CHECKING:
+    from .client import PhantombusterClient
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_CIRCUIT_STATES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class PrometheusExporter:
+    """Keeps the SDK's metrics and renders them in the Prometheus text format.
+
+    The exporter is an instrumentation hook: attach it to one or more
+    clients and it counts their requests from the events they emit.
+    Updating a metric is a dictionary lookup and a few additions on the
+    event loop, with no lock; :meth:`render` copies each metric before
+    reading it, so it can run on another thread such as the one
+    :meth:`serve` starts. Circuit states and cache counters are read from
+    the attached clients when rendering.
+
+    Example:
+        exporter = PrometheusExporter()
+        exporter.attach(client)
+        exporter.serve(9464)
+    """
+
+    def __init__(
+        self, namespace: str = "phantombuster", buckets: tuple[float, ...] = LATENCY_BUCKETS
+    ):
+        self.namespace = namespace
+        self.buckets = buckets
+        self._clients: list[PhantombusterClient] = []
+        self._requests: dict[tuple[str, str, str], int] = {}
+        self._retries: dict[str, int] = {}
+        self._durations: dict[str, Histogram] = {}
+        self._limiter_waits: dict[str, Histogram] = {}
+        self._decodes: dict[tuple[str, str], Histogram] = {}
+
+    def attach(self, client: PhantombusterClient) -> None:
+        """Subscribes to a client's events and reports its circuits and cache."""
+        client.events.subscribe(self)
+        self._clients.append(client)
+
+    def detach(self, client: PhantombusterClient) -> None:
+        """Stops following a client."""
+        client.events.unsubscribe(self)
+        self._clients.remove(client)
+
+    def __call__(self, event: Event) -> None:
+        if isinstance(event, RequestEvent):
+            status = str(event.status) if event.status is not None else event.error or "error"
+            key = (event.endpoint, event.method, status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            if event.retries:
+                retries = self._retries.get(event.endpoint, 0)
+                self._retries[event.endpoint] = retries + event.retries
+            self._histogram(self._durations, event.endpoint).observe(event.duration)
+            self._histogram(self._limiter_waits, event.family).observe(event.limiter_wait)
+        elif isinstance(event, DecodeEvent):
+            for phase in ("decode", "validate"):
+                seconds = getattr(event, phase)
+                if seconds:
+                    self._histogram(self._decodes, (event.endpoint, phase)).observe(seconds)
+
+    def _histogram(self, histograms: dict, key: object) -> Histogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = Histogram(self.buckets)
+        return histogram
+
+    def render(self) -> str:
+        """Returns every metric in the Prometheus text exposition format."""
+        lines: list[str] = []
+        name = self.namespace
+        self._counter(
+            lines, f"{name}_requests_total", "Finished requests by endpoint, method and status.",
+            ("endpoint", "method", "status"), list(self._requests.items()),
+        )
+        self._counter(
+            lines, f"{name}_retries_total", "Retries made, by endpoint.",
+            ("endpoint",), [((endpoint,), count) for endpoint, count in list(self._retries.items())],
+        )
+        self._histograms(
+            lines, f"{name}_request_duration_seconds",
+            "Request latency including limiter waits and retries.",
+            ("endpoint",), [((endpoint,), h) for endpoint, h in list(self._durations.items())],
+        )
+        self._histograms(
+            lines, f"{name}_limiter_wait_seconds", "Time requests spent queued in the rate limiter.",
+            ("family",), [((family,), h) for family, h in list(self._limiter_waits.items())],
+        )
+        self._histograms(
+            lines, f"{name}_decode_seconds", "Time spent decoding and validating response bodies.",
+            ("endpoint", "phase"), list(self._decodes.items()),
+        )
+
+        circuits: dict[tuple[str, ...], int] = {}
+        hits = misses = 0
+        caching = False
+        for client in list(self._clients):
+            if client._breaker is not None:
+                for endpoint, state in client._breaker.states().items():
+                    key = (endpoint,)
+                    circuits[key] = max(circuits.get(key, 0), _CIRCUIT_STATES[state])
+            if client._cache is not None:
+                caching = True
+                stats = client._cache.stats()
+                hits += stats["hits"]
+                misses += stats["misses"]
+        self._gauge(
+            lines, f"{name}_circuit_state", "Circuit state: 0 closed, 1 half-open, 2 open.",
+            ("endpoint",), circuits.items(),
+        )
+        if caching:
+            self._counter(
+                lines, f"{name}_cache_hits_total", "Responses served from the cache.",
+                (), [((), hits)],
+            )
+            self._counter(
+                lines, f"{name}_cache_misses_total", "Cacheable requests sent upstream.",
+                (), [((), misses)],
+            )
+            ratio = hits / (hits + misses) if hits + misses else 0.0
+            self._gauge(
+                lines, f"{name}_cache_hit_ratio", "Share of cacheable requests served from the cache.",
+                (), [((), ratio)],
+            )
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _header(lines: list[str], name: str, kind: str, help: str) -> None:
+        lines.append(f"# HELP {name} {help}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    def _counter(
+        self,
+        lines: list[str],
+        name: str,
+        help: str,
+        label_names: tuple[str, ...],
+        samples: Iterable[tuple[tuple[str, ...], int]],
+    ) -> None:
+        self._header(lines, name, "counter", help)
+        for values, count in samples:
+            lines.append(f"{name}{_labels(label_names, values)} {count}")
+
+    def _gauge(
+        self,
+        lines: list[str],
+        name: str,
+        help: str,
+        label_names: tuple[str, ...],
+        samples: Iterable[tuple[tuple[str, ...], float]],
+    ) -> None:
+        self._header(lines, name, "gauge", help)
+        for values, value in samples:
+            lines.append(f"{name}{_labels(label_names, values)} {_number(value)}")
+
+    def _histograms(
+        self,
+        lines: list[str],
+        name: str,
+        help: str,
+        label_names: tuple[str, ...],
+        samples: Iterable[tuple[tuple[str, ...], Histogram]],
+    ) -> None:
+        self._header(lines, name, "histogram", help)
+        for values, histogram in samples:
+            counts = list(histogram.counts)
+            total = histogram.sum
+            cumulative = 0
+            for bound, count in zip((*histogram.bounds, float("inf")), counts):
+                cumulative += count
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{name}_bucket{_labels(label_names, values, le)} {cumulative}")
+            lines.append(f"{name}_sum{_labels(label_names, values)} {_number(total)}")
+            lines.append(f"{name}_count{_labels(label_names, values)} {cumulative}")
+
+    def serve(self, port: int = 9464, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serves the metrics at ``/metrics`` from a daemon thread.
+
+        Returns:
+            The server; call its ``shutdown()`` method to stop it.
+        """
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        thread = threading.Thread(
+            target=server.serve_forever, name="phantombuster-metrics", daemon=True
+        )
+        thread.start()
+        return server
@@ -0,0 +1,522 @@
+"""
+Local mock of the PhantomBuster API for offline benchmarks and soak tests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Literal
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+from pydantic import BaseModel, Field
+
+
+class MockServerConfig(BaseModel):
+    """Behavior of the mock PhantomBuster API."""
+
+    latency_distribution: Literal["fixed", "uniform", "exponential", "lognormal"] = Field(
+        default="fixed",
+        description="Shape of the simulated server latency.",
+    )
+    latency: float = Field(default=0.0, ge=0, description="Median latency in seconds.")
+    latency_spread: float = Field(
+        default=0.5,
+        ge=0,
+        description="Relative half-width for 'uniform', or sigma for 'lognormal'.",
+    )
+    endpoint_latency: dict[str, float] = Field(
+        default_factory=dict,
+        description="Median latency for specific endpoints, keyed '<version>:<path>'.",
+    )
+    server_error_rate: float = Field(
+        default=0.0, ge=0, le=1, description="Share of requests answered with a 5xx."
+    )
+    server_error_status: int = Field(default=503, description="Status of injected server errors.")
+    rate_limit_rate: float = Field(
+        default=0.0, ge=0, le=1, description="Share of requests answered with a 429."
+    )
+    retry_after: float | None = Field(
+        default=1.0,
+        ge=0,
+        description="Retry-After sent with injected 429s and 5xx. None sends none.",
+    )
+    quota: int | None = Field(
+        default=None,
+        ge=1,
+        description="Requests allowed per quota window, advertised in X-RateLimit-* headers.",
+    )
+    quota_window: float = Field(
+        default=60.0, gt=0, description="Length of a quota window, in seconds."
+    )
+    list_size: int = Field(default=100, ge=0, description="Items returned by list endpoints.")
+    result_size: int = Field(
+        default=1000, ge=0, description="Records in a container's result object."
+    )
+    csv_rows: int = Field(default=1000, ge=0, description="Rows in the usage CSV exports.")
+    slots: int = Field(
+        default=5, ge=0, description="Execution slots advertised by fetch-resources."
+    )
+    container_duration: float = Field(
+        default=0.0,
+        ge=0,
+        description="Seconds a launched container stays running.",
+    )
+    chunk_size: int = Field(
+        default=64 * 1024,
+        ge=1,
+        description="Bodies larger than this are streamed to the client in chunks of this size.",
+    )
+    seed: int | None = Field(default=None, description="Seed for latency and fault injection.")
+
+
+_Reply = tuple[int, dict[str, str], bytes]
+
+
+class _ChunkedStream(httpx.AsyncByteStream):
+    """Delivers a body in fixed-size chunks, as a network read would."""
+
+    def __init__(self, content: bytes, chunk_size: int):
+        self._content = content
+        self._chunk_size = chunk_size
+
+    async def __aiter__(self):
+        view = memoryview(self._content)
+        for start in range(0, len(view), self._chunk_size):
+            yield bytes(view[start:start + self._chunk_size])
+
+
+class MockPhantomBuster(httpx.AsyncBaseTransport):
+    """An in-process PhantomBuster API implementing every endpoint the SDK calls.
+
+    It is an httpx transport, so a client can use it directly, with no
+    network at all; :meth:`serve` also exposes it as a local HTTP server.
+    List endpoints return generated payloads of ``list_size`` items, and
+    launched agents create containers that stay running for
+    ``container_duration`` seconds, count against ``slots``, and show up
+    in ``fetch-running-containers``.
+
+    Example:
+        server = MockPhantomBuster(MockServerConfig(latency=0.05, rate_limit_rate=0.01))
+        client = PhantombusterClient.create(config, transport=server)
+    """
+
+    def __init__(self, config: MockServerConfig | None = None):
+        self.config = config or MockServerConfig()
+        self.requests: dict[str, int] = {}
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._bodies: dict[tuple[str, int], bytes] = {}
+        self._containers: dict[int, dict[str, Any]] = {}
+        self._finish_at: dict[int, float] = {}
+        self._next_container = 1_000_000
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._routes: list[tuple[str, str, re.Pattern[str], Callable[..., _Reply]]] = [
+            ("GET", "v2", re.compile(r"/agents/fetch-all"), self._agents),
+            ("POST", "v2", re.compile(r"/agents/launch"), self._launch),
+            ("POST", "v2", re.compile(r"/agents/save"), self._save_agent),
+            ("POST", "v2", re.compile(r"/ai/completions"), self._completion),
+            ("GET", "v2", re.compile(r"/branches/fetch-all"), self._branches),
+            ("GET", "v2", re.compile(r"/branches/diff"), self._branch_diff),
+            ("POST", "v2", re.compile(r"/branches/create"), self._create_branch),
+            ("POST", "v2", re.compile(r"/branches/(?:delete|release)"), self._success),
+            ("GET", "v2", re.compile(r"/brightdata/serp"), self._serp),
+            ("POST", "v2", re.compile(r"/(?:hcaptcha|recaptcha)"), self._captcha),
+            ("GET", "v2", re.compile(r"/containers/fetch"), self._container),
+            ("GET", "v2", re.compile(r"/containers/fetch-all"), self._agent_containers),
+            ("GET", "v2", re.compile(r"/containers/fetch-result-object"), self._result_object),
+            ("POST", "v2", re.compile(r"/identities/save-with-token"), self._identity),
+            ("GET", "v2", re.compile(r"/location/ip"), self._location),
+            ("POST", "v2", re.compile(r"/org-storage/leads/by-list/(\d+)"), self._leads),
+            ("POST", "v2", re.compile(r"/org-storage/leads/save"), self._save_lead),
+            ("POST", "v2", re.compile(r"/org-storage/leads/delete-many"), self._success),
+            ("POST", "v2", re.compile(r"/org-storage/lists/delete"), self._success),
+            ("GET", "v2", re.compile(r"/orgs/fetch-resources"), self._resources),
+            ("GET", "v2", re.compile(r"/orgs/fetch-running-containers"), self._running),
+            ("GET", "v2", re.compile(r"/orgs/fetch-agent-groups"), self._agent_groups),
+            ("GET", "v2", re.compile(r"/orgs/export-(agent|container)-usage"), self._usage),
+            ("GET", "v2", re.compile(r"/scripts/fetch"), self._script),
+            ("GET", "v2", re.compile(r"/scripts/fetch-all"), self._scripts),
+            ("GET", "v2", re.compile(r"/scripts/code"), self._script_code),
+            ("POST", "v2", re.compile(r"/scripts/(?:visibility|access-list)"), self._success),
+            ("POST", "v2", re.compile(r"/scripts/(?:save|delete)"), self._success),
+            ("GET", "v1", re.compile(r"/agent/(\d+)"), self._v1_agent),
+            ("GET", "v1", re.compile(r"/script/by-name/(\w+)/(.+)"), self._v1_script),
+            ("GET", "v1", re.compile(r"/user"), self._user),
+        ]
+
+    # Transport and server.
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        delay, (status, headers, content) = self.respond(request.method, str(request.url), body)
+        if delay:
+            await asyncio.sleep(delay)
+        if len(content) > self.config.chunk_size:
+            headers = {**headers, "Content-Length": str(len(content))}
+            return httpx.Response(
+                status,
+                headers=headers,
+                stream=_ChunkedStream(content, self.config.chunk_size),
+                request=request,
+            )
+        return httpx.Response(status, headers=headers, content=content, request=request)
+
+    def serve(self, port: int = 0, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serves the mock API over HTTP from a daemon thread.
+
+        Point the client's ``base_url_v1``/``base_url_v2`` at
+        ``http://<host>:<port>/api/v1`` and ``/api/v2``.
+
+        Returns:
+            The server; ``server.server_address`` holds the bound port and
+            ``shutdown()`` stops it.
+        """
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                delay, (status, headers, content) = mock.respond(self.command, self.path, body)
+                if delay:
+                    time.sleep(delay)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = _handle
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        thread = threading.Thread(
+            target=server.serve_forever, name="phantombuster-mock", daemon=True
+        )
+        thread.start()
+        return server
+
+    def respond(self, method: str, url: str, body: bytes = b"") -> tuple[float, _Reply]:
+        """Answers one request.
+
+        Returns:
+            The latency to simulate, in seconds, and the status, headers
+            and body of the response.
+        """
+        parts = urlsplit(url)
+        match = re.match(r".*?/api/(v1|v2)(/.*)", parts.path)
+        if match is None:
+            return 0.0, self._error(404, "Unknown API version.")
+        api_version, path = match.groups()
+        endpoint = f"{api_version}:{path}"
+        with self._lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+            delay = self._latency(endpoint)
+            quota_headers, exhausted = self._quota()
+            roll = self._random.random()
+            retry_after = self.config.retry_after
+            if exhausted is not None:
+                return delay, self._error(429, "Quota exceeded.", exhausted, quota_headers)
+            if roll < self.config.rate_limit_rate:
+                return delay, self._error(429, "Rate limited.", retry_after, quota_headers)
+            if roll < self.config.rate_limit_rate + self.config.server_error_rate:
+                status = self.config.server_error_status
+                return delay, self._error(status, "Injected failure.", retry_after, quota_headers)
+            self._finish_containers()
+            for route_method, route_version, pattern, handler in self._routes:
+                if route_method != method.upper() or route_version != api_version:
+                    continue
+                route = pattern.fullmatch(path)
+                if route is None:
+                    continue
+                query = dict(parse_qsl(parts.query))
+                payload = json.loads(body) if body else {}
+                status, headers, content = handler(*route.groups(), query=query, payload=payload)
+                return delay, (status, {**headers, **quota_headers}, content)
+        return delay, self._error(404, f"No route for {method} {endpoint}.")
+
+    # Simulation.
+
+    def _latency(self, endpoint: str) -> float:
+        median = self.config.endpoint_latency.get(endpoint, self.config.latency)
+        if median <= 0:
+            return 0.0
+        spread = self.config.latency_spread
+        distribution = self.config.latency_distribution
+        if distribution == "uniform":
+            return median * self._random.uniform(1 - spread, 1 + spread)
+        if distribution == "exponential":
+            return self._random.expovariate(math.log(2) / median)
+        if distribution == "lognormal":
+            return self._random.lognormvariate(math.log(median), spread)
+        return median
+
+    def _quota(self) -> tuple[dict[str, str], float | None]:
+        """Counts the request against the quota and returns its headers, plus
+        the seconds until reset if the quota is already used up."""
+        quota = self.config.quota
+        if quota is None:
+            return {}, None
+        now = time.monotonic()
+        if now - self._window_start >= self.config.quota_window:
+            self._window_start = now
+            self._window_count = 0
+        reset = self.config.quota_window - (now - self._window_start)
+        self._window_count += 1
+        headers = {
+            "X-RateLimit-Limit": str(quota),
+            "X-RateLimit-Remaining": str(max(0, quota - self._window_count)),
+            "X-RateLimit-Reset": str(math.ceil(reset)),
+        }
+        return headers, reset if self._window_count > quota else None
+
+    def _finish_containers(self) -> None:
+        now = time.monotonic()
+        for container_id, finish_at in list(self._finish_at.items()):
+            if finish_at <= now:
+                self._containers[container_id]["status"] = "finished"
+                del self._finish_at[container_id]
+
+    @staticmethod
+    def _json(data: Any, status: int = 200) -> _Reply:
+        return status, {"Content-Type": "application/json"}, json.dumps(data).encode()
+
+    def _error(
+        self,
+        status: int,
+        message: str,
+        retry_after: float | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> _Reply:
+        headers = dict(headers or {})
+        if retry_after is not None:
+            headers["Retry-After"] = str(math.ceil(retry_after))
+        _, json_headers, content = self._json({"error": message}, status)
+        return status, {**headers, **json_headers}, content
+
+    def _generated(self, name: str, size: int, build: Callable[[int], Any]) -> _Reply:
+        """Returns a generated JSON body, encoding it only once per size."""
+        body = self._bodies.get((name, size))
+        if body is None:
+            body = self._bodies[name, size] = json.dumps(build(size)).encode()
+        return 200, {"Content-Type": "application/json"}, body
+
+    # Endpoints.
+
+    def _agents(self, query: dict, payload: dict) -> _Reply:
+        return self._generated("agents", self.config.list_size, lambda size: {
+            "agents": [
+                {"id": index, "name": f"Agent {index}", "script_id": index % 50, "org_id": 1}
+                for index in range(1, size + 1)
+            ]
+        })
+
+    def _launch(self, query: dict, payload: dict) -> _Reply:
+        if len(self._finish_at) >= self.config.slots:
+            return self._error(400, "No execution slot available.")
+        container_id = self._next_container
+        self._next_container += 1
+        container = {"id": container_id, "agent_id": int(payload.get("id", 0)), "status": "running"}
+        self._containers[container_id] = container
+        self._finish_at[container_id] = time.monotonic() + self.config.container_duration
+        return self._json(container)
+
+    def _save_agent(self, query: dict, payload: dict) -> _Reply:
+        return self._json({
+            "id": payload.get("id") or 1,
+            "name": payload.get("name"),
+            "script_id": payload.get("script_id"),
+            "org_id": 1,
+        })
+
+    def _completion(self, query: dict, payload: dict) -> _Reply:
+        words = " ".join(["lorem"] * min(int(payload.get("max_tokens_to_sample", 16)), 4096))
+        return self._json({"completion": words, "stop_reason": "max_tokens"})
+
+    def _branches(self, query: dict, payload: dict) -> _Reply:
+        return self._generated("branches", self.config.list_size, lambda size: {
+            "branches": [
+                {"id": index, "name": f"branch-{index}", "scriptId": index % 50}
+                for index in range(1, size + 1)
+            ]
+        })
+
+    def _branch_diff(self, query: dict, payload: dict) -> _Reply:
+        return self._generated("diffs", self.config.list_size, lambda size: {
+            "diffs": [{"scriptId": index, "diff": index * 7 % 300} for index in range(1, size + 1)]
+        })
+
+    def _create_branch(self, query: dict, payload: dict) -> _Reply:
+        return self._json(
+            {"id": 1, "name": payload.get("name"), "scriptId": payload.get("scriptId")}
+        )
+
+    def _success(self, *groups: str, query: dict, payload: dict) -> _Reply:
+        return self._json({"success": True})
+
+    def _serp(self, query: dict, payload: dict) -> _Reply:
+        return self._json({
+            "query": query.get("q"),
+            "organic": [
+                {"rank": rank, "title": f"Result {rank}", "link": f"https://example.com/{rank}"}
+                for rank in range(1, int(query.get("num", 10)) + 1)
+            ],
+        })
+
+    def _captcha(self, query: dict, payload: dict) -> _Reply:
+        return self._json({"token": "mock-token", "useragent": "mock-agent"})
+
+    def _container(self, query: dict, payload: dict) -> _Reply:
+        container_id = int(query.get("id", 0))
+        container = self._containers.get(container_id)
+        if container is None:
+            container = {"id": container_id, "agent_id": container_id % 100, "status": "finished"}
+        return self._json(container)
+
+    def _agent_containers(self, query: dict, payload: dict) -> _Reply:
+        agent_id = int(query.get("agentId", 0))
+        launched = [c for c in self._containers.values() if c["agent_id"] == agent_id]
+        if "limit" in query or "beforeId" in query:
+            return self._container_page(agent_id, launched, query)
+        if launched:
+            return self._json({"containers": launched})
+        return self._generated(f"containers:{agent_id}", self.config.list_size, lambda size: {
+            "containers": [
+                {"id": agent_id * 100_000 + index, "agent_id": agent_id, "status": "finished"}
+                for index in range(size)
+            ]
+        })
+
+    def _container_page(self, agent_id: int, launched: list[dict], query: dict) -> _Reply:
+        """Returns one page of an agent's history, newest first."""
+        limit = int(query.get("limit", 0)) or None
+        before = int(query["beforeId"]) if "beforeId" in query else None
+        if launched:
+            history = sorted(launched, key=lambda c: c["id"], reverse=True)
+            if before is not None:
+                history = [c for c in history if c["id"] < before]
+            return self._json({"containers": history[:limit]})
+        base = agent_id * 100_000
+        end = self.config.list_size
+        if before is not None:
+            end = max(0, min(end, before - base))
+        start = 0 if limit is None else max(0, end - limit)
+        return self._json({
+            "containers": [
+                {"id": base + index, "agent_id": agent_id, "status": "finished"}
+                for index in range(end - 1, start - 1, -1)
+            ]
+        })
+
+    def _result_object(self, query: dict, payload: dict) -> _Reply:
+        return self._generated("result", self.config.result_size, lambda size: [
+            {
+                "profileUrl": f"https://www.linkedin.com/in/profile-{index}",
+                "fullName": f"First{index} Last{index}",
+                "company": f"Company {index % 500}",
+                "connections": index % 1000,
+            }
+            for index in range(size)
+        ])
+
+    def _identity(self, query: dict, payload: dict) -> _Reply:
+        return self._json({"id": 1, "name": payload.get("name")})
+
+    def _location(self, query: dict, payload: dict) -> _Reply:
+        return self._json({"ip": "127.0.0.1", "country": "FR"})
+
+    def _leads(self, list_id: str, query: dict, payload: dict) -> _Reply:
+        return self._generated(f"leads:{list_id}", self.config.list_size, lambda size: {
+            "leads": [
+                {
+                    "id": index,
+                    "data": {
+                        "firstName": f"First{index}",
+                        "lastName": f"Last{index}",
+                        "company": f"Company {index % 500}",
+                        "connections": index % 1000,
+                    },
+                }
+                for index in range(size)
+            ]
+        })
+
+    def _save_lead(self, query: dict, payload: dict) -> _Reply:
+        return self._json({"id": payload.get("id") or 1, "data": payload.get("data", {})})
+
+    def _resources(self, query: dict, payload: dict) -> _Reply:
+        return self._json({
+            "id": 1,
+            "name": "Mock org",
+            "plan": "pro",
+            "execution_time": 0,
+            "slots": self.config.slots,
+            "storage_mb": 0,
+        })
+
+    def _running(self, query: dict, payload: dict) -> _Reply:
+        return self._json({"containers": [self._containers[c] for c in self._finish_at]})
+
+    def _agent_groups(self, query: dict, payload: dict) -> _Reply:
+        return self._generated("agent_groups", self.config.list_size, lambda size: {
+            "agent_groups": [
+                {"id": index, "name": f"Group {index}", "agent_ids": [index, index + 1]}
+                for index in range(1, size + 1)
+            ]
+        })
+
+    def _usage(self, kind: str, query: dict, payload: dict) -> _Reply:
+        body = self._bodies.get((f"usage:{kind}", self.config.csv_rows))
+        if body is None:
+            lines = [f"{kind}Id,name,executionTime"]
+            lines += [f"{row},{kind} {row},{row % 600}.5" for row in range(self.config.csv_rows)]
+            body = "\n".join(lines).encode()
+            self._bodies[f"usage:{kind}", self.config.csv_rows] = body
+        return 200, {"Content-Type": "text/csv"}, body
+
+    def _script(self, query: dict, payload: dict) -> _Reply:
+        return self._json(self._script_data(query.get("id", "1")))
+
+    @staticmethod
+    def _script_data(script_id: str, name: str | None = None) -> dict[str, Any]:
+        return {
+            "id": script_id,
+            "name": name or f"script-{script_id}.js",
+            "version": 1,
+            "script": "// mock script",
+            "visibility": "private",
+        }
+
+    def _scripts(self, query: dict, payload: dict) -> _Reply:
+        return self._generated("scripts", self.config.list_size, lambda size: {
+            "scripts": [self._script_data(str(index)) for index in range(1, size + 1)]
+        })
+
+    def _script_code(self, query: dict, payload: dict) -> _Reply:
+        return 200, {"Content-Type": "text/plain"}, f"// code of {query.get('id')}\n".encode()
+
+    def _v1_agent(self, agent_id: str, query: dict, payload: dict) -> _Reply:
+        return self._json(
+            {"id": int(agent_id), "name": f"Agent {agent_id}", "script_id": 1, "org_id": 1}
+        )
+
+    def _v1_script(self, mode: str, name: str, query: dict, payload: dict) -> _Reply:
+        return self._json(self._script_data("1", name))
+
+    def _user(self, query: dict, payload: dict) -> _Reply:
+        return self._json({"id": 1, "name": "Mock user", "email": "user@example.com", "agents": []})
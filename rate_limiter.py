@@ -0,0 +1,251 @@
+"""
+Adaptive, header-driven rate limiting for the PhantomBuster SDK.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Mapping
+
+if TYPE_CHECKING:
+    from .config import RateLimitConfig
+
+
+def endpoint_family(url: str, api_version: str = "v2") -> str:
+    """Returns the rate-limit family of an endpoint path.
+
+    The family is the API version plus the first path segment, so
+    ``/agents/fetch-all`` and ``/agents/launch`` share the ``v2:agents``
+    bucket while ``/ai/completions`` gets its own.
+    """
+    path = url.split("?", 1)[0].strip("/")
+    segment = path.split("/", 1)[0] or "root"
+    return f"{api_version}:{segment}"
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parses a ``Retry-After`` header into a delay in seconds.
+
+    Both the delta-seconds and the HTTP-date forms are supported.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _header(headers: Mapping[str, str], *names: str) -> str | None:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+def _parse_reset(value: str | None) -> float | None:
+    """Parses a rate-limit reset header into seconds from now.
+
+    Servers send either a delta in seconds or an absolute epoch timestamp;
+    anything larger than a day is treated as the latter.
+    """
+    if value is None:
+        return None
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    if reset > 86400:
+        reset -= time.time()
+    return max(0.0, reset)
+
+
+class _TokenBucket:
+    """A token bucket whose refill rate can be changed at runtime.
+
+    Waiters are served in ticket order rather than arrival order, so a
+    retried request that re-queues with its original ticket goes ahead of
+    requests that were issued after it.
+    """
+
+    def __init__(self, rate: float, config: RateLimitConfig):
+        self._config = config
+        self.rate = rate
+        self.tokens = min(rate, float(config.burst or rate))
+        self.blocked_until = 0.0
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[int, asyncio.Future[None]]] = []
+        self._dispatcher: asyncio.Task[None] | None = None
+
+    @property
+    def capacity(self) -> float:
+        return max(1.0, float(self._config.burst or self.rate))
+
+    @property
+    def queued(self) -> int:
+        """The number of requests waiting for a token."""
+        return len(self._waiters)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self._updated = now
+
+    async def acquire(self, ticket: int) -> float:
+        """Waits for a token and returns the time spent waiting."""
+        started = time.monotonic()
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        heapq.heappush(self._waiters, (ticket, future))
+        if (
+            self._dispatcher is None
+            or self._dispatcher.done()
+            or self._dispatcher.get_loop() is not loop
+        ):
+            self._dispatcher = loop.create_task(self._dispatch())
+        await future
+        return time.monotonic() - started
+
+    async def _dispatch(self) -> None:
+        while self._waiters:
+            if self._waiters[0][1].done():
+                # The waiter was cancelled while queued.
+                heapq.heappop(self._waiters)
+                continue
+            now = time.monotonic()
+            if now < self.blocked_until:
+                await asyncio.sleep(self.blocked_until - now)
+                continue
+            self._refill(now)
+            if self.tokens < 1.0:
+                await asyncio.sleep((1.0 - self.tokens) / self.rate)
+                continue
+            _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self.tokens -= 1.0
+                future.set_result(None)
+
+    def set_rate(self, rate: float) -> None:
+        self._refill(time.monotonic())
+        self.rate = min(self._config.max_rate, max(self._config.min_rate, rate))
+        self.tokens = min(self.tokens, self.capacity)
+
+    def block_for(self, seconds: float) -> None:
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+
+class AdaptiveRateLimiter:
+    """Per-endpoint-family rate limiter that tunes itself from response headers.
+
+    Each family starts at the configured rate. Quota headers
+    (``X-RateLimit-*`` or the IETF ``RateLimit-*`` fields) pin the rate to
+    what the server says is left in the current window, ``Retry-After``
+    pauses the family, and when the server sends neither the limiter
+    probes upwards additively and backs off multiplicatively on 429s.
+    """
+
+    def __init__(self, config: RateLimitConfig):
+        self.config = config
+        self._buckets: dict[str, _TokenBucket] = {}
+        self._tickets = itertools.count()
+
+    def _bucket(self, family: str) -> _TokenBucket:
+        bucket = self._buckets.get(family)
+        if bucket is None:
+            rate = self.config.family_rates.get(family, self.config.requests_per_second)
+            bucket = self._buckets[family] = _TokenBucket(rate, self.config)
+        return bucket
+
+    def rate(self, family: str) -> float:
+        """Returns the current allowed rate for a family, in requests per second."""
+        return self._bucket(family).rate
+
+    def rates(self) -> dict[str, float]:
+        """Returns the current allowed rate of every family seen so far."""
+        return {family: bucket.rate for family, bucket in self._buckets.items()}
+
+    def queued(self, family: str) -> int:
+        """Returns the number of requests waiting for a token in a family."""
+        bucket = self._buckets.get(family)
+        return bucket.queued if bucket is not None else 0
+
+    def available(self, family: str) -> float:
+        """Returns the tokens a family could spend right now without waiting."""
+        bucket = self._bucket(family)
+        bucket._refill(time.monotonic())
+        if time.monotonic() < bucket.blocked_until:
+            return 0.0
+        return bucket.tokens - bucket.queued
+
+    def ticket(self) -> int:
+        """Returns a new place in line.
+
+        Lower tickets are served first, so a request should take one ticket
+        when it is issued and reuse it for every retry.
+        """
+        return next(self._tickets)
+
+    async def acquire(self, family: str, ticket: int | None = None) -> float:
+        """Waits until a request to ``family`` may be sent.
+
+        Args:
+            family: The endpoint family, see :func:`endpoint_family`.
+            ticket: The request's place in line. A new one is taken if omitted.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        if ticket is None:
+            ticket = self.ticket()
+        return await self._bucket(family).acquire(ticket)
+
+    def observe(self, family: str, status_code: int, headers: Mapping[str, str]) -> None:
+        """Adjusts the family's rate from a response's status and headers."""
+        bucket = self._bucket(family)
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        if status_code == 429 or (status_code == 503 and retry_after is not None):
+            if retry_after is not None:
+                bucket.block_for(retry_after)
+            if self.config.adaptive:
+                bucket.set_rate(bucket.rate * self.config.decrease_factor)
+            return
+
+        if not self.config.adaptive:
+            return
+        limit = _header(headers, "X-RateLimit-Limit", "RateLimit-Limit")
+        remaining = _header(headers, "X-RateLimit-Remaining", "RateLimit-Remaining")
+        reset = _parse_reset(_header(headers, "X-RateLimit-Reset", "RateLimit-Reset"))
+        if remaining is not None and reset is not None:
+            try:
+                remaining_count = float(remaining)
+            except ValueError:
+                remaining_count = None
+            if remaining_count is not None:
+                if remaining_count <= 0:
+                    bucket.block_for(reset)
+                    return
+                window = max(reset, 1.0)
+                bucket.set_rate(remaining_count / window * self.config.safety_margin)
+                return
+        if limit is not None and reset is None:
+            # A bare limit is treated as a per-second quota.
+            try:
+                bucket.set_rate(float(limit) * self.config.safety_margin)
+                return
+            except ValueError:
+                pass
+        if 200 <= status_code < 300:
+            bucket.set_rate(bucket.rate + self.config.increase_step)
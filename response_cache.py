@@ -0,0 +1,179 @@
+"""
+In-memory response cache for read-only PhantomBuster endpoints.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable, Hashable
+
+import httpx
+
+from .rate_limiter import endpoint_family
+
+if TYPE_CHECKING:
+    from .config import CacheConfig
+
+
+def endpoint_key(url: str, api_version: str = "v2") -> str:
+    """Returns the ``<version>:<path>`` key used for TTLs and invalidation rules."""
+    return f"{api_version}:{url.split('?', 1)[0]}"
+
+
+def route_key(url: str, api_version: str = "v2") -> str:
+    """Returns the endpoint key with the IDs and names in its path replaced
+    by placeholders.
+
+    ``/agent/42`` and ``/agent/43`` both become ``v1:/agent/{id}``, and
+    the segments after ``by-name`` become ``{name}``. Use it wherever one
+    key per resource would grow without bound, such as circuits and
+    metric labels.
+    """
+    segments = []
+    named = False
+    for segment in url.split("?", 1)[0].split("/"):
+        if named:
+            segments.append("{name}")
+        elif segment.isdigit():
+            segments.append("{id}")
+        else:
+            segments.append(segment)
+            named = segment == "by-name"
+    return f"{api_version}:{'/'.join(segments)}"
+
+
+@dataclass
+class _CacheEntry:
+    response: httpx.Response
+    endpoint: str
+    family: str
+    etag: str | None
+    expires_at: float
+    size: int
+
+
+class ResponseCache:
+    """A TTL and LRU bounded cache of successful GET responses.
+
+    Only endpoints listed in ``config.ttls`` are cached. Stale entries that
+    carried an ``ETag`` are revalidated with ``If-None-Match`` and renewed
+    on a 304. Any other request evicts the entries of its own endpoint
+    family plus those listed for it in ``config.invalidates``, so for
+    example ``agents.save`` drops the cached ``agents.fetch_all``.
+    """
+
+    def __init__(self, config: CacheConfig):
+        self.config = config
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._bytes = 0
+        # Bumped on every invalidation, so that a read which raced with a
+        # mutation does not put a pre-mutation response back in the cache.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, url: str, api_version: str = "v2") -> float | None:
+        """Returns the TTL of an endpoint, or None if it is not cached."""
+        return self.config.ttls.get(endpoint_key(url, api_version))
+
+    def get(self, key: Hashable) -> httpx.Response | None:
+        """Returns a fresh cached response, or None."""
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.response
+
+    async def fetch(
+        self,
+        key: Hashable,
+        url: str,
+        api_version: str,
+        send: Callable[[dict[str, str] | None], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Fetches a response through the cache.
+
+        Args:
+            key: The request's cache key.
+            url: The endpoint path.
+            api_version: The endpoint's API version.
+            send: Sends the request with the given extra headers.
+        """
+        ttl = self.ttl_for(url, api_version)
+        if ttl is None:
+            return await send(None)
+        self.misses += 1
+        entry = self._entries.get(key)
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        generation = self._generation
+        response = await send(headers)
+        if response.status_code == 304 and entry is not None:
+            self.revalidations += 1
+            if generation == self._generation and key in self._entries:
+                entry.expires_at = time.monotonic() + ttl
+                self._entries.move_to_end(key)
+            return entry.response
+        if generation == self._generation and response.status_code == 200:
+            self._store(key, response, url, api_version, ttl)
+        return response
+
+    def _store(
+        self, key: Hashable, response: httpx.Response, url: str, api_version: str, ttl: float
+    ) -> None:
+        size = len(response.content)
+        if size > self.config.max_bytes:
+            return
+        self._discard(key)
+        self._entries[key] = _CacheEntry(
+            response=response,
+            endpoint=endpoint_key(url, api_version),
+            family=endpoint_family(url, api_version),
+            etag=response.headers.get("ETag"),
+            expires_at=time.monotonic() + ttl,
+            size=size,
+        )
+        self._bytes += size
+        while len(self._entries) > self.config.max_entries or self._bytes > self.config.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def invalidate_for(self, url: str, api_version: str = "v2") -> None:
+        """Evicts the entries a mutation of ``url`` may have made stale."""
+        family = endpoint_family(url, api_version)
+        prefixes = tuple(self.config.invalidates.get(endpoint_key(url, api_version), ()))
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if entry.family == family or entry.endpoint.startswith(prefixes)
+        ]
+        for key in stale:
+            self._discard(key)
+        self._generation += 1
+
+    def clear(self) -> None:
+        """Evicts every entry."""
+        self._entries.clear()
+        self._bytes = 0
+        self._generation += 1
+
+    def stats(self) -> dict[str, int]:
+        """Returns hit, miss and revalidation counters and the current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
@@ -0,0 +1,95 @@
+"""
+Retry policy and shared retry budget for the PhantomBuster SDK.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+import httpx
+
+from .__global_exceptions__ import RateLimitError, ServerError, TransportError
+
+if TYPE_CHECKING:
+    from .config import RetryConfig
+
+
+class RetryBudget:
+    """A client-wide allowance of retries.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one,
+    so in steady state retries can add at most ``ratio`` extra load on top
+    of the original requests, however many of them fail. ``min_tokens``
+    are available up front so that a quiet client can still retry.
+    """
+
+    def __init__(self, ratio: float, min_tokens: float, max_tokens: float):
+        self.ratio = ratio
+        self.max_tokens = max(min_tokens, max_tokens)
+        self.tokens = float(min_tokens)
+
+    def deposit(self) -> None:
+        """Records a new request."""
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Takes a token for a retry. Returns False if the budget is spent."""
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+# Methods that can be sent twice without doing the work twice.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Transport failures that happen before the request reaches the server.
+_NOT_SENT = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is retried."""
+
+    def __init__(self, config: RetryConfig):
+        self.config = config
+
+    def is_retryable(self, exc: BaseException, method: str = "GET") -> bool:
+        """Whether ``exc`` is a transient failure worth retrying.
+
+        A timeout or dropped connection after a request was sent may mean
+        the server already acted on it, so for methods that are not
+        idempotent, such as launching an agent, only failures to connect
+        are retried.
+        """
+        if isinstance(exc, RateLimitError):
+            return self.config.retry_rate_limited
+        if isinstance(exc, ServerError):
+            return True
+        if isinstance(exc, TransportError):
+            if method.upper() not in IDEMPOTENT_METHODS:
+                return isinstance(exc.__cause__, _NOT_SENT)
+            return isinstance(exc.__cause__, (httpx.TimeoutException, httpx.ConnectError))
+        return False
+
+    def delay(self, exc: BaseException, attempt: int, method: str = "GET") -> float | None:
+        """Returns the delay before retry number ``attempt + 1``.
+
+        Args:
+            exc: The exception raised by the failed attempt.
+            attempt: The number of retries already made.
+            method: The HTTP method of the request.
+
+        Returns:
+            The delay in seconds, or None if the request must not be retried.
+        """
+        if attempt + 1 >= self.config.max_attempts or not self.is_retryable(exc, method):
+            return None
+        retry_after = getattr(exc, "retry_after", None)
+        if retry_after is not None and self.config.respect_retry_after:
+            if retry_after > self.config.max_retry_after:
+                return None
+            return retry_after
+        # Exponential backoff with full jitter.
+        ceiling = min(self.config.max_delay, self.config.base_delay * 2 ** attempt)
+        return random.uniform(0, ceiling)
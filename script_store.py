@@ -0,0 +1,93 @@
+"""
+Persistent on-disk store for script source code.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS script_code (
+    script_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    code TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (script_id, version)
+)
+"""
+
+
+class ScriptCodeStore:
+    """A SQLite-backed cache of script source keyed by ``(script_id, version)``.
+
+    A script's code never changes without its version changing, so an
+    entry never goes stale; the store only evicts the least recently used
+    code once the total size passes ``max_bytes``.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], max_bytes: int = 256 * 1024 * 1024):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+
+    def get(self, script_id: str, version: int) -> str | None:
+        """Returns the stored code of a script version, or None."""
+        row = self._db.execute(
+            "SELECT code FROM script_code WHERE script_id = ? AND version = ?",
+            (str(script_id), version),
+        ).fetchone()
+        if row is None:
+            return None
+        self._db.execute(
+            "UPDATE script_code SET last_used = ? WHERE script_id = ? AND version = ?",
+            (time.time(), str(script_id), version),
+        )
+        return row[0]
+
+    def put(self, script_id: str, version: int, code: str) -> None:
+        """Stores the code of a script version, evicting old entries if needed."""
+        size = len(code.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._db:
+            self._db.execute("BEGIN")
+            self._db.execute(
+                "INSERT OR REPLACE INTO script_code (script_id, version, code, size, last_used)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (str(script_id), version, code, size, time.time()),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        total = self.size()
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute(
+            "SELECT script_id, version, size FROM script_code ORDER BY last_used"
+        ).fetchall()
+        for script_id, version, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._db.execute(
+                "DELETE FROM script_code WHERE script_id = ? AND version = ?",
+                (script_id, version),
+            )
+            total -= size
+
+    def size(self) -> int:
+        """Returns the total size of the stored code, in bytes."""
+        return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM script_code").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM script_code").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        self._db.close()
@@ -0,0 +1,389 @@
+"""
+Incremental parsing helpers for streamed response bodies.
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import json
+import re
+import sys
+from array import array
+from typing import Any, Iterable
+
+_SPACE = re.compile(r"[ \t\r\n]*")
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")
+_DECODER = json.JSONDecoder()
+_SCAN = _DECODER.scan_once
+_CLOSING = {"[": "]", "{": "}"}
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+_INTEGER = re.compile(r"[+-]?(?:0|[1-9][0-9]*)")
+_FLOAT = re.compile(r"[+-]?(?:(?:0|[1-9][0-9]*)(?:\.[0-9]*)?|\.[0-9]+)(?:[eE][+-]?[0-9]+)?")
+
+# Where the parser is inside the container whose items it returns.
+_FIRST, _ITEM, _SEPARATOR = range(3)
+
+
+class JSONStreamParser:
+    """Splits a JSON document fed in chunks into its top-level items.
+
+    The items of a top-level array are returned one by one, as are the
+    ``(key, value)`` members of a top-level object. With ``key``, the
+    document must be an object, and the items of the array under ``key``
+    are returned instead; its other members are skipped. Only one item is
+    held in memory at a time, so memory use is bounded by the largest item
+    rather than by the document. A top-level scalar is returned by
+    :meth:`close`.
+
+    Each item is decoded with the ``json`` module's C scanner as soon as
+    the bytes after it have arrived; an item cut by the end of a chunk is
+    tried again once the data pending for it has doubled, so large items
+    are not rescanned once per chunk.
+
+    Example:
+        parser = JSONStreamParser()
+        async for chunk in response.aiter_bytes():
+            for item in parser.feed(chunk):
+                handle(item)
+        for item in parser.close():
+            handle(item)
+    """
+
+    def __init__(self, key: str | None = None) -> None:
+        self.key = key
+        self._text = ""
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._container: str | None = None
+        self._state = _FIRST
+        self._inner = False
+        self._retry_at = 0
+        self._scalar = False
+        self._done = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Feeds the next chunk of the document and returns the items it completed.
+
+        Raises:
+            ValueError: If the document is malformed.
+        """
+        return self._parse(self._utf8.decode(chunk), final=False)
+
+    def close(self) -> list[Any]:
+        """Signals the end of the document and returns any remaining item.
+
+        Raises:
+            ValueError: If the document is truncated or malformed.
+        """
+        items = self._parse(self._utf8.decode(b"", final=True), final=True)
+        if self._scalar:
+            return [json.loads(self._text)]
+        if not self._done:
+            if self._container is None and not self._text.strip():
+                return items
+            raise ValueError("The JSON document ended before it was complete.")
+        return items
+
+    def _parse(self, text: str, final: bool) -> list[Any]:
+        text = self._text + text if self._text else text
+        items: list[Any] = []
+        end = len(text)
+        pos = 0
+        while not self._scalar:
+            pos = _SPACE.match(text, pos).end()
+            if pos == end:
+                break
+            char = text[pos]
+            if self._done:
+                raise ValueError("Extra data after the end of the JSON document.")
+            if self._container is None:
+                if char not in _CLOSING:
+                    self._scalar = True
+                    break
+                if self.key is not None and char != "{":
+                    raise ValueError("Expected a JSON object with a key to stream.")
+                self._container = char
+                pos += 1
+                continue
+            closing = _CLOSING[self._container]
+            if self._state == _SEPARATOR:
+                if char == ",":
+                    self._state = _ITEM
+                    pos += 1
+                    continue
+                if char != closing:
+                    raise ValueError(f"Expected ',' or {closing!r} at {char!r}.")
+                pos += 1
+                self._close()
+                continue
+            if char in "]}":
+                if char != closing or self._state == _ITEM:
+                    raise ValueError(f"Unexpected {char!r} in the JSON document.")
+                pos += 1
+                self._close()
+                continue
+            if end - pos < self._retry_at and not final:
+                break
+            if self._container == "[":
+                pos = self._run_of_items(text, pos, items)
+                if pos == end:
+                    break
+            try:
+                item, after = self._item(text, pos, end, final)
+            except _Incomplete:
+                self._retry_at = 2 * (end - pos)
+                break
+            self._retry_at = 0
+            pos = after
+            if item is _ENTERED:
+                self._state = _FIRST
+                continue
+            self._state = _SEPARATOR
+            if item is not _SKIP:
+                items.append(item)
+        self._text = text[pos:]
+        return items
+
+    def _run_of_items(self, text: str, pos: int, items: list[Any]) -> int:
+        # The common case, items each followed by a comma, without the
+        # general path's checks: a comma proves the item is complete.
+        scan = _SCAN
+        append = items.append
+        while True:
+            try:
+                item, after = scan(text, pos)
+            except (StopIteration, json.JSONDecodeError):
+                return pos
+            if text.startswith(",", after):
+                append(item)
+                pos = _SPACE.match(text, after + 1).end()
+                self._state = _ITEM
+            else:
+                return pos
+
+    def _item(self, text: str, pos: int, end: int, final: bool) -> tuple[Any, int]:
+        if self._container == "[":
+            return self._value(text, pos, end, final)
+        key, after = self._value(text, pos, end, final)
+        if not isinstance(key, str):
+            raise ValueError("Object keys must be strings.")
+        after = _SPACE.match(text, after).end()
+        if after == end:
+            raise _Incomplete
+        if text[after] != ":":
+            raise ValueError(f"Expected ':' after the key {key!r}.")
+        after = _SPACE.match(text, after + 1).end()
+        if self.key is not None and not self._inner and key == self.key:
+            if after == end:
+                raise _Incomplete
+            if text[after] != "[":
+                raise ValueError(f"Expected an array under the key {key!r}.")
+            self._container = "["
+            self._inner = True
+            return _ENTERED, after + 1
+        value, after = self._value(text, after, end, final)
+        return (_SKIP if self.key is not None else (key, value)), after
+
+    def _value(self, text: str, pos: int, end: int, final: bool) -> tuple[Any, int]:
+        try:
+            value, after = _DECODER.raw_decode(text, pos)
+        except json.JSONDecodeError as e:
+            if final:
+                raise ValueError(f"Malformed JSON document: {e}") from None
+            raise _Incomplete from None
+        if not final and (
+            after == end
+            or (
+                isinstance(value, (int, float))
+                and _NUMBER_TAIL.match(text, after).end() == end
+            )
+        ):
+            # The value, or a number cut at "1." or "1e", may go on in the next chunk.
+            raise _Incomplete
+        return value, after
+
+    def _close(self) -> None:
+        if self._inner:
+            self._container = "{"
+            self._inner = False
+            self._state = _SEPARATOR
+        else:
+            self._done = True
+
+
+class _Incomplete(Exception):
+    """Raised while parsing an item the data fed so far ends inside."""
+
+
+# Returned for members that are skipped, and for the member holding the
+# array to stream, whose items follow.
+_SKIP = object()
+_ENTERED = object()
+
+
+def coerce_value(value: str) -> int | float | str | None:
+    """Converts a CSV field to an int, float or None where it clearly is one.
+
+    Integers with leading zeros (such as IDs or postcodes) are kept as
+    strings so no information is lost.
+    """
+    if value == "":
+        return None
+    if _INTEGER.fullmatch(value):
+        return int(value)
+    if _FLOAT.fullmatch(value):
+        return float(value)
+    return value
+
+
+class CSVStreamParser:
+    """Splits a CSV document fed in byte chunks into records.
+
+    Records are returned as lists of strings as soon as their last byte
+    arrives, including records whose quoted fields span several lines.
+    """
+
+    def __init__(self, encoding: str = "utf-8-sig"):
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._pending = ""
+        self._record: list[str] = []
+        self._quotes = 0
+
+    def feed(self, chunk: bytes) -> list[list[str]]:
+        """Feeds the next chunk of the document and returns the records it completed."""
+        text = self._pending + self._decoder.decode(chunk)
+        lines = text.split("\n")
+        self._pending = lines.pop()
+        return self._records(lines)
+
+    def close(self) -> list[list[str]]:
+        """Signals the end of the document and returns the remaining records.
+
+        Raises:
+            ValueError: If the document ends inside a quoted field.
+        """
+        tail = self._pending + self._decoder.decode(b"", final=True)
+        self._pending = ""
+        records = self._records([tail] if tail else [])
+        if self._record:
+            raise ValueError("The CSV document ended inside a quoted field.")
+        return records
+
+    def _records(self, lines: Iterable[str]) -> list[list[str]]:
+        records = []
+        for line in lines:
+            self._record.append(line)
+            self._quotes += line.count('"')
+            if self._quotes % 2:
+                continue
+            record = "\n".join(self._record).rstrip("\r")
+            self._record = []
+            self._quotes = 0
+            if record:
+                records.append(next(csv.reader([record])))
+        return records
+
+
+class ColumnBuilder:
+    """Accumulates CSV records column by column.
+
+    Each column starts as an ``array('q')`` of integers, is promoted to an
+    ``array('d')`` of floats when a non-integer number appears, and falls
+    back to a list of strings once a non-numeric value, or an integer
+    outside the int64 range, appears. Empty fields are stored as
+    ``0``/``nan`` in numeric columns and ``None`` in string columns. A
+    column that falls back holds the original field text of every row.
+    """
+
+    def __init__(self, header: list[str]):
+        self.header = [sys.intern(name) for name in header]
+        self._columns: list[Any] = [array("q") for _ in header]
+        # Rows whose field was empty, per numeric column, so they become
+        # None again if the column falls back to strings.
+        self._missing: list[list[int]] = [[] for _ in header]
+        # Field text of the rows whose stored number does not format back
+        # to it, per numeric column, so a fallback to strings is lossless.
+        self._texts: list[dict[int, str]] = [{} for _ in header]
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def append(self, record: list[str]) -> None:
+        """Appends one record, given as raw field strings."""
+        row = self._rows
+        for index, column in enumerate(self._columns):
+            raw = record[index] if index < len(record) else ""
+            value = coerce_value(raw)
+            if type(column) is list:
+                column.append(None if value is None else raw)
+                continue
+            kind = type(value)
+            if value is None:
+                column.append(0 if column.typecode == "q" else float("nan"))
+                self._missing[index].append(row)
+            elif kind is int and not _INT64_MIN <= value <= _INT64_MAX:
+                self._fall_back(index, raw)
+            elif kind is int and column.typecode == "q":
+                column.append(value)
+                if str(value) != raw:
+                    self._texts[index][row] = raw
+            elif kind is not str:
+                if column.typecode == "q":
+                    column = self._promote(index)
+                column.append(float(value))
+                if repr(column[-1]) != raw:
+                    self._texts[index][row] = raw
+            else:
+                self._fall_back(index, raw)
+        self._rows += 1
+
+    def _promote(self, index: int) -> array:
+        """Turns an integer column into a float column."""
+        integers = self._columns[index]
+        texts = self._texts[index]
+        missing = set(self._missing[index])
+        for row, value in enumerate(integers):
+            if row not in missing:
+                texts.setdefault(row, str(value))
+        column = self._columns[index] = array("d", integers)
+        for row in missing:
+            column[row] = float("nan")
+        return column
+
+    def _fall_back(self, index: int, raw: str) -> None:
+        """Turns a numeric column into a list of the original field strings."""
+        column = self._columns[index]
+        texts = self._texts[index]
+        format_number = str if column.typecode == "q" else repr
+        strings: list[str | None] = [
+            texts.get(row) or format_number(item) for row, item in enumerate(column)
+        ]
+        for row in self._missing[index]:
+            strings[row] = None
+        strings.append(raw)
+        self._columns[index] = strings
+        self._missing[index] = []
+        self._texts[index] = {}
+
+    def columns(self, use_numpy: bool = False) -> dict[str, Any]:
+        """Returns the columns keyed by header name.
+
+        Args:
+            use_numpy: Return numeric columns as NumPy arrays sharing the
+                array buffers. Requires the optional ``numpy`` package.
+        """
+        if not use_numpy:
+            return dict(zip(self.header, self._columns))
+        try:
+            import numpy
+        except ImportError as e:
+            raise ImportError("use_numpy=True requires the 'numpy' package.") from e
+        dtypes = {"q": numpy.int64, "d": numpy.float64}
+        return {
+            name: column
+            if type(column) is list
+            else numpy.frombuffer(column, dtype=dtypes[column.typecode])
+            for name, column in zip(self.header, self._columns)
+        }
@@ -0,0 +1,187 @@
+"""
+Multiplexed waiting for containers to finish.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Iterable
+
+from .__global_exceptions__ import AuthenticationError, NotFoundError, PhantomBusterAPIError
+
+if TYPE_CHECKING:
+    from .client import PhantombusterClient
+    from .__global_models__ import Container
+
+logger = logging.getLogger(__name__)
+
+# Container statuses of runs that have not finished yet.
+ACTIVE_STATUSES = frozenset({"queued", "starting", "running"})
+
+
+def is_finished(container: Container) -> bool:
+    """Whether a container's status is that of a finished run."""
+    return container.status is not None and container.status not in ACTIVE_STATUSES
+
+
+class ContainerWatcher:
+    """Waits for many containers at once, with one poll per tick for all of them.
+
+    Each tick fetches the organization's running containers once; only the
+    watched containers missing from that list are fetched individually, to
+    get their final status. Ticks start ``min_interval`` apart and, while
+    no watched container finishes, back off by doubling up to
+    ``max_interval``. Watching a new container brings the next tick back
+    to at most ``min_interval`` away. The poller runs in a background task
+    only while something is being watched.
+
+    Example:
+        async with ContainerWatcher(client) as watcher:
+            async for container in watcher.completions(container_ids):
+                print(container.id, container.status)
+    """
+
+    def __init__(
+        self,
+        client: PhantombusterClient,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ):
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Poll intervals must satisfy 0 < min_interval <= max_interval.")
+        self._client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.ticks = 0
+        self._futures: dict[int, asyncio.Future[Container]] = {}
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def watching(self) -> int:
+        """The number of containers being waited for."""
+        return len(self._futures)
+
+    def watch(self, container_id: int | str) -> asyncio.Future[Container]:
+        """Starts watching a container.
+
+        Watching a container already watched returns the same future, so
+        callers sharing it should await it through ``asyncio.shield``, or
+        use :meth:`wait`, rather than cancel it.
+
+        Returns:
+            A future resolved with the finished Container, or failed with
+            NotFoundError if the container does not exist, and with any
+            error that is not an API error, such as a malformed response.
+        """
+        container_id = int(container_id)
+        future = self._futures.get(container_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            future.add_done_callback(lambda done: self._forget(container_id, done))
+            self._futures[container_id] = future
+            self._wake.set()
+            if self._task is None or self._task.done():
+                # A fresh context, so the caller's deadline does not bound the poller.
+                self._task = contextvars.Context().run(asyncio.create_task, self._run())
+        return future
+
+    async def wait(self, container_id: int | str) -> Container:
+        """Waits for one container to finish.
+
+        Returns:
+            The finished Container.
+        """
+        return await asyncio.shield(self.watch(container_id))
+
+    async def completions(self, container_ids: Iterable[int | str]) -> AsyncIterator[Container]:
+        """Yields containers as they finish, in the order they finish."""
+        futures = [self.watch(container_id) for container_id in container_ids]
+        for next_done in asyncio.as_completed([asyncio.shield(f) for f in futures]):
+            yield await next_done
+
+    async def close(self) -> None:
+        """Stops polling and cancels every pending future."""
+        for future in list(self._futures.values()):
+            future.cancel()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def __aenter__(self) -> ContainerWatcher:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def _forget(self, container_id: int, future: asyncio.Future[Container]) -> None:
+        if self._futures.get(container_id) is future:
+            del self._futures[container_id]
+            if not self._futures:
+                self._wake.set()
+
+    async def _run(self) -> None:
+        interval = self.min_interval
+        while self._futures:
+            try:
+                finished = await self._tick()
+            except PhantomBusterAPIError as e:
+                if isinstance(e, AuthenticationError):
+                    self._fail_all(e)
+                    return
+                logger.warning("Polling running containers failed: %s", e)
+                finished = 0
+            except Exception as e:
+                # Not an API error, so not one polling again would get past.
+                self._fail_all(e)
+                return
+            interval = self.min_interval if finished else min(interval * 2, self.max_interval)
+            next_tick = time.monotonic() + interval
+            while self._futures:
+                self._wake.clear()
+                timeout = next_tick - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                next_tick = min(next_tick, time.monotonic() + self.min_interval)
+                interval = self.min_interval
+
+    def _fail_all(self, error: Exception) -> None:
+        for future in list(self._futures.values()):
+            if not future.done():
+                future.set_exception(error)
+
+    async def _tick(self) -> int:
+        self.ticks += 1
+        watched = list(self._futures)
+        running = {c.id for c in await self._client.orgs.fetch_running_containers()}
+        candidates = [container_id for container_id in watched if container_id not in running]
+        results = await asyncio.gather(
+            *(self._client.containers.fetch(str(container_id)) for container_id in candidates),
+            return_exceptions=True,
+        )
+        finished = 0
+        for container_id, result in zip(candidates, results):
+            future = self._futures.get(container_id)
+            if future is None or future.done():
+                continue
+            if isinstance(result, (NotFoundError, AuthenticationError)) or (
+                isinstance(result, Exception) and not isinstance(result, PhantomBusterAPIError)
+            ):
+                future.set_exception(result)
+            elif isinstance(result, BaseException):
+                logger.warning("Fetching container %s failed: %s", container_id, result)
+            elif is_finished(result):
+                future.set_result(result)
+                finished += 1
+        return finished